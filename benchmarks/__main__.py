@@ -0,0 +1,91 @@
+"""
+Frame-time benchmarks, run headless with a fixed seed.
+
+    python -m benchmarks list
+    python -m benchmarks run [--only bugs_500,boss_2] [--frames 600] [--out benchmarks/results.json]
+    python -m benchmarks run --save-baseline     # store a baseline (benchmarks/baseline.json)
+    python -m benchmarks compare [results.json] [--baseline benchmarks/baseline.json]
+
+Frame times depend on the machine, so no baseline is checked in. Record one
+on yours with `run --save-baseline` before the change you want to measure,
+then `run` and `compare` after it.
+
+`run` exits with status 1 if any scenario read an asset from disk during its
+measured frames: everything a level uses should be decoded before it starts.
+"""
+import os
+
+# The game modules open the mixer on import, so pick the dummy drivers first
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import sys
+
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS
+
+RESULTS_PATH = "benchmarks/results.json"
+BASELINE_PATH = "benchmarks/baseline.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="CodeSpire frame-time benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the scenarios")
+
+    run_cmd = commands.add_parser("run", help="run scenarios and write JSON results")
+    run_cmd.add_argument("--only", help="comma-separated scenario names")
+    run_cmd.add_argument("--frames", type=int, default=runner.FRAMES)
+    run_cmd.add_argument("--warmup", type=int, default=runner.WARMUP)
+    run_cmd.add_argument("--alloc-frames", type=int, default=runner.ALLOC_FRAMES)
+    run_cmd.add_argument("--seed", type=int, default=runner.SEED)
+    run_cmd.add_argument("--out", default=RESULTS_PATH)
+    run_cmd.add_argument("--save-baseline", action="store_true",
+                         help=f"write the results to {BASELINE_PATH} instead (same as --out {BASELINE_PATH})")
+
+    compare_cmd = commands.add_parser("compare", help="compare results against a baseline")
+    compare_cmd.add_argument("results", nargs="?", default=RESULTS_PATH)
+    compare_cmd.add_argument("--baseline", default=BASELINE_PATH)
+    compare_cmd.add_argument("--threshold", type=float, default=runner.THRESHOLD,
+                             help="p95 slowdown in %% that counts as a regression")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, build in SCENARIOS.items():
+            print(name)
+        return 0
+
+    if args.command == "run":
+        names = args.only.split(",") if args.only else None
+        unknown = [name for name in names or () if name not in SCENARIOS]
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+        results = runner.run(names, args.frames, args.warmup, args.alloc_frames, args.seed)
+        out = BASELINE_PATH if args.save_baseline else args.out
+        runner.save(results, out)
+        print(f"{'baseline' if args.save_baseline else 'results'} written to {out}")
+        loading = runner.disk_loads(results)
+        if loading:
+            print(f"asset cache misses during gameplay frames: {', '.join(loading)}")
+            return 1
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}: record one first with `python -m benchmarks run --save-baseline`")
+        return 2
+    if not os.path.exists(args.results):
+        print(f"no results at {args.results}: run `python -m benchmarks run` first")
+        return 2
+    regressions = runner.compare(runner.load(args.results), runner.load(args.baseline), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:g}%: {', '.join(regressions)}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from benchmarks.scenarios import SCENARIOS, WIDTH, HEIGHT
+from entities.effects import load_explosion_frames
+from levels.world import init_headless
+from utils import assets, text
+from utils.sounds import preload as preload_sounds
+from utils.timers import timers
+
+# --- Defaults ---
+FRAMES = 600          # measured frames per scenario
+WARMUP = 120          # unmeasured frames first (entrances, fade-ins, caches)
+ALLOC_FRAMES = 120    # frames re-run under tracemalloc (slow, so fewer)
+SEED = 1234
+THRESHOLD = 10.0      # % slowdown of p95 that `compare` reports as a regression
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "alloc_kb")
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name, screen, frames=FRAMES, warmup=WARMUP, alloc_frames=ALLOC_FRAMES, seed=SEED):
+    """Time one scenario frame by frame (step + draw), then count its allocations."""
+    build = SCENARIOS[name]
+
+    # --- Timing pass ---
+    random.seed(seed)
+    step, draw = build()
+    for tick in range(warmup):
+        step(tick)
+        draw(screen)
+    assets.reset_stats()  # from here on, any cache miss is a disk read in the middle of gameplay
+    text_misses = text.get_stats()["misses"]
+    timers_fired = timers.fired
+    times = []
+    for tick in range(warmup, warmup + frames):
+        start = time.perf_counter()
+        step(tick)
+        draw(screen)
+        times.append((time.perf_counter() - start) * 1000)
+    disk_loads = assets.get_stats()["misses"]
+    text_renders = text.get_stats()["misses"] - text_misses
+    timers_fired = timers.fired - timers_fired
+
+    # --- Allocation pass (same seed and script, traced) ---
+    random.seed(seed)
+    step, draw = build()
+    for tick in range(warmup):
+        step(tick)
+        draw(screen)
+    tracemalloc.start()
+    allocated = 0
+    blocks_before = sys.getallocatedblocks()
+    for tick in range(warmup, warmup + alloc_frames):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        step(tick)
+        draw(screen)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    tracemalloc.stop()
+    net_blocks = sys.getallocatedblocks() - blocks_before
+
+    times.sort()
+    return {
+        "frames": frames,
+        "mean_ms": round(sum(times) / len(times), 4),
+        "p50_ms": round(percentile(times, 50), 4),
+        "p95_ms": round(percentile(times, 95), 4),
+        "p99_ms": round(percentile(times, 99), 4),
+        "max_ms": round(times[-1], 4),
+        # Peak memory a frame allocates on top of what was already live
+        "alloc_kb": round(allocated / alloc_frames / 1024, 2),
+        # Blocks still alive after the traced frames, per frame (a leak shows up here)
+        "net_blocks_per_frame": round(net_blocks / alloc_frames, 2),
+        # Assets read from disk during the measured frames (should always be 0)
+        "disk_loads": disk_loads,
+        "text_renders_per_frame": round(text_renders / frames, 2),
+        "timers_fired_per_frame": round(timers_fired / frames, 2),
+    }
+
+
+def run(names=None, frames=FRAMES, warmup=WARMUP, alloc_frames=ALLOC_FRAMES, seed=SEED, log=print):
+    """Run the scenarios headless and return the results as a JSON-ready dict."""
+    init_headless()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    load_explosion_frames()  # same startup decoding as main.py
+    preload_sounds()
+    results = {
+        "meta": {
+            "seed": seed,
+            "frames": frames,
+            "warmup": warmup,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__ if np is not None else None,
+            "platform": platform.platform(),
+        },
+        "scenarios": {},
+    }
+    for name in names or SCENARIOS:
+        with contextlib.redirect_stdout(io.StringIO()):  # the game's own prints
+            stats = run_scenario(name, screen, frames, warmup, alloc_frames, seed)
+        results["scenarios"][name] = stats
+        log(f"{name:<16} p50 {stats['p50_ms']:7.3f} ms  p95 {stats['p95_ms']:7.3f} ms  "
+            f"p99 {stats['p99_ms']:7.3f} ms  alloc {stats['alloc_kb']:8.1f} KB/frame"
+            + (f"  DISK LOADS {stats['disk_loads']}" if stats["disk_loads"] else ""))
+    return results
+
+
+def disk_loads(results):
+    """Names of the scenarios that read assets from disk while being measured."""
+    return [name for name, stats in results["scenarios"].items() if stats.get("disk_loads")]
+
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=THRESHOLD, log=print):
+    """
+    Print each scenario's change against the baseline.
+    Returns the names whose p95 frame time got more than `threshold` % slower.
+    """
+    regressions = []
+    log(f"{'scenario':<16}" + "".join(f"{metric:>20}" for metric in METRICS))
+    for name, stats in results["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            log(f"{name:<16}  (not in baseline)")
+            continue
+        cells = []
+        for metric in METRICS:
+            old, new = base[metric], stats[metric]
+            change = (new - old) / old * 100 if old else 0.0
+            cells.append(f"{new:9.3f} ({change:+6.1f}%)")
+        slower = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0.0
+        flag = "  <-- REGRESSION" if slower > threshold else ""
+        if flag:
+            regressions.append(name)
+        log(f"{name:<16}" + "".join(f"{cell:>20}" for cell in cells) + flag)
+    return regressions
@@ -0,0 +1,153 @@
+import random
+from entities.bugs_level_2 import Bug_Level_2
+from entities.particle import ParticleSystem, PARTICLE_PRESETS
+from levels.level_1_boss import Level1Boss
+from levels.level_2_boss import Level2Boss
+from levels.level_3_boss import Level3Boss
+from levels.world import Level1World, Level2World, Level3World, AutopilotKeys
+from utils.stars import Starfield
+from utils.timers import timers
+from utils.timestep import timestep
+
+WIDTH, HEIGHT = 800, 600
+
+
+class NoKeys:
+    """Key state with nothing pressed (the player stands still and never fires)."""
+    def __getitem__(self, key):
+        return False
+
+
+# --- Scenario builders ---
+# Each builder sets up one scripted situation and returns (step, draw):
+# step(tick) advances it by one fixed tick, draw(screen) renders the frame.
+# Questions are answered right away so the world never freezes mid-run.
+
+def bugs(count):
+    """A Level 2 wave kept at `count` bugs, with the autopilot player firing through it."""
+    def build():
+        world = Level2World(WIDTH, HEIGHT)
+        world.enemies[:] = [Bug_Level_2(random.randint(50, WIDTH - 50), random.randint(-300, HEIGHT - 150))
+                            for _ in range(count)]
+        keys = AutopilotKeys()
+
+        def step(tick):
+            keys.tick = tick
+            world.step(keys)
+            if world.question is not None:
+                world.answer(True)
+            while len(world.enemies) < count:
+                world.enemies.append(Bug_Level_2(random.randint(50, WIDTH - 50), random.randint(-150, -50)))
+            world.bugs_destroyed = 0  # never bring in the boss
+        return step, world.draw
+    return build
+
+
+def boss(level, cooldown=None):
+    """
+    A boss locked in its heaviest attack pattern; the idle player soaks every hit.
+    `cooldown` (ms) overrides the boss's shot cooldown, e.g. 0 to fire every tick.
+    """
+    def build():
+        world = {1: Level1World, 2: Level2World, 3: Level3World}[level](WIDTH, HEIGHT)
+        world.clear_wave()
+        world.boss = {1: Level1Boss, 2: Level2Boss, 3: Level3Boss}[level](WIDTH, HEIGHT)
+        if hasattr(world.boss, "target_y"):
+            world.boss.rect.y = world.boss.target_y  # skip the entrance
+        if isinstance(world.boss, Level2Boss):
+            timers.cancel(world.boss.minion_timer)  # first wave right away
+            world.boss.minion_timer = timers.schedule(0, world.boss.minion_wave)
+        keys = NoKeys()
+
+        def step(tick):
+            pin_boss_pattern(world.boss)
+            if cooldown is not None:
+                world.boss.shoot_cooldown = cooldown
+            world.step(keys)
+            if world.question is not None:
+                world.answer(True)
+            world.player.health = world.player.max_health
+        return step, world.draw
+    return build
+
+
+def pin_boss_pattern(boss):
+    """Hold a boss at its fastest, widest pattern (and undo question pauses)."""
+    if isinstance(boss, Level1Boss):
+        boss.health = boss.max_health // 2        # double shot
+        boss.shoot_cooldown = 800                 # the in-game floor
+        boss.paused_until = 0
+    elif isinstance(boss, Level2Boss):
+        boss.health = boss.max_health // 3        # spiral spread
+        boss.shoot_cooldown = 600
+        boss.paused_until = 0
+        boss.minion_spawn_cooldown = 6000
+    elif isinstance(boss, Level3Boss) and not boss.laser_active:
+        boss.laser_delay = 0                      # lasers back to back
+
+
+def explosion_storm(per_tick):
+    """`per_tick` explosions (with debris) spawned every tick over a scrolling background."""
+    def build():
+        world = Level1World(WIDTH, HEIGHT)
+        world.enemies.clear()
+        keys = NoKeys()
+
+        def step(tick):
+            world.step(keys)
+            for _ in range(per_tick):
+                world.explosions.spawn(random.randint(0, WIDTH), random.randint(0, HEIGHT))
+        return step, world.draw
+    return build
+
+
+def starfield(count):
+    """A bare starfield of `count` stars (layered above utils.stars.LAYER_THRESHOLD)."""
+    def build():
+        stars = Starfield(count, WIDTH, HEIGHT)
+
+        def step(tick):
+            timestep.step()
+            stars.update()
+
+        def draw(screen):
+            screen.fill((0, 0, 0))
+            return stars.draw(screen)
+        return step, draw
+    return build
+
+
+def particles(count):
+    """`count` live particles, topped up every tick with bursts of every preset."""
+    def build():
+        system = ParticleSystem(count, WIDTH, HEIGHT)
+        presets = list(PARTICLE_PRESETS)
+
+        def step(tick):
+            system.update()
+            while len(system) < count:
+                if not system.burst(random.choice(presets), random.randint(0, WIDTH), random.randint(0, HEIGHT)):
+                    break  # NumPy missing or the quality cap reached
+
+        def draw(screen):
+            screen.fill((0, 0, 0))
+            return system.draw(screen)
+        return step, draw
+    return build
+
+
+SCENARIOS = {
+    "bugs_6": bugs(6),
+    "bugs_50": bugs(50),
+    "bugs_500": bugs(500),
+    "boss_1": boss(1),
+    "boss_2": boss(2),
+    "boss_3": boss(3),
+    "bullet_hell": boss(2, cooldown=0),  # fills the projectile store
+    "explosion_storm": explosion_storm(4),
+    "particles_10k": particles(10000),  # the ParticleSystem's full capacity; budget is one 16 ms frame
+    "stars_100": starfield(100),
+    "stars_1000": starfield(1000),
+    "stars_5000": starfield(5000),
+    "stars_20000": starfield(20000),
+}
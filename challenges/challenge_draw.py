@@ -1,70 +1,111 @@
 import pygame
 import textwrap
+from utils.text import get_font, render_text
 
-def ask_question(screen, question_func):
+
+class QuestionModal:
     """
-    Ask a question on screen, return True if correct, False if wrong/quit.
+    Question prompt run as a modal state of the level loop (no nested event loop).
+    open() shows a question; the level loop feeds it events and draws it while
+    `active`, and on_answer(correct, *args) is called once the player hits Enter.
     Works with flexible answers (list of acceptable answers).
     """
-    question_data = question_func()  # get dict from question file
-    question = question_data["question"]
-    correct_answers = question_data.get("answers", [question_data.get("answer", "")])
+    def __init__(self):
+        self.font = get_font(None, 36)
+        self.input_font = get_font(None, 32)
+        self.active = False
+        self.backdrop = None
+        self.input_rect = None
+
+        # --- Box layout ---
+        self.box_width, self.box_height = 700, 400
+        self.box_rect = None
+
+    def open(self, question_func, on_answer, *args):
+        question_data = question_func()  # get dict from question file
+        self.question = question_data["question"]
+        self.correct_answers = question_data.get("answers", [question_data.get("answer", "")])
+        self.wrapped_lines = textwrap.wrap(self.question, width=50)
+
+        self.on_answer = on_answer
+        self.answer_args = args
+        self.user_text = ''
+        self.input_surface = render_text(self.input_font, self.user_text, (255, 255, 0))
+        self.backdrop = None  # captured from the finished frame on the first draw
+        self.active = True
 
-    font = pygame.font.Font(None, 36)
-    input_font = pygame.font.Font(None, 32)
-    user_text = ''
-    input_active = True
-    clock = pygame.time.Clock()
+    def check_answer(self):
+        user_input = self.user_text.strip().lower()
+        # --- Ignore empty input ---
+        if not user_input:
+            return False
+        # --- Check flexible answers ---
+        return any(user_input in ans.lower() for ans in self.correct_answers)
 
-    # --- Box layout ---
-    box_width, box_height = 700, 400
-    box_x = (screen.get_width() - box_width) // 2
-    box_y = (screen.get_height() - box_height) // 2
-    box_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+    def close(self, correct):
+        self.active = False
+        self.backdrop = None
+        on_answer, args = self.on_answer, self.answer_args
+        self.on_answer, self.answer_args = None, ()
+        on_answer(correct, *args)
 
-    # --- Text wrapping for question ---
-    wrapped_lines = textwrap.wrap(question, width=50)
+    def handle_event(self, event):
+        """Feed one event to the modal. Returns True if it was consumed."""
+        if not self.active:
+            return False
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                self.close(self.check_answer())
+                return True
+            elif event.key == pygame.K_BACKSPACE:
+                self.user_text = self.user_text[:-1]
+            elif event.unicode and event.unicode.isprintable():
+                self.user_text += event.unicode
+            else:
+                return True
+            # Only the input line is re-rendered on a keystroke
+            self.input_surface = render_text(self.input_font, self.user_text, (255, 255, 0))
+        return True
 
-    while input_active:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    input_active = False
-                    user_input = user_text.strip().lower()
-                    # --- Ignore empty input ---
-                    if not user_input:
-                        return False
-                    # --- Check flexible answers ---
-                    is_correct = any(user_input in ans.lower() for ans in correct_answers)
-                    return is_correct
-                elif event.key == pygame.K_BACKSPACE:
-                    user_text = user_text[:-1]
-                else:
-                    user_text += event.unicode
+    def render_backdrop(self, screen):
+        """Dimmed snapshot of the game with the question box and text baked in."""
+        backdrop = screen.copy()
 
         # --- Dim background ---
         overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        backdrop.blit(overlay, (0, 0))
 
         # --- Draw question box ---
-        pygame.draw.rect(screen, (50, 50, 120), box_rect, border_radius=16)
-        pygame.draw.rect(screen, (255, 255, 255), box_rect, 3, border_radius=16)
+        box_x = (screen.get_width() - self.box_width) // 2
+        box_y = (screen.get_height() - self.box_height) // 2
+        self.box_rect = pygame.Rect(box_x, box_y, self.box_width, self.box_height)
+        pygame.draw.rect(backdrop, (50, 50, 120), self.box_rect, border_radius=16)
+        pygame.draw.rect(backdrop, (255, 255, 255), self.box_rect, 3, border_radius=16)
 
         # --- Draw question text ---
         y_offset = box_y + 40
-        for line in wrapped_lines:
-            q_surf = font.render(line, True, (255, 255, 255))
-            screen.blit(q_surf, (box_x + 25, y_offset))
+        for line in self.wrapped_lines:
+            q_surf = render_text(self.font, line, (255, 255, 255))
+            backdrop.blit(q_surf, (box_x + 25, y_offset))
             y_offset += 40
 
-        # --- Draw input text ---
-        prompt = input_font.render("Type your answer:", True, (255, 255, 255))
-        a_surf = input_font.render(user_text, True, (255, 255, 0))
-        screen.blit(prompt, (box_x + 25, box_y + box_height - 90))
-        screen.blit(a_surf, (box_x + 25, box_y + box_height - 50))
+        prompt = render_text(self.input_font, "Type your answer:", (255, 255, 255))
+        backdrop.blit(prompt, (box_x + 25, box_y + self.box_height - 90))
+        return backdrop
+
+    def draw(self, screen):
+        """Draw the modal and return the screen areas it touched."""
+        if not self.active:
+            return None
+        if self.backdrop is None:
+            self.backdrop = self.render_backdrop(screen)
+            drawn = [screen.blit(self.backdrop, (0, 0))]
+        else:
+            # The backdrop is already on screen: only the input line changes
+            drawn = [screen.blit(self.backdrop, self.input_rect, self.input_rect)]
 
-        pygame.display.flip()
-        clock.tick(30)
+        # --- Draw input text ---
+        self.input_rect = screen.blit(self.input_surface, (self.box_rect.x + 25, self.box_rect.bottom - 50))
+        drawn.append(self.input_rect)
+        return drawn
@@ -1,6 +1,10 @@
 import random
 from challenges.challenge_data import questions
 
+# Questions draw from their own generator: only the on-screen modal asks for
+# one, so a shared `random` would make gameplay depend on whether it is shown.
+question_rng = random.Random()
+
 # Keep track of used questions
 used_questions = []
 
@@ -17,7 +21,7 @@ def get_question():
         available = questions.copy()
 
     # Pick one random unused question
-    question = random.choice(available)
+    question = question_rng.choice(available)
     used_questions.append(question)
 
     return question
@@ -1,4 +1,4 @@
-import random
+from challenges.challenge_handler import question_rng
 
 # List of JavaScript and Java questions and answers
 questions_level2 = [
@@ -46,7 +46,7 @@ def get_question_level2():
         available = questions_level2.copy()
 
     # Pick one random unused question
-    question = random.choice(available)
+    question = question_rng.choice(available)
     used_questions_level2.append(question)
 
     return question
@@ -1,4 +1,4 @@
-import random
+from challenges.challenge_handler import question_rng
 from challenges.question_data import level3_questions
 
 # Track used Level 3 questions
@@ -17,7 +17,7 @@ def get_question_level3():
         available = level3_questions.copy()
 
     # Pick a random unused question
-    question = random.choice(available)
+    question = question_rng.choice(available)
     used_questions_level3.append(question)
 
     return question
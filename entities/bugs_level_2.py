@@ -1,84 +1,9 @@
-import pygame
-import random
+from entities.enemy import Enemy, ENEMY_ARCHETYPES
 
-class Bug_Level_2:
-    def __init__(self, x, y, can_shoot=True):
-        # Randomly pick between 3 ships for level 2 variety
-        ship_image = random.choice([
-            "assets/images/Ship1.png",
-            "assets/images/Ship2.png",
-            "assets/images/Ship3.png"
-        ])
+SHIP_IMAGES = ENEMY_ARCHETYPES["level_2_bug"]["ships"]
 
-        # Load and transform the bug spaceship image
-        self.image = pygame.image.load(ship_image).convert_alpha()
-        self.image = pygame.transform.rotate(self.image, 90)  # face downward
-        self.image = pygame.transform.scale(self.image, (90, 90))
-        self.rect = self.image.get_rect(center=(x, y))
 
-        # Movement
-        self.speed_y = random.uniform(1.5, 2.5)
-        self.speed_x = random.choice([-1, 1]) * random.uniform(0.7, 1.2)
-        self.direction_timer = pygame.time.get_ticks()
-        self.direction_change_delay = random.randint(1000, 2000)
-
-        # Shooting setup
-        self.can_shoot = can_shoot
-        self.bullets = []
-        self.bullet_image = pygame.image.load("assets/images/enemyBullet.png").convert_alpha()
-        self.bullet_image = pygame.transform.scale(self.bullet_image, (28, 28))
-        self.shoot_cooldown = random.randint(2000, 4000)  # increased cooldown
-        self.last_shot_time = pygame.time.get_ticks()
-
-        # Load SFX (optional)
-        try:
-            self.shoot_sfx = pygame.mixer.Sound("assets/sounds/player_shoot_1.mp3")
-            self.shoot_sfx.set_volume(0.2)
-        except Exception:
-            self.shoot_sfx = None
-
-    def update(self):
-        # Zigzag or drifting horizontal movement
-        now = pygame.time.get_ticks()
-        if now - self.direction_timer > self.direction_change_delay:
-            self.speed_x *= -1  # reverse horizontal direction
-            self.direction_timer = now
-            self.direction_change_delay = random.randint(500, 1000)
-
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-
-        # Wrap or reset if off-screen
-        if self.rect.top > 620:
-            self.rect.y = random.randint(-200, -50)
-            self.rect.x = random.randint(50, 750)
-
-        if self.rect.left < 0 or self.rect.right > 800:
-            self.speed_x *= -1
-
-        # Shooting behavior
-        if self.can_shoot:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_shot_time > self.shoot_cooldown:
-                self.shoot()
-                self.last_shot_time = current_time
-                self.shoot_cooldown = random.randint(2000, 4000)  # maintain increased cooldown
-
-        # Update bullets (move downward)
-        for bullet in self.bullets[:]:
-            bullet.y += 6
-            if bullet.y > 600:
-                self.bullets.remove(bullet)
-
-    def shoot(self):
-        # Create only a single bullet straight down
-        bullet_rect = self.bullet_image.get_rect(center=(self.rect.centerx, self.rect.bottom))
-        self.bullets.append(bullet_rect)
-
-        if self.shoot_sfx:
-            self.shoot_sfx.play()
-
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
-        for bullet in self.bullets:
-            screen.blit(self.bullet_image, bullet)
+class Bug_Level_2(Enemy):
+    """Level 2 enemy (also the Level 2 boss's minions): zigzags and shoots."""
+    __slots__ = ()
+    KIND = "level_2_bug"
@@ -0,0 +1,113 @@
+import pygame
+from collections import deque
+from utils.assets import load_image, frame_paths
+from utils.quality import governor
+from utils.timestep import sim_ticks
+
+EXPLOSION_FRAMES = []
+
+
+def load_explosion_frames():
+    """Decode the explosion animation once; every Explosion shares these frames."""
+    if not EXPLOSION_FRAMES:
+        EXPLOSION_FRAMES.extend(
+            load_image(f"assets/images/Explosions/Explosion3_{i}.png", (100, 100))
+            for i in range(1, 12)
+        )
+    return EXPLOSION_FRAMES
+
+
+class Explosion:
+    """Explosion animation."""
+    def __init__(self, x, y):
+        self.frames = load_explosion_frames()
+        self.animation_speed = 50
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Restart the animation at (x, y) so pooled instances can be reused."""
+        self.index = 0
+        self.image = self.frames[self.index]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.last_update = sim_ticks()
+        self.finished = False
+
+    def update(self):
+        now = sim_ticks()
+        if now - self.last_update > self.animation_speed:
+            self.last_update = now
+            self.index += governor.explosion_step  # the quality governor skips frames under load
+            if self.index >= len(self.frames):
+                self.finished = True
+            else:
+                self.image = self.frames[self.index]
+
+    def draw(self, screen):
+        if not self.finished:
+            return screen.blit(self.image, self.rect)
+
+
+class ExplosionPool:
+    """Fixed-size set of reusable Explosions. spawn() never allocates."""
+    def __init__(self, size=32, particles=None):
+        self.free = [Explosion(0, 0) for _ in range(size)]
+        self.active = deque()
+        self.particles = particles  # optional ParticleSystem for debris
+
+    def spawn(self, x, y):
+        if self.particles is not None:
+            self.particles.burst("explosion_debris", x, y)
+        # Out of free explosions: recycle the oldest one still playing
+        exp = self.free.pop() if self.free else self.active.popleft()
+        exp.reset(x, y)
+        self.active.append(exp)
+        return exp
+
+    def update(self):
+        finished = False
+        for exp in self.active:
+            exp.update()
+            finished = finished or exp.finished
+        if finished:
+            still_playing = deque()
+            for exp in self.active:
+                (self.free if exp.finished else still_playing).append(exp)
+            self.active = still_playing
+
+    def draw(self, screen):
+        return [exp.draw(screen) for exp in self.active]
+
+    def __len__(self):
+        return len(self.active)
+
+
+class Portal:
+    """Animated portal that appears after boss death."""
+    def __init__(self, x, y):
+        self.frames = []
+        for path in frame_paths("assets/images/portal_2"):
+            try:
+                self.frames.append(load_image(path, (200, 200)))
+            except Exception:
+                pass
+
+        if not self.frames:
+            surf = pygame.Surface((200, 200), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (100, 0, 200, 200), (100, 100), 90)
+            self.frames = [surf]
+
+        self.index = 0
+        self.image = self.frames[self.index]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.last_update = sim_ticks()
+        self.animation_speed = 80
+
+    def update(self):
+        now = sim_ticks()
+        if now - self.last_update > self.animation_speed:
+            self.last_update = now
+            self.index = (self.index + 1) % len(self.frames)
+            self.image = self.frames[self.index]
+
+    def draw(self, screen):
+        return screen.blit(self.image, self.rect)
@@ -0,0 +1,235 @@
+import pygame
+import random
+import weakref
+from utils.assets import load_image
+from utils.sounds import play
+from entities.projectiles import projectiles, ENEMY
+from utils.timers import timers
+
+# --- Enemy archetypes ---
+# name -> everything that makes one kind of enemy different from another.
+# Ranges are (low, high) for random.uniform / random.randint; "zigzag" is
+# (first delay, later delay range) in ms or None for straight-down enemies;
+# "max_bullets" caps how many of its bullets one enemy may have alive.
+ENEMY_ARCHETYPES = {
+    "level_1_bug": {
+        "ships": ["assets/images/Ship4.png", "assets/images/Ship5.png"],
+        "size": (100, 100), "angle": 90,
+        "speed_y": 2, "speed_x": None, "zigzag": None, "bounce": False,
+        "wrap_below": 600, "respawn_y": (-50, -50),
+        "can_shoot": False, "cooldown": (1000, 3000), "max_bullets": None,
+        "bullet": ("assets/images/enemyBullet.png", (30, 30)), "bullet_speed": 5,
+        "shoot_sfx": "bug_shoot",
+    },
+    "level_2_bug": {
+        "ships": ["assets/images/Ship1.png", "assets/images/Ship2.png", "assets/images/Ship3.png"],
+        "size": (90, 90), "angle": 90,
+        "speed_y": (1.5, 2.5), "speed_x": (0.7, 1.2), "zigzag": ((1000, 2000), (500, 1000)), "bounce": True,
+        "wrap_below": 620, "respawn_y": (-200, -50),
+        "can_shoot": True, "cooldown": (2000, 4000), "max_bullets": None,
+        "bullet": ("assets/images/enemyBullet.png", (28, 28)), "bullet_speed": 6,
+        "shoot_sfx": "bug_shoot",
+    },
+    "level_3_bug": {
+        "ships": ["assets/images/Ship_6.png", "assets/images/Ship_7.png", "assets/images/Ship_8.png"],
+        "size": (90, 90), "angle": 180,
+        "speed_y": (1.5, 2.5), "speed_x": (0.7, 1.2), "zigzag": ((1000, 2000), (500, 500)), "bounce": True,
+        "wrap_below": 620, "respawn_y": (-200, -50),
+        "can_shoot": True, "cooldown": (2000, 3500), "max_bullets": 1,
+        "bullet": ("assets/images/enemyBullet.png", (28, 28)), "bullet_speed": 6,
+        "shoot_sfx": "bug_shoot",
+    },
+}
+
+# name -> (ship sprites, bullet sprite id), resolved once the display exists
+_sprites = {}
+
+# --- Pass audit (debug) ---
+# Every enemy, boss minions included, should be moved by one update_enemies()
+# pass per step and drawn by one draw_enemies() pass per frame. With the audit
+# on, both count what they see and check_passes() asserts nothing went through
+# twice (or was skipped) since the last check.
+audit_passes = False
+_pass_counts = {"update": {}, "draw": {}}
+
+
+def _resolve(kind):
+    sprites = _sprites.get(kind)
+    if sprites is None:
+        arch = ENEMY_ARCHETYPES[kind]
+        ships = [load_image(path, arch["size"], angle=arch["angle"]) for path in arch["ships"]]
+        bullet_path, bullet_size = arch["bullet"]
+        sprites = (ships, projectiles.register_sprite(load_image(bullet_path, bullet_size)))
+        _sprites[kind] = sprites
+    return sprites
+
+
+def preload(kind):
+    """Warm the asset cache so spawning this kind never touches the disk."""
+    _resolve(kind)
+
+
+class Enemy:
+    """
+    One enemy of any archetype. Instances only hold per-enemy state; images,
+    speeds and shooting rules live in ENEMY_ARCHETYPES and are shared.
+    Use update_enemies()/draw_enemies() to run a whole wave at once.
+    """
+    __slots__ = ("kind", "sprite", "rect", "speed_x", "speed_y",
+                 "can_shoot", "owner_id", "frozen", "__weakref__")
+
+    KIND = None  # set by the per-level subclasses so Bug(x, y) keeps working
+
+    @classmethod
+    def preload(cls):
+        preload(cls.KIND)
+
+    def __init__(self, x, y, can_shoot=None, kind=None):
+        self.kind = kind or self.KIND
+        arch = ENEMY_ARCHETYPES[self.kind]
+        ships, _ = _resolve(self.kind)
+
+        # Shared sprite, referenced by its index in the archetype's ship list
+        self.sprite = random.randrange(len(ships))
+        self.rect = ships[self.sprite].get_rect(center=(x, y))
+
+        # Movement
+        speed_y = arch["speed_y"]
+        self.speed_y = random.uniform(*speed_y) if isinstance(speed_y, tuple) else speed_y
+        self.speed_x = 0
+        if arch["speed_x"]:
+            self.speed_x = random.choice([-1, 1]) * random.uniform(*arch["speed_x"])
+        self.frozen = False
+
+        # Shooting
+        self.can_shoot = arch["can_shoot"] if can_shoot is None else can_shoot
+        self.owner_id = projectiles.new_owner()
+
+        # Timers only hold a weak reference: an enemy dropped from its wave
+        # stops turning and shooting without anyone cancelling anything
+        ref = weakref.ref(self)
+        if arch["zigzag"]:
+            timers.schedule(random.randint(*arch["zigzag"][0]), _zigzag, ref, arch["zigzag"][1])
+        shoot_delay = random.randint(*arch["cooldown"])
+        if self.can_shoot:
+            timers.schedule(shoot_delay, _fire, ref)
+
+    @property
+    def image(self):
+        return _sprites[self.kind][0][self.sprite]
+
+    def update(self):
+        update_enemies((self,))
+
+    def shoot(self):
+        arch = ENEMY_ARCHETYPES[self.kind]
+        projectiles.spawn((self.rect.centerx, self.rect.bottom), (0, arch["bullet_speed"]),
+                          ENEMY, self.owner_id, _sprites[self.kind][1])
+        play(arch["shoot_sfx"])
+
+    def draw(self, screen):
+        # Bullets are drawn by the projectile store
+        return draw_enemies(screen, (self,))[0]
+
+
+def update_enemies(enemies):
+    """Move a whole wave, one archetype at a time (turning and shooting run on timers)."""
+    if not enemies:
+        return
+    if audit_passes:
+        _count_pass("update", enemies)
+    groups = {}
+    for enemy in enemies:
+        if not enemy.frozen:
+            groups.setdefault(enemy.kind, []).append(enemy)
+    for kind, group in groups.items():
+        _move_group(ENEMY_ARCHETYPES[kind], group)
+
+
+def _move_group(arch, group):
+    bounce = arch["bounce"]
+    wrap_below = arch["wrap_below"]
+    respawn_y = arch["respawn_y"]
+    randint = random.randint
+
+    for enemy in group:
+        rect = enemy.rect
+        if enemy.speed_x:
+            rect.x += enemy.speed_x
+        rect.y += enemy.speed_y
+
+        # Wrap back above the screen once it falls off the bottom
+        if rect.top > wrap_below:
+            rect.y = randint(*respawn_y)
+            rect.x = randint(50, 750)
+
+        if bounce and (rect.left < 0 or rect.right > 800):
+            enemy.speed_x *= -1
+
+
+# --- Timers (utils.timers); `ref` is a weakref to the enemy ---
+def _zigzag(ref, delay):
+    """Reverse the horizontal drift, then schedule the next turn."""
+    enemy = ref()
+    if enemy is None or enemy.frozen:
+        return
+    enemy.speed_x *= -1
+    timers.schedule(random.randint(*delay), _zigzag, ref, delay)
+
+
+def _fire(ref):
+    """The shot cooldown ran out: fire (or wait a tick for a free bullet), then schedule the next."""
+    enemy = ref()
+    if enemy is None or enemy.frozen or not enemy.can_shoot:
+        return
+    arch = ENEMY_ARCHETYPES[enemy.kind]
+    if arch["max_bullets"] is not None and projectiles.count_owned(enemy.owner_id) >= arch["max_bullets"]:
+        timers.schedule(0, _fire, ref)
+        return
+    enemy.shoot()
+    timers.schedule(random.randint(*arch["cooldown"]), _fire, ref)
+
+
+def draw_enemies(screen, enemies, alpha=1.0):
+    """
+    Draw a whole wave with one blits(); returns the screen areas touched.
+    alpha < 1 draws each enemy that far between its previous and current step.
+    """
+    if audit_passes:
+        _count_pass("draw", enemies)
+    sprites = _sprites
+    back = 1.0 - alpha
+    if back <= 0:
+        return screen.blits([(sprites[enemy.kind][0][enemy.sprite], enemy.rect) for enemy in enemies])
+    return screen.blits([(sprites[enemy.kind][0][enemy.sprite],
+                          (round(enemy.rect.x - enemy.speed_x * back), round(enemy.rect.y - enemy.speed_y * back)))
+                         for enemy in enemies])
+
+
+def set_pass_audit(enabled=True):
+    global audit_passes
+    audit_passes = enabled
+    for counts in _pass_counts.values():
+        counts.clear()
+
+
+def _count_pass(kind, enemies):
+    counts = _pass_counts[kind]
+    for enemy in enemies:
+        counts[id(enemy)] = counts.get(id(enemy), 0) + 1
+
+
+def check_passes(kind, enemies):
+    """
+    Assert every enemy in `enemies` got exactly one `kind` ("update" or "draw")
+    pass since the last check, and no other enemy got more than one.
+    """
+    if not audit_passes:
+        return
+    counts = _pass_counts[kind]
+    for enemy in enemies:
+        seen = counts.pop(id(enemy), 0)
+        assert seen == 1, f"{type(enemy).__name__} at {enemy.rect.topleft}: {seen} {kind} passes in one frame"
+    repeated = sum(1 for seen in counts.values() if seen > 1)
+    counts.clear()
+    assert not repeated, f"{repeated} enemies outside the scene got several {kind} passes in one frame"
@@ -1,5 +1,12 @@
 import pygame
 import random
+from utils.quality import governor
+
+try:
+    import numpy as np
+except ImportError:  # ParticleSystem needs NumPy; without it bursts are skipped
+    np = None
+
 
 class Particle:
     def __init__(self, x, y):
@@ -18,4 +25,134 @@ class Particle:
 
     def draw(self, screen):
         if self.life > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+            return pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+
+
+# --- Particle presets ---
+# name -> burst settings. speed is px/frame, life is in frames,
+# gravity is added to vy every frame and drag scales the velocity.
+PARTICLE_PRESETS = {
+    "hit_spark": {
+        "count": 12, "speed": (1.5, 4.0), "life": (8, 16), "radius": (1, 2),
+        "colors": [(255, 255, 0), (255, 255, 180)], "gravity": 0.0, "drag": 0.9,
+    },
+    "explosion_debris": {
+        "count": 40, "speed": (0.5, 3.5), "life": (20, 40), "radius": (2, 4),
+        "colors": [(255, 160, 0), (255, 80, 0), (140, 140, 140)], "gravity": 0.05, "drag": 0.97,
+    },
+    "boss_death": {
+        "count": 600, "speed": (1.0, 7.0), "life": (40, 90), "radius": (2, 5),
+        "colors": [(255, 255, 0), (255, 120, 0), (255, 40, 40), (255, 255, 255)], "gravity": 0.02, "drag": 0.98,
+    },
+}
+MAX_PARTICLES = 10000
+
+
+class ParticleSystem:
+    """
+    Every live particle of a level in preallocated arrays. Particles
+    [0, count) are alive; bursts append in bulk and dead ones are
+    compacted out in one step per frame. Drawn with a single blits()
+    call over pre-rendered sprites (one per preset color and radius).
+    """
+    def __init__(self, capacity=MAX_PARTICLES, width=800, height=600):
+        self.capacity = capacity
+        self.width, self.height = width, height
+        self.count = 0
+        self.enabled = np is not None
+        if not self.enabled:
+            print("[WARN] NumPy not installed: particle effects disabled")
+            return
+
+        self.rng = np.random.default_rng(random.getrandbits(32))
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.gravity = np.zeros(capacity)
+        self.drag = np.ones(capacity)
+
+        # --- Sprite table: preset name -> [color index, radius - min radius] -> sprite id ---
+        self.sprites = []
+        self.sprite_ids = {}
+        for name, preset in PARTICLE_PRESETS.items():
+            r_min, r_max = preset["radius"]
+            ids = np.zeros((len(preset["colors"]), r_max - r_min + 1), dtype=np.int32)
+            for c, color in enumerate(preset["colors"]):
+                for r in range(r_min, r_max + 1):
+                    ids[c, r - r_min] = len(self.sprites)
+                    self.sprites.append(self.make_sprite(color, r))
+            self.sprite_ids[name] = ids
+
+    @staticmethod
+    def make_sprite(color, radius):
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size))
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return sprite
+
+    def burst(self, preset_name, x, y, count=None):
+        """Spawn a whole burst at (x, y). Particles beyond capacity (or the quality cap) are dropped."""
+        if not self.enabled:
+            return 0
+        preset = PARTICLE_PRESETS[preset_name]
+        cap = self.capacity if governor.particle_cap is None else min(self.capacity, governor.particle_cap)
+        n = min(count or preset["count"], cap - self.count)
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        rng = self.rng
+
+        angle = rng.uniform(0, 2 * np.pi, n)
+        speed = rng.uniform(*preset["speed"], n)
+        self.pos[s] = (x, y)
+        self.vel[s, 0] = np.cos(angle) * speed
+        self.vel[s, 1] = np.sin(angle) * speed
+        self.life[s] = rng.integers(preset["life"][0], preset["life"][1] + 1, n)
+
+        r_min, r_max = preset["radius"]
+        radius = rng.integers(r_min, r_max + 1, n)
+        color = rng.integers(0, len(preset["colors"]), n)
+        self.radius[s] = radius
+        self.sprite[s] = self.sprite_ids[preset_name][color, radius - r_min]
+        self.gravity[s] = preset["gravity"]
+        self.drag[s] = preset["drag"]
+
+        self.count += n
+        return n
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        pos, vel = self.pos[:n], self.vel[:n]
+        pos += vel
+        vel[:, 1] += self.gravity[:n]
+        vel *= self.drag[:n, None]
+        self.life[:n] -= 1
+
+        # --- Retire dead and off-screen particles in bulk ---
+        x, y = pos[:, 0], pos[:, 1]
+        alive = (self.life[:n] > 0) & (x > -8) & (x < self.width + 8) & (y > -8) & (y < self.height + 8)
+        kept = int(np.count_nonzero(alive))
+        if kept != n:
+            for arr in (self.pos, self.vel, self.life, self.sprite, self.radius, self.gravity, self.drag):
+                arr[:kept] = arr[:n][alive]
+            self.count = kept
+
+    def draw(self, screen):
+        """Draw every live particle; returns the screen areas touched."""
+        n = self.count
+        if not n:
+            return []
+        corner = self.pos[:n].astype(np.intp) - self.radius[:n, None]
+        sprites = map(self.sprites.__getitem__, self.sprite[:n].tolist())
+        return screen.blits(zip(sprites, zip(corner[:, 0].tolist(), corner[:, 1].tolist())))
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,249 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # same store on plain lists, moved with Python loops
+    np = None
+
+# --- Teams ---
+PLAYER = 0
+ENEMY = 1
+
+MAX_PROJECTILES = 512
+
+
+class ProjectileStore:
+    """
+    Every bullet in the game, player and enemy alike, in preallocated arrays
+    (top-left position, velocity, size, team, owner, sprite id, alive flag).
+
+    Slots [0, count) are in use. Hits only clear the alive flag, so indices stay
+    valid for the rest of the frame; update() moves everything in one step,
+    culls what left the screen and swap-removes dead slots.
+    """
+    def __init__(self, capacity=MAX_PROJECTILES, width=800, height=600):
+        self.capacity = capacity
+        self.width, self.height = width, height
+        self.count = 0
+        self.next_owner = 1
+
+        self.sprites = []
+        self.masks = []  # pixel mask per sprite id, for utils.collision's precise test
+        self.sprite_ids = {}
+
+        if np is not None:
+            self.pos = np.zeros((capacity, 2))
+            self.vel = np.zeros((capacity, 2))
+            self.size = np.zeros((capacity, 2))
+            self.team = np.zeros(capacity, dtype=np.int8)
+            self.owner = np.zeros(capacity, dtype=np.int32)
+            self.sprite = np.zeros(capacity, dtype=np.int32)
+            self.alive = np.zeros(capacity, dtype=bool)
+        else:
+            self.pos = [[0.0, 0.0] for _ in range(capacity)]
+            self.vel = [[0.0, 0.0] for _ in range(capacity)]
+            self.size = [[0, 0] for _ in range(capacity)]
+            self.team = [0] * capacity
+            self.owner = [0] * capacity
+            self.sprite = [0] * capacity
+            self.alive = [False] * capacity
+
+    # --- Registration ---
+    def new_owner(self):
+        """Id for an entity that fires bullets (used to count or clear its own)."""
+        owner = self.next_owner
+        self.next_owner += 1
+        return owner
+
+    def register_sprite(self, surface):
+        """Sprite id for a bullet image (images from the asset cache are shared)."""
+        sprite_id = self.sprite_ids.get(id(surface))
+        if sprite_id is None:
+            sprite_id = len(self.sprites)
+            self.sprites.append(surface)
+            self.masks.append(pygame.mask.from_surface(surface))
+            self.sprite_ids[id(surface)] = sprite_id
+        return sprite_id
+
+    # --- Spawning ---
+    def spawn(self, center, velocity, team, owner, sprite_id):
+        """Fire one bullet centered on `center`. Returns its slot, or -1 if the store is full."""
+        if self.count >= self.capacity:
+            return -1
+        i = self.count
+        w, h = self.sprites[sprite_id].get_size()
+        self.pos[i][0] = center[0] - w // 2
+        self.pos[i][1] = center[1] - h // 2
+        self.vel[i][0], self.vel[i][1] = velocity
+        self.size[i][0], self.size[i][1] = w, h
+        self.team[i] = team
+        self.owner[i] = owner
+        self.sprite[i] = sprite_id
+        self.alive[i] = True
+        self.count += 1
+        return i
+
+    # --- Update ---
+    def update(self):
+        """Move every bullet, cull the ones that left the screen and compact."""
+        n = self.count
+        if not n:
+            return
+        if np is not None:
+            pos, vel = self.pos[:n], self.vel[:n]
+            pos += vel
+            x, y = pos[:, 0], pos[:, 1]
+            off_screen = (y > self.height) | (x < 0) | (x > self.width) | ((vel[:, 1] < 0) & (y < 0))
+            self.alive[:n] &= ~off_screen
+        else:
+            for i in range(n):
+                p, v = self.pos[i], self.vel[i]
+                p[0] += v[0]
+                p[1] += v[1]
+                if p[1] > self.height or p[0] < 0 or p[0] > self.width or (v[1] < 0 and p[1] < 0):
+                    self.alive[i] = False
+        self.compact()
+
+    def compact(self):
+        """Swap-remove dead slots: live bullets from the tail fill the holes."""
+        n = self.count
+        if np is not None:
+            alive = self.alive[:n]
+            kept = int(np.count_nonzero(alive))
+            if kept == n:
+                return
+            holes = np.flatnonzero(~alive[:kept])
+            movers = np.flatnonzero(alive[kept:n]) + kept
+            for arr in (self.pos, self.vel, self.size, self.team, self.owner, self.sprite, self.alive):
+                arr[holes] = arr[movers]
+            self.alive[kept:n] = False
+            self.count = kept
+            return
+
+        i = 0
+        while i < n:
+            if self.alive[i]:
+                i += 1
+                continue
+            n -= 1
+            for arr in (self.pos, self.vel, self.size, self.team, self.owner, self.sprite, self.alive):
+                arr[i], arr[n] = arr[n], arr[i]
+        self.count = n
+
+    # --- Queries ---
+    def hits(self, rect, team=None, owner=None):
+        """Slots of live bullets overlapping `rect`, optionally filtered by team/owner."""
+        n = self.count
+        if not n:
+            return []
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if np is not None:
+            x, y = self.pos[:n, 0], self.pos[:n, 1]
+            w, h = self.size[:n, 0], self.size[:n, 1]
+            mask = self.alive[:n] & (x < right) & (x + w > left) & (y < bottom) & (y + h > top)
+            if team is not None:
+                mask &= self.team[:n] == team
+            if owner is not None:
+                mask &= self.owner[:n] == owner
+            return np.flatnonzero(mask).tolist()
+
+        found = []
+        for i in range(n):
+            if not self.alive[i] or (team is not None and self.team[i] != team) \
+                    or (owner is not None and self.owner[i] != owner):
+                continue
+            (x, y), (w, h) = self.pos[i], self.size[i]
+            if x < right and x + w > left and y < bottom and y + h > top:
+                found.append(i)
+        return found
+
+    def first_hit(self, rect, team=None, owner=None):
+        """Slot of one live bullet overlapping `rect`, or -1."""
+        found = self.hits(rect, team, owner)
+        return found[0] if found else -1
+
+    def kill(self, index):
+        self.alive[index] = False
+
+    def pop_hit(self, rect, team=None, owner=None):
+        """Kill one bullet overlapping `rect`. Returns True if there was one."""
+        index = self.first_hit(rect, team, owner)
+        if index < 0:
+            return False
+        self.alive[index] = False
+        return True
+
+    def kill_hits(self, rect, team=None, owner=None):
+        """Kill every bullet overlapping `rect`. Returns how many were removed."""
+        found = self.hits(rect, team, owner)
+        for i in found:
+            self.alive[i] = False
+        return len(found)
+
+    def live_boxes(self, team=None):
+        """(slots, lefts, tops, rights, bottoms, owners) of live bullets, as plain lists."""
+        n = self.count
+        if np is not None:
+            mask = self.alive[:n] if team is None else self.alive[:n] & (self.team[:n] == team)
+            slots = np.flatnonzero(mask)
+            x, y = self.pos[slots, 0], self.pos[slots, 1]
+            return (slots.tolist(), x.tolist(), y.tolist(), (x + self.size[slots, 0]).tolist(),
+                    (y + self.size[slots, 1]).tolist(), self.owner[slots].tolist())
+
+        slots = [i for i in range(n) if self.alive[i] and (team is None or self.team[i] == team)]
+        return (slots,
+                [self.pos[i][0] for i in slots], [self.pos[i][1] for i in slots],
+                [self.pos[i][0] + self.size[i][0] for i in slots], [self.pos[i][1] + self.size[i][1] for i in slots],
+                [self.owner[i] for i in slots])
+
+    def count_owned(self, owner):
+        n = self.count
+        if np is not None:
+            return int(np.count_nonzero(self.alive[:n] & (self.owner[:n] == owner)))
+        return sum(1 for i in range(n) if self.alive[i] and self.owner[i] == owner)
+
+    def rect(self, index):
+        (x, y), (w, h) = self.pos[index], self.size[index]
+        return pygame.Rect(int(x), int(y), int(w), int(h))
+
+    # --- Clearing ---
+    def clear(self, team=None, owner=None):
+        """Remove all bullets, or only those of one team / one owner."""
+        n = self.count
+        if team is None and owner is None:
+            for i in range(n):
+                self.alive[i] = False
+            self.count = 0
+            return
+        for i in range(n):
+            if (team is None or self.team[i] == team) and (owner is None or self.owner[i] == owner):
+                self.alive[i] = False
+        self.compact()
+
+    # --- Draw ---
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every live bullet with one blits(); returns the screen areas touched.
+        alpha < 1 draws each bullet that far between its previous and current step.
+        """
+        n = self.count
+        if not n:
+            return []
+        sprites = self.sprites
+        back = 1.0 - alpha
+        if np is not None:
+            live = np.flatnonzero(self.alive[:n])
+            pos = self.pos[live] - self.vel[live] * back if back > 0 else self.pos[live]
+            corner = pos.astype(np.intp)
+            images = map(sprites.__getitem__, self.sprite[live].tolist())
+            return screen.blits(zip(images, zip(corner[:, 0].tolist(), corner[:, 1].tolist())))
+        return screen.blits([(sprites[self.sprite[i]], (int(self.pos[i][0] - self.vel[i][0] * back),
+                                                        int(self.pos[i][1] - self.vel[i][1] * back)))
+                             for i in range(n) if self.alive[i]])
+
+    def __len__(self):
+        return self.count
+
+
+# --- The game's single bullet store (cleared at the start of every level) ---
+projectiles = ProjectileStore()
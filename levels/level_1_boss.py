@@ -1,12 +1,18 @@
 import pygame
 import os
 import random
+from utils.assets import load_image, frame_paths
+from utils import sounds
+from utils.hud import BossHealthBar
+from utils.text import get_font, render_text
+from entities.projectiles import projectiles, ENEMY
+from utils.timestep import sim_ticks
+from utils.timers import timers
 
 class Level1Boss:
     def __init__(self, screen_width, screen_height):
         # Load boss image
-        self.image = pygame.image.load("assets/images/level_1_boss.gif").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (200, 200))
+        self.image = load_image("assets/images/level_1_boss.gif", (200, 200))
         self.rect = self.image.get_rect(center=(screen_width // 2, -150))
 
         # Movement
@@ -23,39 +29,33 @@ class Level1Boss:
         self.following = True
         self.returning = False
         self.follow_duration = 4000
-        self.last_follow_switch = pygame.time.get_ticks()
+        timers.schedule(self.follow_duration, self.switch_follow)
 
         # Health
         self.max_health = 4
         self.health = self.max_health
 
         # Shooting
-        self.bullet_image = pygame.image.load("assets/images/enemyBullet.png").convert_alpha()
-        self.bullet_image = pygame.transform.scale(self.bullet_image, (30, 30))
-        self.bullets = []
+        self.bullet_image = load_image("assets/images/enemyBullet.png", (30, 30))
+        self.bullet_sprite = projectiles.register_sprite(self.bullet_image)
+        self.owner_id = projectiles.new_owner()
         self.shoot_cooldown = 2500
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = sim_ticks()
         self.paused_until = 0
 
         # Font and fade
-        self.font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 28)
-        self.name_surface = self.font.render("D’Aragon", True, (255, 255, 255))
+        self.font = get_font("assets/fonts/BoldPixels.ttf", 28)
+        self.name_surface = render_text(self.font, "D’Aragon", (255, 255, 255))
+        self.health_bar = BossHealthBar(self.name_surface, screen_width)
         self.fade_alpha = 0
         self.fade_in_speed = 3
         self.fade_done = False
 
-        # --- Sound Effects ---
-        try:
-            self.shoot_sound = pygame.mixer.Sound("assets/sounds/player_shoot_1.mp3")
-        except:
-            self.shoot_sound = None
+        # --- Sound Effects (sound bank entries) ---
+        self.shoot_sound = "level_1_boss_shoot"
 
         # --- Boss Passive Sound (looping background sound) ---
-        try:
-            self.boss_passive_sound = pygame.mixer.Sound("assets/sounds/boss_sfx/level_1_boss/level_1_boss_passive.mp3")
-            self.boss_passive_sound.set_volume(0.4)
-        except:
-            self.boss_passive_sound = None
+        self.boss_passive_sound = "level_1_boss_passive"
 
         self.sound_playing = False  # Track if the looping sound is active
         self.sound_paused = False   # Track if it’s temporarily paused
@@ -68,35 +68,32 @@ class Level1Boss:
         self.death_finished = False
         self.death_done_time = 0
 
-        # Bullet speeds
-        self.bullet_speeds = {}
-
     # ----------------------------
     #       SOUND CONTROLS
     # ----------------------------
     def play_boss_sound(self):
         """Play looping boss passive sound."""
         if self.boss_passive_sound and not self.sound_playing:
-            self.boss_passive_sound.play(loops=-1)
+            sounds.play(self.boss_passive_sound, loops=-1)
             self.sound_playing = True
             self.sound_paused = False
 
     def pause_boss_sound(self):
-        """Temporarily pause the boss sound."""
+        """Temporarily pause the boss sound (only the boss loop channels)."""
         if self.boss_passive_sound and self.sound_playing and not self.sound_paused:
-            pygame.mixer.pause()
+            sounds.pause_group("boss_loop")
             self.sound_paused = True
 
     def resume_boss_sound(self):
         """Resume the boss sound if paused."""
         if self.boss_passive_sound and self.sound_paused:
-            pygame.mixer.unpause()
+            sounds.resume_group("boss_loop")
             self.sound_paused = False
 
     def stop_boss_sound(self):
         """Completely stop the looping boss sound."""
         if self.boss_passive_sound and self.sound_playing:
-            self.boss_passive_sound.stop()
+            sounds.stop_group("boss_loop")
             self.sound_playing = False
             self.sound_paused = False
 
@@ -110,11 +107,8 @@ class Level1Boss:
             print(f"[WARNING] Boss death animation folder not found: {folder_path}")
             return frames
 
-        for filename in sorted(os.listdir(folder_path)):
-            if filename.endswith(".png"):
-                frame = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-                frame = pygame.transform.scale(frame, (200, 200))
-                frames.append(frame)
+        for path in frame_paths(folder_path):
+            frames.append(load_image(path, (200, 200)))
         return frames
 
     # ----------------------------
@@ -123,7 +117,7 @@ class Level1Boss:
     def reset_shooting_rate(self):
         """Pause boss shooting and sound for 3 seconds after question."""
         self.shoot_cooldown = 2000
-        self.paused_until = pygame.time.get_ticks() + 3000
+        self.paused_until = sim_ticks() + 3000
         self.pause_boss_sound()  # Pause the looping boss sound during questions
 
     def update(self, player_rect):
@@ -148,7 +142,7 @@ class Level1Boss:
             self.play_boss_sound()
 
         # --- Resume boss sound if pause ended ---
-        if pygame.time.get_ticks() > self.paused_until and self.sound_paused:
+        if sim_ticks() > self.paused_until and self.sound_paused:
             self.resume_boss_sound()
 
         # --- Fade-in bar and name ---
@@ -157,13 +151,6 @@ class Level1Boss:
             if self.fade_alpha >= 255:
                 self.fade_done = True
 
-        # --- Movement switching ---
-        now = pygame.time.get_ticks()
-        if now - self.last_follow_switch > self.follow_duration:
-            self.following = not self.following
-            self.returning = not self.returning
-            self.last_follow_switch = now
-
         # --- Follow or return ---
         if self.following:
             diff = player_rect.centerx - self.rect.centerx
@@ -176,7 +163,7 @@ class Level1Boss:
         self.rect.x = max(0, min(self.rect.x, self.screen_width - self.rect.width))
 
         # --- Shooting ---
-        current_time = pygame.time.get_ticks()
+        current_time = sim_ticks()
         can_shoot = current_time >= self.paused_until
         if can_shoot and current_time - self.last_shot_time > self.shoot_cooldown:
             if self.health > self.max_health / 2:
@@ -186,37 +173,31 @@ class Level1Boss:
             self.last_shot_time = current_time
             self.shoot_cooldown = max(800, self.shoot_cooldown - 100)
 
-        # --- Move bullets ---
-        for bullet_rect in self.bullets[:]:
-            dx, dy = self.bullet_speeds.get(id(bullet_rect), (0, 10))
-            bullet_rect.x += dx
-            bullet_rect.y += dy
-            if bullet_rect.y > 600 or bullet_rect.x < 0 or bullet_rect.x > self.screen_width:
-                self.bullets.remove(bullet_rect)
-                self.bullet_speeds.pop(id(bullet_rect), None)
+    def switch_follow(self):
+        """Swap between following the player and returning home, every follow_duration ms."""
+        if not self.alive:
+            return
+        self.following = not self.following
+        self.returning = not self.returning
+        timers.schedule(self.follow_duration, self.switch_follow)
 
     # ----------------------------
     #       SHOOT METHODS
     # ----------------------------
     def shoot_single(self):
         """Shoot one bullet straight down."""
-        bullet_rect = self.bullet_image.get_rect(center=(self.rect.centerx, self.rect.bottom))
-        self.bullets.append(bullet_rect)
-        self.bullet_speeds[id(bullet_rect)] = (0, 10)
-        if self.shoot_sound:
-            self.shoot_sound.play()
+        projectiles.spawn((self.rect.centerx, self.rect.bottom), (0, 10), ENEMY, self.owner_id, self.bullet_sprite)
+        sounds.play(self.shoot_sound)
 
     def shoot_double(self):
         """Shoot two bullets slightly angled outward."""
         offset = 40
         spread_angle = 4
-        left_bullet = self.bullet_image.get_rect(center=(self.rect.centerx - offset, self.rect.bottom))
-        right_bullet = self.bullet_image.get_rect(center=(self.rect.centerx + offset, self.rect.bottom))
-        self.bullets.extend([left_bullet, right_bullet])
-        self.bullet_speeds[id(left_bullet)] = (-spread_angle, 10)
-        self.bullet_speeds[id(right_bullet)] = (spread_angle, 10)
-        if self.shoot_sound:
-            self.shoot_sound.play()
+        projectiles.spawn((self.rect.centerx - offset, self.rect.bottom), (-spread_angle, 10),
+                          ENEMY, self.owner_id, self.bullet_sprite)
+        projectiles.spawn((self.rect.centerx + offset, self.rect.bottom), (spread_angle, 10),
+                          ENEMY, self.owner_id, self.bullet_sprite)
+        sounds.play(self.shoot_sound)
 
     # ----------------------------
     #      DEATH ANIMATION
@@ -225,13 +206,13 @@ class Level1Boss:
         """Handle boss death animation and sound stop."""
         if self.death_finished:
             if self.death_done_time == 0:
-                self.death_done_time = pygame.time.get_ticks()
+                self.death_done_time = sim_ticks()
                 self.stop_boss_sound()  # stop looping sound
-            elif pygame.time.get_ticks() - self.death_done_time > 3000:
+            elif sim_ticks() - self.death_done_time > 3000:
                 self.victory = True
             return
 
-        now = pygame.time.get_ticks()
+        now = sim_ticks()
         if now - self.last_death_update > self.death_speed:
             self.last_death_update = now
             self.death_index += 1
@@ -243,46 +224,20 @@ class Level1Boss:
     #          DRAW
     # ----------------------------
     def draw(self, screen):
-        """Draw boss, health bar, name, and bullets."""
+        """Draw boss, health bar and name (bullets are drawn by the projectile store)."""
+        drawn = []
         if self.dying:
             if self.death_frames:
-                screen.blit(self.death_frames[self.death_index], self.rect)
-            return
+                drawn.append(screen.blit(self.death_frames[self.death_index], self.rect))
+            return drawn
 
         if self.alive:
-            screen.blit(self.image, self.rect)
+            drawn.append(screen.blit(self.image, self.rect))
 
+            # Health bar + name (cached layer, faded in)
             if self.fade_alpha > 0:
-                alpha = self.fade_alpha
-                name_surface = self.name_surface.copy()
-                name_surface.set_alpha(alpha)
-
-                # Health bar
-                bar_width = 300
-                bar_height = 20
-                bar_x = (self.screen_width - bar_width) // 2
-                bar_y = 70
-
-                bg_surface = pygame.Surface((bar_width, bar_height))
-                bg_surface.fill((80, 0, 0))
-                bg_surface.set_alpha(alpha)
-                screen.blit(bg_surface, (bar_x, bar_y))
-
-                current_width = int(bar_width * (self.health / self.max_health))
-                fill_surface = pygame.Surface((current_width, bar_height))
-                fill_surface.fill((255, 0, 0))
-                fill_surface.set_alpha(alpha)
-                screen.blit(fill_surface, (bar_x, bar_y))
-
-                pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
-
-                # Boss name above bar
-                name_rect = name_surface.get_rect(center=(self.screen_width // 2, bar_y - 25))
-                screen.blit(name_surface, name_rect)
-
-        # Draw bullets
-        for bullet_rect in self.bullets:
-            screen.blit(self.bullet_image, bullet_rect)
+                drawn.append(self.health_bar.draw(screen, self.health, self.max_health, self.fade_alpha))
+        return drawn
 
     # ----------------------------
     #         DAMAGE HANDLER
@@ -295,6 +250,6 @@ class Level1Boss:
             self.alive = False
         
             self.dying = True
-            self.last_death_update = pygame.time.get_ticks()
+            self.last_death_update = sim_ticks()
             return True
         return False
@@ -3,13 +3,19 @@ import os
 import random
 import math
 from entities.bugs_level_2 import Bug_Level_2
+from utils.assets import load_image, frame_paths
+from utils import sounds
+from utils.hud import BossHealthBar
+from utils.text import get_font, render_text
+from entities.projectiles import projectiles, ENEMY
+from utils.timestep import sim_ticks
+from utils.timers import timers
 
 
 class Level2Boss:
     def __init__(self, screen_width, screen_height):
         # --- Base sprite ---
-        self.image = pygame.image.load("assets/images/level_2_boss.gif").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (200, 200))
+        self.image = load_image("assets/images/level_2_boss.gif", (200, 200))
         self.rect = self.image.get_rect(center=(screen_width // 2, -150))
 
         # --- Movement ---
@@ -32,40 +38,31 @@ class Level2Boss:
         self.health = self.max_health
 
         # --- Shooting setup ---
-        self.bullet_image = pygame.image.load("assets/images/enemyBullet.png").convert_alpha()
-        self.bullet_image = pygame.transform.scale(self.bullet_image, (28, 28))
-        self.bullets = []
-        self.bullet_speeds = {}
+        self.bullet_image = load_image("assets/images/enemyBullet.png", (28, 28))
+        self.bullet_sprite = projectiles.register_sprite(self.bullet_image)
+        self.owner_id = projectiles.new_owner()
         self.shoot_cooldown = 5000
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = sim_ticks()
         self.paused_until = 0
 
         # --- Minions ---
         self.minions = []
         self.last_minion_spawn = 0
         self.minion_spawn_cooldown = 50000  # every 10s
+        self.minion_timer = timers.schedule_at(self.last_minion_spawn + self.minion_spawn_cooldown,
+                                               self.minion_wave)
 
         # --- Name ---
-        self.font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 28)
-        self.name_surface = self.font.render("ExBim", True, (255, 255, 255))
+        self.font = get_font("assets/fonts/BoldPixels.ttf", 28)
+        self.name_surface = render_text(self.font, "ExBim", (255, 255, 255))
+        self.health_bar = BossHealthBar(self.name_surface, screen_width)
         self.fade_alpha = 0
         self.fade_in_speed = 3
         self.fade_done = False
 
-        # --- Sound Effects ---
-        try:
-            self.shoot_sound = pygame.mixer.Sound("assets/sounds/player_shoot_1.mp3")
-            self.shoot_sound.set_volume(0.4)
-        except:
-            self.shoot_sound = None
-
-        try:
-            self.boss_passive_sound = pygame.mixer.Sound(
-                "assets/sounds/boss_sfx/level_2_boss/level_2_boss_passive.mp3"
-            )
-            self.boss_passive_sound.set_volume(0.4)
-        except:
-            self.boss_passive_sound = None
+        # --- Sound Effects (sound bank entries) ---
+        self.shoot_sound = "level_2_boss_shoot"
+        self.boss_passive_sound = "level_2_boss_passive"
 
         self.sound_playing = False
 
@@ -81,26 +78,19 @@ class Level2Boss:
     #  Frame loaders
     # --------------------------
     def load_frames(self, folder_path):
-        frames = []
-        if os.path.exists(folder_path):
-            for filename in sorted(os.listdir(folder_path)):
-                if filename.endswith(".png"):
-                    frame = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-                    frame = pygame.transform.scale(frame, (200, 200))
-                    frames.append(frame)
-        return frames
+        return [load_image(path, (200, 200)) for path in frame_paths(folder_path)]
 
     # --------------------------
     #  Sound control
     # --------------------------
     def play_boss_sound(self):
         if self.boss_passive_sound and not self.sound_playing:
-            self.boss_passive_sound.play(loops=-1)
+            sounds.play(self.boss_passive_sound, loops=-1)
             self.sound_playing = True
 
     def stop_boss_sound(self):
         if self.boss_passive_sound and self.sound_playing:
-            self.boss_passive_sound.stop()
+            sounds.stop_group("boss_loop")
             self.sound_playing = False
 
     # --------------------------
@@ -114,31 +104,24 @@ class Level2Boss:
         if self.health <= self.max_health // 3:
             pattern = 3
 
+        muzzle = (self.rect.centerx, self.rect.bottom)
         if pattern == 1:
             # Basic downward bullet
-            bullet_rect = self.bullet_image.get_rect(center=(self.rect.centerx, self.rect.bottom))
-            self.bullets.append(bullet_rect)
-            self.bullet_speeds[id(bullet_rect)] = (0, 9)
+            velocities = [(0, 9)]
         elif pattern == 2:
             # Spread shot
-            angles = [-5, 0, 5]
-            for a in angles:
-                bullet_rect = self.bullet_image.get_rect(center=(self.rect.centerx, self.rect.bottom))
-                self.bullets.append(bullet_rect)
-                self.bullet_speeds[id(bullet_rect)] = (a, 10)
-        elif pattern == 3:
+            velocities = [(a, 10) for a in (-5, 0, 5)]
+        else:
             # Spiral spread pattern
-            for angle in range(-15, 20, 10):
-                bullet_rect = self.bullet_image.get_rect(center=(self.rect.centerx, self.rect.bottom))
-                self.bullets.append(bullet_rect)
-                self.bullet_speeds[id(bullet_rect)] = (angle / 3, 12)
+            velocities = [(angle / 3, 12) for angle in range(-15, 20, 10)]
+        for velocity in velocities:
+            projectiles.spawn(muzzle, velocity, ENEMY, self.owner_id, self.bullet_sprite)
 
-        if self.shoot_sound:
-            self.shoot_sound.play()
+        sounds.play(self.shoot_sound)
 
     def reset_shooting_rate(self):
         """Pause boss for 3 seconds after a question."""
-        self.paused_until = pygame.time.get_ticks() + 3000
+        self.paused_until = sim_ticks() + 3000
 
     # --------------------------
     #  Update + draw
@@ -155,7 +138,7 @@ class Level2Boss:
 # --- Prevent spawning or updating minions if dying or dead ---
         if self.dying or self.victory or not self.alive:
             self.minions.clear()
-            self.bullets.clear()
+            projectiles.clear(team=ENEMY)  # boss and minion bullets
             return
 
         # Entrance phase
@@ -185,39 +168,36 @@ class Level2Boss:
         self.rect.y = self.target_y + int(math.sin(self.wave_angle * 2) * 5)
 
         # --- Shooting control ---
-        now = pygame.time.get_ticks()
+        now = sim_ticks()
         if now > self.paused_until and now - self.last_shot_time > self.shoot_cooldown:
             self.shoot()
             self.last_shot_time = now
             self.shoot_cooldown = max(600, self.shoot_cooldown - 50)  # faster over time
 
-        # --- Move bullets ---
-        for bullet_rect in self.bullets[:]:
-            dx, dy = self.bullet_speeds.get(id(bullet_rect), (0, 10))
-            bullet_rect.x += dx
-            bullet_rect.y += dy
-            if bullet_rect.y > 600 or bullet_rect.x < 0 or bullet_rect.x > self.screen_width:
-                self.bullets.remove(bullet_rect)
-                self.bullet_speeds.pop(id(bullet_rect), None)
-
-        # --- Minion spawning ---
-        if now - self.last_minion_spawn > self.minion_spawn_cooldown:
-            self.spawn_minions()
-            self.last_minion_spawn = now
-            if self.health <= self.max_health // 2:
-                self.minion_spawn_cooldown = 8000
-            if self.health <= self.max_health // 3:
-                self.minion_spawn_cooldown = 6000
-
-        # --- Update minions ---
+        # --- Cull minions (the world moves and draws them, see World.scene_enemies) ---
         for m in self.minions[:]:
-            m.update()
             if m.rect.top > 700:
+                projectiles.clear(owner=m.owner_id)
                 self.minions.remove(m)
 
     # --------------------------
     #  Minions
     # --------------------------
+    def minion_wave(self):
+        """Minion timer: spawn a wave (once the entrance is over), then schedule the next."""
+        if not self.alive or self.dying:
+            return
+        if self.rect.y < self.target_y:
+            self.minion_timer = timers.schedule(0, self.minion_wave)
+            return
+        self.spawn_minions()
+        self.last_minion_spawn = sim_ticks()
+        if self.health <= self.max_health // 2:
+            self.minion_spawn_cooldown = 8000
+        if self.health <= self.max_health // 3:
+            self.minion_spawn_cooldown = 6000
+        self.minion_timer = timers.schedule(self.minion_spawn_cooldown, self.minion_wave)
+
     def spawn_minions(self):
         """Spawn a small number of additional bugs from Level 2."""
         count = random.randint(2, 4)  # fewer minions, max 4
@@ -234,17 +214,17 @@ class Level2Boss:
     def update_death_animation(self):
         if self.death_finished:
             if self.death_done_time == 0:
-                self.death_done_time = pygame.time.get_ticks()
+                self.death_done_time = sim_ticks()
                 self.stop_boss_sound()
 
                 for bug in self.minions:
                     bug.frozen = True
 
-            elif pygame.time.get_ticks() - self.death_done_time > 3000:
+            elif sim_ticks() - self.death_done_time > 3000:
                 self.victory = True
             return
 
-        now = pygame.time.get_ticks()
+        now = sim_ticks()
         if now - self.last_death_update > self.death_speed:
             self.last_death_update = now
             self.death_index += 1
@@ -257,42 +237,14 @@ class Level2Boss:
     # --------------------------
     def draw(self, screen):
         if self.dying and self.death_frames:
-            screen.blit(self.death_frames[self.death_index], self.rect)
-            return
+            return [screen.blit(self.death_frames[self.death_index], self.rect)]
 
-        screen.blit(self.image, self.rect)
+        drawn = [screen.blit(self.image, self.rect)]
 
-        # Health bar + name
+        # Health bar + name (cached layer, faded in)
         if self.fade_alpha > 0:
-            alpha = self.fade_alpha
-            bar_width, bar_height = 300, 20
-            bar_x = (self.screen_width - bar_width) // 2
-            bar_y = 70
-
-            bg_surface = pygame.Surface((bar_width, bar_height))
-            bg_surface.fill((80, 0, 0))
-            bg_surface.set_alpha(alpha)
-            screen.blit(bg_surface, (bar_x, bar_y))
-
-            current_width = int(bar_width * (self.health / self.max_health))
-            fill_surface = pygame.Surface((current_width, bar_height))
-            fill_surface.fill((255, 0, 0))
-            fill_surface.set_alpha(alpha)
-            screen.blit(fill_surface, (bar_x, bar_y))
-            pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
-
-            name_surface = self.name_surface.copy()
-            name_surface.set_alpha(alpha)
-            name_rect = name_surface.get_rect(center=(self.screen_width // 2, bar_y - 25))
-            screen.blit(name_surface, name_rect)
-
-        # Draw bullets
-        for bullet_rect in self.bullets:
-            screen.blit(self.bullet_image, bullet_rect)
-
-        # Draw minions
-        for m in self.minions:
-            m.draw(screen)
+            drawn.append(self.health_bar.draw(screen, self.health, self.max_health, self.fade_alpha))
+        return drawn
 
     # --------------------------
     #  Damage
@@ -303,13 +255,13 @@ class Level2Boss:
             self.health = 0
             self.alive = False
             self.dying = True
-            self.last_death_update = pygame.time.get_ticks()
+            self.last_death_update = sim_ticks()
 
             # --- Stop spawning and clear all minions instantly ---
             self.minions.clear()
-            self.bullets.clear()
+            projectiles.clear(team=ENEMY)  # boss and minion bullets
             self.stop_boss_sound()
-            self.last_minion_spawn = pygame.time.get_ticks() + 9999999  # disable spawn timer
+            timers.cancel(self.minion_timer)
 
             return True
         return False
@@ -2,12 +2,29 @@ import pygame
 import os
 import random
 import math
+from utils.assets import load_image, frame_paths
+from utils.collision import mask_for, overlap
+from utils.hud import BossHealthBar
+from utils.text import get_font, render_text
+from utils.timestep import sim_ticks
+
+LASER_FRAME_PATHS = [
+    os.path.join("assets/images/laserbeam_boss", f"frame_{i:02d}_delay-0.05s.png")
+    for i in range(12)
+]
+
+# Stretched beams are cached per (frame index, height bucket). Heights are
+# rounded up to BEAM_HEIGHT_STEP so the boss's sine bobbing keeps hitting the
+# same few entries (the extra few pixels run off the bottom of the screen).
+BEAM_HEIGHT_STEP = 32
+BEAM_CACHE_SIZE = 36
 
 class Level3Boss:
+    beam_cache = {}  # shared by every Level3Boss: (frame index, height bucket) -> (Surface, mask)
+
     def __init__(self, screen_width, screen_height):
         # --- Boss Sprite ---
-        self.image = pygame.image.load("assets/images/level_3_boss.gif").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (220, 220))
+        self.image = load_image("assets/images/level_3_boss.gif", (220, 220))
         self.rect = self.image.get_rect(center=(screen_width // 2, 120))
 
         # --- Health ---
@@ -36,6 +53,7 @@ class Level3Boss:
         self.laser_delay = random.randint(120, 200)
         self.laser_rect = None
         self.current_laser_frame = None
+        self.current_laser_mask = None
 
         # --- Laser aiming & timing ---
         self.aim_x = None
@@ -52,8 +70,9 @@ class Level3Boss:
         self.fade_done = False
 
         # --- Font (same as Level 2 Boss) ---
-        self.font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 28)
-        self.name_surface = self.font.render("D'Ace", True, (255, 255, 255))
+        self.font = get_font("assets/fonts/BoldPixels.ttf", 28)
+        self.name_surface = render_text(self.font, "D'Ace", (255, 255, 255))
+        self.health_bar = BossHealthBar(self.name_surface, screen_width)
 
         self.screen_height = screen_height
         self.charge_flash = False
@@ -68,25 +87,33 @@ class Level3Boss:
     # Loaders
     # ----------------------------------------------------
     def load_laser_frames(self):
-        folder = "assets/images/laserbeam_boss"
-        for i in range(12):
-            filename = f"frame_{i:02d}_delay-0.05s.png"
-            path = os.path.join(folder, filename)
+        """Load the laser frames already rotated to point down (250x180)."""
+        for path in LASER_FRAME_PATHS:
             if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (180, 250))
-                self.laser_frames.append(img)
+                self.laser_frames.append(load_image(path, (250, 180), angle=270))
+
+    def get_beam(self, index, beam_height):
+        """Return laser frame `index` stretched to at least beam_height pixels, with its mask."""
+        bucket = -(-int(beam_height) // BEAM_HEIGHT_STEP) * BEAM_HEIGHT_STEP
+        key = (index, bucket)
+        beam = self.beam_cache.get(key)
+        if beam is None:
+            frame = self.laser_frames[index]
+            surface = pygame.transform.scale(frame, (frame.get_width(), bucket))
+            beam = (surface, pygame.mask.from_surface(surface))
+            if len(self.beam_cache) >= BEAM_CACHE_SIZE:
+                del self.beam_cache[next(iter(self.beam_cache))]  # drop the oldest
+            self.beam_cache[key] = beam
+        return beam
+
+    def set_beam_frame(self, index):
+        beam_height = self.screen_height - self.rect.bottom
+        self.current_laser_frame, self.current_laser_mask = self.get_beam(index, beam_height)
+        self.laser_rect = self.current_laser_frame.get_rect(midtop=(self.aim_x, self.rect.bottom))
 
     def load_death_frames(self, folder_path):
         """Load all death animation frames from a folder."""
-        frames = []
-        if os.path.exists(folder_path):
-            for filename in sorted(os.listdir(folder_path)):
-                if filename.endswith(".png"):
-                    frame = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-                    frame = pygame.transform.scale(frame, (180, 180))
-                    frames.append(frame)
-        return frames
+        return [load_image(path, (180, 180)) for path in frame_paths(folder_path)]
 
     # ----------------------------------------------------
     # Update
@@ -158,19 +185,9 @@ class Level3Boss:
                         self.laser_rect = None
                         self.laser_delay = random.randint(160, 250)
                     else:
-                        frame = self.laser_frames[-1]
-                        rotated = pygame.transform.rotate(frame, 270)
-                        beam_height = self.screen_height - self.rect.bottom
-                        stretched = pygame.transform.scale(rotated, (rotated.get_width(), int(beam_height)))
-                        self.laser_rect = stretched.get_rect(midtop=(self.aim_x, self.rect.bottom))
-                        self.current_laser_frame = stretched
+                        self.set_beam_frame(len(self.laser_frames) - 1)
                 else:
-                    frame = self.laser_frames[int(self.laser_index)]
-                    rotated = pygame.transform.rotate(frame, 270)
-                    beam_height = self.screen_height - self.rect.bottom
-                    stretched = pygame.transform.scale(rotated, (rotated.get_width(), int(beam_height)))
-                    self.laser_rect = stretched.get_rect(midtop=(self.aim_x, self.rect.bottom))
-                    self.current_laser_frame = stretched
+                    self.set_beam_frame(int(self.laser_index))
 
     # ----------------------------------------------------
     # Death logic
@@ -181,23 +198,24 @@ class Level3Boss:
             self.victory = True
             return
 
-        now = pygame.time.get_ticks()
+        now = sim_ticks()
         if now - self.last_death_update > self.death_speed:
             self.last_death_update = now
             self.death_index += 1
             if self.death_index >= len(self.death_frames):
                 self.death_finished = True
                 self.death_index = len(self.death_frames) - 1
-                self.death_done_time = pygame.time.get_ticks()
+                self.death_done_time = sim_ticks()
                 self.victory = True
 
     # ----------------------------------------------------
     # Collision
     # ----------------------------------------------------
-    def check_laser_hit(self, player_rect):
-        """Return True if player hit by laser (only once per shot)."""
+    def check_laser_hit(self, player_image, player_rect):
+        """Return True if player hit by laser (only once per shot, pixel-precise)."""
         if self.firing and self.laser_rect and not self.laser_has_hit:
-            if self.laser_rect.colliderect(player_rect):
+            if self.laser_rect.colliderect(player_rect) and overlap(
+                    self.current_laser_mask, self.laser_rect.topleft, mask_for(player_image), player_rect.topleft):
                 self.laser_has_hit = True
                 return True
         return False
@@ -209,52 +227,34 @@ class Level3Boss:
         """Draw boss, laser, and UI."""
         # --- Death animation ---
         if self.dying and self.death_frames:
-            screen.blit(self.death_frames[self.death_index], self.rect)
-            return
+            return [screen.blit(self.death_frames[self.death_index], self.rect)]
 
-        # --- Normal state ---
-        boss_image = self.image.copy()
-        boss_image.set_alpha(self.fade_alpha)
-        screen.blit(boss_image, self.rect)
+        # --- Normal state (only copy the sprite while it is still fading in) ---
+        if self.fade_done:
+            drawn = [screen.blit(self.image, self.rect)]
+        else:
+            boss_image = self.image.copy()
+            boss_image.set_alpha(self.fade_alpha)
+            drawn = [screen.blit(boss_image, self.rect)]
 
         # --- Warning line ---
         if self.fade_done and self.laser_active and not self.firing:
             color = (255, 40, 40) if self.charge_flash else (255, 150, 150)
-            pygame.draw.line(
+            drawn.append(pygame.draw.line(
                 screen, color,
                 (self.aim_x, self.rect.bottom),
                 (self.aim_x, self.screen_height),
                 6
-            )
+            ))
 
         # --- Laser beam ---
         if self.fade_done and self.firing and self.laser_rect:
-            screen.blit(self.current_laser_frame, self.laser_rect)
+            drawn.append(screen.blit(self.current_laser_frame, self.laser_rect))
 
-        # --- Health bar ---
+        # --- Health bar + name (cached layer) ---
         if self.fade_alpha > 30 and not self.dying:
-            bar_width, bar_height = 300, 20
-            x = (screen.get_width() - bar_width) // 2
-            y = 70
-
-            bg_surface = pygame.Surface((bar_width, bar_height))
-            bg_surface.fill((80, 0, 0))
-            bg_surface.set_alpha(self.fade_alpha)
-            screen.blit(bg_surface, (x, y))
-
-            fill = (self.health / self.max_health) * bar_width
-            fill_surface = pygame.Surface((fill, bar_height))
-            fill_surface.fill((255, 0, 0))
-            fill_surface.set_alpha(self.fade_alpha)
-            screen.blit(fill_surface, (x, y))
-
-            pygame.draw.rect(screen, (255, 255, 255), (x, y, bar_width, bar_height), 2)
-
-            # Name text
-            name_surface = self.name_surface.copy()
-            name_surface.set_alpha(self.fade_alpha)
-            name_rect = name_surface.get_rect(center=(screen.get_width() // 2, y - 25))
-            screen.blit(name_surface, name_rect)
+            drawn.append(self.health_bar.draw(screen, self.health, self.max_health, self.fade_alpha))
+        return drawn
 
     # ----------------------------------------------------
     # Damage
@@ -268,7 +268,7 @@ class Level3Boss:
         if self.health <= 0:
             self.health = 0
             self.dying = True
-            self.last_death_update = pygame.time.get_ticks()
+            self.last_death_update = sim_ticks()
             self.firing = False
             self.laser_active = False
             self.laser_rect = None
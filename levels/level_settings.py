@@ -3,3 +3,39 @@ LEVELS = [
     {"bug_count": 8, "bug_speed": 3},
     {"bug_count": 12, "bug_speed": 4},
 ]
+
+# --- Assets each level needs (decoded ahead of time by utils.preloader) ---
+# "images": (path, size, angle, alpha) exactly as the entities request them
+# "folders": (animation folder, frame size)
+from entities.bug import SHIP_IMAGES as LEVEL_1_SHIPS
+from entities.bugs_level_2 import SHIP_IMAGES as LEVEL_2_SHIPS
+from entities.bugs_level_3 import SHIP_IMAGES as LEVEL_3_SHIPS
+from levels.level_3_boss import LASER_FRAME_PATHS
+
+LEVEL_ASSETS = {
+    1: {
+        "images": [("assets/images/space.png", (800, 600), 0, False),
+                   ("assets/images/enemyBullet.png", (30, 30), 0, True),
+                   ("assets/images/level_1_boss.gif", (200, 200), 0, True)]
+                  + [(path, (100, 100), 90, True) for path in LEVEL_1_SHIPS],
+        "folders": [("assets/images/boss_dying/level_1_boss", (200, 200)),
+                    ("assets/images/portal_2", (200, 200))],
+    },
+    2: {
+        "images": [("assets/images/menu/menu_background/level_2_map.jpg", (800, 600), 0, False),
+                   ("assets/images/enemyBullet.png", (28, 28), 0, True),
+                   ("assets/images/level_2_boss.gif", (200, 200), 0, True)]
+                  + [(path, (90, 90), 90, True) for path in LEVEL_2_SHIPS],
+        "folders": [("assets/images/boss_dying/level_2_boss", (200, 200)),
+                    ("assets/images/portal_2", (200, 200))],
+    },
+    3: {
+        "images": [("assets/images/menu/menu_background/level_3_map.png", (800, 600), 0, False),
+                   ("assets/images/enemyBullet.png", (28, 28), 0, True),
+                   ("assets/images/level_3_boss.gif", (220, 220), 0, True)]
+                  + [(path, (90, 90), 180, True) for path in LEVEL_3_SHIPS]
+                  + [(path, (250, 180), 270, True) for path in LASER_FRAME_PATHS],
+        "folders": [("assets/images/boss_dying/level_3_boss", (180, 180)),
+                    ("assets/images/portal_2", (200, 200))],
+    },
+}
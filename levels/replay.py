@@ -0,0 +1,173 @@
+import atexit
+import os
+import random
+import struct
+import time
+import zlib
+import pygame
+from challenges.challenge_handler import question_rng, used_questions
+from challenges.challenge_handler_level2 import used_questions_level2
+from challenges.challenge_handler_level3 import used_questions_level3
+from entities.projectiles import projectiles
+from levels.world import WORLDS
+from utils.hud import PlayerHUD
+from utils.render import renderer
+from utils.timestep import timestep
+
+# --- Replay files ---
+# A level's simulation only depends on the seed, the simulation clock it
+# started at, the keys held on each fixed step and the answers given, so that
+# is all a replay stores. Header, then one byte per record:
+#   0b000kkkkk  one world step; bit i set = RECORDED_KEYS[i] held
+#   0b1000000c  a question was answered (c = correct)
+#   0xFF        end of session, followed by a CRC32 of the final world state
+MAGIC = b"CSRP"
+VERSION = 3  # 2: cooldowns moved onto utils.timers, 3: pixel-mask collisions
+HEADER = struct.Struct("<4sBBId")  # magic, version, level, seed, start time (ms)
+DIGEST = struct.Struct("<I")
+RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_SPACE)
+KEY_BITS = {key: 1 << bit for bit, key in enumerate(RECORDED_KEYS)}
+ANSWER = 0x80
+END = 0xFF
+REPLAY_DIR = "replays"
+
+
+def seed_session(seed):
+    """Seed gameplay and question selection, with every question unused again."""
+    random.seed(seed)
+    question_rng.seed(seed)
+    used_questions.clear()
+    used_questions_level2.clear()
+    used_questions_level3.clear()
+
+
+def state_digest(world):
+    """CRC32 of the world's gameplay state, to check a replay against its recording."""
+    player = world.player
+    state = [world.ticks, timestep.time, tuple(player.rect), player.health, player.has_shield,
+             world.bugs_destroyed, [tuple(enemy.rect) for enemy in world.enemies],
+             [(float(x), float(y)) for x, y in projectiles.pos[:projectiles.count]],
+             random.getstate()]
+    if world.boss:
+        state += [tuple(world.boss.rect), getattr(world.boss, "health", None)]
+    return zlib.crc32(repr(state).encode())
+
+
+# --- Recording ---
+class Recorder:
+    """Logs one level's session; World.step()/answer() report to it via world.recorder."""
+    def __init__(self, path, level, seed):
+        self.path = path
+        self.world = None
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, level, seed, timestep.time))
+
+    def attach(self, world):
+        self.world = world
+        world.recorder = self
+
+    def step(self, keys):
+        mask = 0
+        for key, bit in KEY_BITS.items():
+            if keys[key]:
+                mask |= bit
+        self.file.write(bytes((mask,)))
+
+    def answer(self, correct):
+        self.file.write(bytes((ANSWER | bool(correct),)))
+
+    def close(self):
+        if self.world is not None:
+            self.file.write(bytes((END,)) + DIGEST.pack(state_digest(self.world)))
+            self.world.recorder = None
+        self.file.close()
+
+
+_active = None
+
+
+def start_recording(level, seed=None, directory=REPLAY_DIR):
+    """
+    Seed a new session and start its replay file (closing the previous one).
+    Call it BEFORE building the level's World, which already draws from random,
+    then attach() the World to the returned Recorder.
+    """
+    global _active
+    stop_recording()
+    seed = random.getrandbits(32) if seed is None else seed
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, time.strftime(f"level{level}_%Y%m%d_%H%M%S.rep"))
+    _active = Recorder(path, level, seed)
+    seed_session(seed)
+    return _active
+
+
+def stop_recording():
+    global _active
+    if _active is not None:
+        _active.close()
+        print(f"Replay saved to {_active.path}")
+        _active = None
+
+
+atexit.register(stop_recording)  # quitting mid-level still ends the file properly
+
+
+# --- Playback ---
+class ReplayKeys:
+    """Key state rebuilt from one step record."""
+    __slots__ = ("mask",)
+
+    def __init__(self):
+        self.mask = 0
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+def load(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, level, seed, start_time = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay file")
+    return {"level": level, "seed": seed, "start_time": start_time, "records": data[HEADER.size:]}
+
+
+def play(path, screen=None, on_tick=None):
+    """
+    Re-run a recorded session as fast as possible: every step is drawn when a
+    screen is given (no frame cap), otherwise the world runs headless.
+    Returns (world, matched); matched is None when the file has no end record
+    and False as soon as the replay stops lining up with the world.
+    """
+    replay = load(path)
+    seed_session(replay["seed"])
+    timestep.time = replay["start_time"]
+    world = WORLDS[replay["level"]]()
+    if screen is not None:
+        hud = PlayerHUD()
+        renderer.set_scene(f"level_{replay['level']}")
+
+    keys = ReplayKeys()
+    records = replay["records"]
+    for i, record in enumerate(records):
+        if record == END:
+            return world, state_digest(world) == DIGEST.unpack_from(records, i + 1)[0]
+        # An answer with no question asked (or a step while one is open) means
+        # this build no longer plays the recording the same way
+        if bool(record & ANSWER) != (world.question is not None):
+            return world, False
+        if record & ANSWER:
+            world.answer(bool(record & 1))
+            continue
+        keys.mask = record
+        world.step(keys)
+        if on_tick is not None:
+            on_tick(world)
+        if screen is not None:
+            pygame.event.pump()  # keep the window responsive
+            renderer.add(world.draw(screen))
+            renderer.add(hud.draw(screen, world.player))
+            renderer.present()
+    return world, None
@@ -0,0 +1,508 @@
+import os
+import random
+import pygame
+from entities.player import Player
+from entities.bug import Bug
+from entities.bugs_level_2 import Bug_Level_2
+from entities.bugs_level_3 import Bug_Level_3
+from entities.enemy import update_enemies, draw_enemies, check_passes
+from entities.particle import ParticleSystem
+from entities.projectiles import projectiles, PLAYER, ENEMY
+from entities.effects import ExplosionPool, Portal
+from challenges.challenge_handler import get_question                # HTML questions (Level 1)
+from challenges.challenge_handler_level2 import get_question_level2  # CSS questions (Level 2)
+from challenges.challenge_handler_level3 import get_question_level3
+from levels.level_1_boss import Level1Boss
+from levels.level_2_boss import Level2Boss
+from levels.level_3_boss import Level3Boss
+from utils import collision
+from utils.collision import find_hits, pop_sprite_hit, take_precise_checks, draw_hitboxes
+from utils.assets import load_image
+from utils.preloader import start_preload
+from utils.profiler import profiler
+from utils.quality import governor
+from utils.render import renderer
+from utils.sounds import play_correct, play_incorrect
+from utils.stars import Starfield
+from utils.timers import timers
+from utils.timestep import timestep
+
+
+class World:
+    """
+    Everything one level simulates: player, enemies, boss, bullets, effects.
+
+    step(keys) advances the level by one fixed tick and never touches the
+    window; draw(screen, alpha) is an optional observer. When a collision
+    needs a question, step() records it in `question` and the world stays
+    frozen until answer(correct) is called. `portal_reached` is set while the
+    player stands in the exit portal; the caller decides what happens next.
+    """
+    def __init__(self, width=800, height=600):
+        self.width, self.height = width, height
+        timers.clear()  # nor do cooldowns and timed behaviour
+        self.player = Player(width // 2, height - 80)
+        self.stars = Starfield(100, width, height)
+        projectiles.clear()  # bullets never carry over between levels
+        self.particles = ParticleSystem(width=width, height=height)
+        self.explosions = ExplosionPool(particles=self.particles)
+        self.enemies = []
+        self.boss = None
+        self.portal = None
+        self.boss_defeated = False
+        self.bugs_destroyed = 0
+        self.question = None
+        self.portal_reached = False
+        self.ticks = 0
+        self.recorder = None  # levels.replay.Recorder while a session is being recorded
+        self.still_bg = None  # scrolling background frozen by the quality governor
+
+    # --- Questions ---
+    def ask(self, get_question_func, on_answer, *args):
+        """Freeze the world on a question (the first one asked this tick wins)."""
+        if self.question is None:
+            self.question = (get_question_func, on_answer, args)
+
+    def answer(self, correct):
+        _, on_answer, args = self.question
+        self.question = None
+        if self.recorder is not None:
+            self.recorder.answer(correct)
+        on_answer(correct, *args)
+
+    @property
+    def game_over(self):
+        return self.player.health <= 0
+
+    # --- Question outcomes ---
+    def enemy_answered(self, correct, enemy, group, shot=True):
+        """An enemy (or boss minion, group says which list) was shot (or rammed, shot=False)."""
+        if correct:
+            play_correct()
+        else:
+            play_incorrect()
+            self.player.take_damage()
+        self.explosions.spawn(enemy.rect.centerx, enemy.rect.centery)
+        projectiles.clear(owner=enemy.owner_id)
+        if enemy in group:
+            group.remove(enemy)
+        if correct and shot:
+            self.player.get_shield_chance()
+            if group is self.enemies:
+                self.bugs_destroyed += 1
+
+    def player_answered(self, correct, boss=None):
+        if boss:
+            boss.reset_shooting_rate()
+        if correct:
+            play_correct()
+            self.player.get_shield_chance()
+        else:
+            play_incorrect()
+            self.player.take_damage()
+            self.particles.burst("hit_spark", self.player.rect.centerx, self.player.rect.centery)
+
+    def boss_hit(self, boss):
+        """Correct answer on a boss question: damage it, with sparks or a death burst."""
+        if boss.hit():
+            self.explosions.spawn(boss.rect.centerx, boss.rect.centery)
+            self.particles.burst("boss_death", boss.rect.centerx, boss.rect.centery)
+        else:
+            self.particles.burst("hit_spark", boss.rect.centerx, boss.rect.bottom)
+
+    # --- Simulation ---
+    def step(self, keys):
+        """Advance the level by one fixed tick. Does nothing while a question is pending."""
+        if self.question is not None:
+            return
+        if self.recorder is not None:
+            self.recorder.step(keys)
+        mark = profiler.mark
+        timestep.step()
+        self.ticks += 1
+        timers.run_due()
+        mark("timers")
+        self.scroll()
+        mark("scroll")
+        self.stars.update()
+        mark("stars")
+
+        self.player.handle_input(keys)
+        mark("player")
+        projectiles.update()  # every bullet in the game moves here
+        mark("bullets")
+
+        scene = self.scene_enemies()
+        update_enemies(scene)  # the only movement pass for waves and boss minions alike
+        if not self.boss and not self.boss_defeated:
+            self.step_enemies()
+        mark("enemies")
+        if self.boss:
+            self.step_boss()
+            mark("boss")
+
+        if self.portal:
+            self.portal.update()
+            self.portal_reached = self.player.rect.colliderect(self.portal.rect)
+            mark("portal")
+
+        self.explosions.update()
+        self.particles.update()
+        mark("effects")
+        profiler.count("mask tests", take_precise_checks())
+        check_passes("update", scene)
+
+    def scroll(self):
+        """Move the background (levels with a static background do nothing)."""
+
+    def scene_enemies(self):
+        """
+        Every enemy the scene moves and draws, each exactly once per frame.
+        The wave belongs to the world until the boss arrives; a boss spawns
+        and culls its own minions but never updates or draws them itself.
+        """
+        wave = self.enemies if not self.boss and not self.boss_defeated else []
+        return wave + getattr(self.boss, "minions", [])  # a new list: spawns this step wait a step
+
+    def check_wave(self, enemies, get_question_func):
+        """One collision pass over a wave; a hit (or ram) asks one question."""
+        hits = find_hits(self.player, enemies, projectiles)
+        for enemy in enemies:
+            if self.question is not None:
+                break
+            if enemy in hits.rammed or enemy in hits.shot:
+                self.ask(get_question_func, self.enemy_answered, enemy, enemies)
+                for slot in hits.shot.get(enemy, ()):
+                    projectiles.kill(slot)
+            elif enemy.owner_id in hits.player_hit:
+                projectiles.kill(hits.player_hit[enemy.owner_id][0])
+                self.ask(get_question_func, self.player_answered)
+
+    def clear_wave(self):
+        """Blow up the remaining wave before the boss arrives."""
+        for enemy in self.enemies:
+            self.explosions.spawn(enemy.rect.centerx, enemy.rect.centery)
+        self.enemies.clear()
+        projectiles.clear(team=ENEMY)
+
+    # --- Render (optional observer) ---
+    def draw(self, screen, alpha=1.0):
+        """Draw the world (no HUD); returns the screen areas touched."""
+        mark = profiler.mark
+        scene = self.scene_enemies()
+        drawn = []
+        add = drawn.append
+        add(self.draw_background(screen))
+        mark("draw bg")
+        add(self.stars.draw(screen, alpha))
+        mark("draw stars")
+        if self.boss:
+            add(self.draw_boss(screen, alpha))
+        add(draw_enemies(screen, scene, alpha))
+        if self.portal:
+            add(self.portal.draw(screen))
+        add(projectiles.draw(screen, alpha))
+        mark("draw sprites")
+        add(self.explosions.draw(screen))
+        add(self.particles.draw(screen))
+        mark("draw effects")
+        add(self.player.draw(screen))
+        if collision.show_hitboxes:
+            add(draw_hitboxes(screen, self.debug_boxes()))
+        mark("draw player")
+        check_passes("draw", scene)
+
+        # Flatten to one list of Rects (draw calls return a Rect, a list or None)
+        rects = []
+        for item in drawn:
+            if isinstance(item, pygame.Rect):
+                rects.append(item)
+            elif item:
+                rects.extend(r for r in item if r)
+        return rects
+
+    def draw_boss(self, screen, alpha):
+        return self.boss.draw(screen)
+
+    def draw_scrolling(self, screen, tops):
+        """
+        Paint a scrolling background: self.bg once per y in `tops`. While the
+        quality governor sheds the repaint, the background holds still and the
+        scene presents dirty rects, so only what moved over it is repainted.
+        """
+        if governor.still_background:
+            if self.still_bg is None:
+                self.still_bg = pygame.Surface((self.width, self.height))
+                for y in tops:
+                    self.still_bg.blit(self.bg, (0, y))
+            if renderer.mode != "dirty":
+                renderer.set_mode("dirty")
+            renderer.restore(screen, self.still_bg)
+            return None
+        if self.still_bg is not None:
+            self.still_bg = None
+            renderer.set_mode("full")  # scrolling touches every pixel again
+        return [screen.blit(self.bg, (0, y)) for y in tops]
+
+    def debug_boxes(self):
+        boxes = [self.player.rect] + [enemy.rect for enemy in self.scene_enemies()]
+        if self.boss:
+            boxes.append(self.boss.rect)
+        return boxes
+
+
+# --- Level 1: HTML questions ---
+class Level1World(World):
+    def __init__(self, width=800, height=600):
+        super().__init__(width, height)
+        self.bg = load_image("assets/images/space.png", (width, height), alpha=False)
+        self.bg_y1, self.bg_y2, self.bg_speed = 0, -height, 2
+        Bug.preload()
+        self.enemies = [Bug(random.randint(50, width - 50), random.randint(-300, -50), random.random() < 0.4)
+                        for _ in range(6)]
+
+    def scroll(self):
+        self.bg_y1 += self.bg_speed
+        self.bg_y2 += self.bg_speed
+        if self.bg_y1 >= self.height: self.bg_y1 = -self.height
+        if self.bg_y2 >= self.height: self.bg_y2 = -self.height
+
+    def draw_background(self, screen):
+        return self.draw_scrolling(screen, (self.bg_y1, self.bg_y2))
+
+    def step_enemies(self):
+        self.check_wave(self.enemies, get_question)
+
+        if self.bugs_destroyed >= 3 and self.boss is None:
+            self.clear_wave()
+            self.boss = Level1Boss(self.width, self.height)
+            self.bugs_destroyed = 0
+            start_preload(2)
+
+    def step_boss(self):
+        boss = self.boss
+        boss.update(self.player.rect)
+        if boss.victory:
+            if not self.portal:
+                self.portal = Portal(boss.rect.centerx, boss.rect.bottom)
+            projectiles.clear(owner=boss.owner_id)
+            self.boss = None
+            return
+        player = self.player
+        if self.question is None and pop_sprite_hit(projectiles, player.image, player.rect, ENEMY, boss.owner_id):
+            self.ask(get_question, self.boss_fire_answered, boss)
+        if self.question is None and pop_sprite_hit(projectiles, boss.image, boss.rect, PLAYER):
+            self.ask(get_question, self.boss_answered, boss)
+
+    def boss_fire_answered(self, correct, boss):
+        boss.reset_shooting_rate()
+        if correct:
+            play_correct()
+        else:
+            play_incorrect()
+            self.player.take_damage()
+
+    def boss_answered(self, correct, boss):
+        boss.reset_shooting_rate()
+        if correct:
+            play_correct()
+            self.boss_hit(boss)
+        else:
+            play_incorrect()
+
+
+# --- Level 2: CSS questions, static background ---
+class Level2World(World):
+    def __init__(self, width=800, height=600):
+        super().__init__(width, height)
+        try:
+            self.bg = load_image("assets/images/menu/menu_background/level_2_map.jpg", (width, height), alpha=False)
+        except Exception:
+            self.bg = pygame.Surface((width, height))
+            self.bg.fill((20, 20, 60))
+        Bug_Level_2.preload()
+        self.enemies = [Bug_Level_2(random.randint(50, width - 50), random.randint(-300, -50)) for _ in range(6)]
+
+    def draw_background(self, screen):
+        # Dirty-rect scene: only repaint where something was drawn last frame
+        renderer.restore(screen, self.bg)
+
+    def step_enemies(self):
+        self.check_wave(self.enemies, get_question_level2)
+
+        # --- Random respawn of small bugs before boss only ---
+        if len(self.enemies) < 4 and random.random() < 0.02:
+            self.enemies.append(Bug_Level_2(random.randint(50, self.width - 50), random.randint(-150, -50)))
+
+        # --- Spawn boss after 5 kills ---
+        if self.bugs_destroyed >= 5 and not self.boss:
+            self.clear_wave()
+            pygame.mixer.music.stop()
+            self.boss = Level2Boss(self.width, self.height)
+            self.bugs_destroyed = 0
+            start_preload(3)
+
+    def step_boss(self):
+        boss = self.boss
+        boss.update(self.player.rect)
+
+        # --- Minions (moved with the wave in step()) ---
+        self.check_wave(boss.minions, get_question_level2)
+
+        # --- Boss bullets ---
+        player = self.player
+        if self.question is None and pop_sprite_hit(projectiles, player.image, player.rect, ENEMY, boss.owner_id):
+            self.ask(get_question_level2, self.player_answered, boss)
+
+        # --- Player bullets hitting boss ---
+        if self.question is None and boss.alive and pop_sprite_hit(projectiles, boss.image, boss.rect, PLAYER):
+            self.ask(get_question_level2, self.boss_answered, boss)
+
+        # --- Victory: boss dead, spawn portal ---
+        if boss.victory:
+            boss.stop_boss_sound()
+            pygame.mixer.music.fadeout(1000)
+            for m in boss.minions:
+                self.explosions.spawn(m.rect.centerx, m.rect.centery)
+            boss.minions.clear()
+            projectiles.clear(team=ENEMY)
+
+            boss.alive = False
+            boss.victory = False
+            boss.dying = False
+            self.boss_defeated = True  # <-- prevent respawn
+
+            if not self.portal:
+                self.portal = Portal(self.width // 2, self.height // 2)
+                print("Portal spawned at center:", self.portal.rect.center)
+            self.boss = None
+
+    def boss_answered(self, correct, boss):
+        boss.reset_shooting_rate()
+        if correct:
+            play_correct()
+            self.boss_hit(boss)
+        else:
+            play_incorrect()
+            self.player.take_damage()
+
+
+# --- Level 3: scrolling background, laser boss ---
+class Level3World(World):
+    def __init__(self, width=800, height=600):
+        super().__init__(width, height)
+        try:
+            self.bg = load_image("assets/images/menu/menu_background/level_3_map.png", (width, height), alpha=False)
+        except Exception:
+            self.bg = pygame.Surface((width, height))
+            self.bg.fill((30, 30, 60))
+        self.scroll_speed = 2
+        self.bg_y = 0
+        Bug_Level_3.preload()
+        self.enemies = [Bug_Level_3(random.randint(80, width - 80), random.randint(-250, -100)) for _ in range(6)]
+
+    def scroll(self):
+        self.bg_y = (self.bg_y + self.scroll_speed) % self.height
+
+    def draw_background(self, screen):
+        return self.draw_scrolling(screen, (self.bg_y - self.height, self.bg_y))
+
+    def step_enemies(self):
+        # A shot wins over a bullet hit, which wins over a ram
+        hits = find_hits(self.player, self.enemies, projectiles)
+        for enemy in self.enemies:
+            if self.question is not None:
+                break
+            shot = hits.first_shot(enemy)
+            if shot >= 0:
+                projectiles.kill(shot)
+                self.ask(get_question_level3, self.enemy_answered, enemy, self.enemies, True)
+            elif enemy.owner_id in hits.player_hit:
+                projectiles.kill(hits.player_hit[enemy.owner_id][0])
+                self.ask(get_question_level3, self.player_answered)
+            elif enemy in hits.rammed:
+                self.ask(get_question_level3, self.enemy_answered, enemy, self.enemies, False)
+
+        # Respawn enemies if below threshold
+        if len(self.enemies) < 5 and random.random() < 0.02:
+            self.enemies.append(Bug_Level_3(random.randint(50, self.width - 50), random.randint(-200, -50)))
+
+        # --- Spawn Boss after 8 enemies killed ---
+        if self.bugs_destroyed >= 8 and not self.boss:
+            self.clear_wave()
+            pygame.mixer.music.fadeout(1000)
+            self.boss = Level3Boss(self.width, self.height)
+            self.bugs_destroyed = 0
+
+    def step_boss(self):
+        boss = self.boss
+        boss.update(self.player.rect)
+
+        # Boss laser collision
+        if self.question is None and boss.check_laser_hit(self.player.image, self.player.rect):
+            self.ask(get_question_level3, self.player_answered)
+
+        # Player bullets hitting boss
+        if self.question is None and pop_sprite_hit(projectiles, boss.image, boss.rect, PLAYER):
+            self.ask(get_question_level3, self.boss_answered, boss)
+
+        if boss.victory:
+            pygame.mixer.music.stop()
+            self.boss_defeated = True
+            self.boss = None
+            self.portal = Portal(self.width // 2, self.height // 2)
+            print("Level 3 Boss defeated — portal spawned!")
+
+    def boss_answered(self, correct, boss):
+        if correct:
+            play_correct()
+            self.boss_hit(boss)
+        else:
+            play_incorrect()
+            self.player.take_damage()
+
+
+WORLDS = {1: Level1World, 2: Level2World, 3: Level3World}
+
+
+# --- Headless runs (soak tests, balancing, benchmarks) ---
+class AutopilotKeys:
+    """Key state for headless runs: fire constantly and strafe back and forth."""
+    def __init__(self, strafe_ticks=90):
+        self.strafe_ticks = strafe_ticks
+        self.tick = 0
+
+    def __getitem__(self, key):
+        left = (self.tick // self.strafe_ticks) % 2
+        return key == pygame.K_SPACE or (key == pygame.K_a and left) or (key == pygame.K_d and not left)
+
+
+def init_headless():
+    """Initialise pygame without a window (SDL dummy drivers); safe to call twice."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+
+def run_headless(level, ticks, answer=None, keys=None, on_tick=None):
+    """
+    Simulate `level` for up to `ticks` fixed steps with no rendering.
+    Questions are answered by answer() (default: right 80% of the time).
+    Stops early on game over or when the player reaches the exit portal.
+    Returns the World so callers can inspect its final state.
+    """
+    init_headless()
+    answer = answer or (lambda: random.random() < 0.8)
+    keys = keys or AutopilotKeys()
+    world = WORLDS[level]()
+    for tick in range(ticks):
+        if hasattr(keys, "tick"):
+            keys.tick = tick
+        world.step(keys)
+        if world.question is not None:
+            world.answer(answer())
+        if on_tick is not None:
+            on_tick(world)
+        if world.game_over or world.portal_reached:
+            break
+    return world
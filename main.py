@@ -1,869 +1,284 @@
-import pygame
-import random
-import sys
 import os
-from entities.player import Player
-from entities.bug import Bug
-from challenges.challenge_draw import ask_question
-from challenges.challenge_handler import get_question               # HTML questions (Level 1)
-from challenges.challenge_handler_level2 import get_question_level2  # CSS questions (Level 2)
+import sys
+
+# --- Command line ---
+# --record                     save a replay file of every level played
+# --replay FILE [--headless]   re-run a replay at full speed and check it matches
+# --audit                      assert every enemy is updated and drawn once per frame
+RECORD = "--record" in sys.argv
+AUDIT = "--audit" in sys.argv
+HEADLESS = "--headless" in sys.argv
+if HEADLESS:  # before pygame and the mixer start up
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from entities.effects import load_explosion_frames
+from challenges.challenge_draw import QuestionModal
 from utils.colors import BLACK
-from utils.sounds import play_correct, play_incorrect
-from utils.stars import Star
-from menu.menu import menu_loop, pause_menu
-from levels.level_1_boss import Level1Boss
+from utils.sounds import preload as preload_sounds
+from utils.preloader import start_preload, finish_preload
+from utils.hud import PlayerHUD
+from utils.text import get_font, render_text
+from utils.render import renderer
+from utils.timestep import timestep
+from utils.collision import toggle_hitboxes
+from utils.profiler import profiler, toggle_profiler
+from utils.scenes import Scene, SceneStack, Fade
+from menu.menu import MainMenu, PauseMenu
+from levels.world import Level1World, Level2World, Level3World
+from levels.replay import start_recording, play
+from entities.enemy import set_pass_audit
 
 # --- Pygame setup ---
 pygame.init()
 WIDTH, HEIGHT = 800, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("CodeSpire")
-clock = pygame.time.Clock()
-FPS = 60
+stack = SceneStack()  # owns the frame loop: pacing, events, profiling, present
 
 
-def draw_ui(screen, player):
-    """Draw player health bar and shield icon."""
-    font = pygame.font.Font(None, 32)
-    health_text = font.render(f"Health: {player.health}/{player.max_health}", True, (255, 0, 0))
-    screen.blit(health_text, (10, 10))
-
-    bar_width, bar_height = 150, 20
-    fill = (player.health / player.max_health) * bar_width
-    pygame.draw.rect(screen, (255, 0, 0), (10, 40, fill, bar_height))
-    pygame.draw.rect(screen, (255, 255, 255), (10, 40, bar_width, bar_height), 2)
-    
-
-
-    if player.has_shield:
-        player.draw_shield_icon(screen)
-
-
-def game_over_screen(screen):
-    """Show game over screen."""
-    screen.fill(BLACK)
-    font_large = pygame.font.Font(None, 72)
-    font_medium = pygame.font.Font(None, 36)
-    game_over_text = font_large.render("GAME OVER", True, (255, 0, 0))
-    retry_text = font_medium.render("Press R to Retry or Q to Quit", True, (255, 255, 255))
-    screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 50))
-    screen.blit(retry_text, (WIDTH // 2 - retry_text.get_width() // 2, HEIGHT // 2 + 50))
-    pygame.display.flip()
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    return "retry"
-                elif event.key == pygame.K_q:
-                    return "quit"
-                
-
-class Explosion:
-    """Explosion animation."""
-    def __init__(self, x, y):
-        self.frames = [
-            pygame.transform.scale(
-                pygame.image.load(f"assets/images/Explosions/Explosion3_{i}.png").convert_alpha(), (100, 100)
-            )
-            for i in range(1, 12)
-        ]
-        self.index = 0
-        self.image = self.frames[self.index]
-        self.rect = self.image.get_rect(center=(x, y))
-        self.last_update = pygame.time.get_ticks()
-        self.animation_speed = 50
-        self.finished = False
+player_hud = PlayerHUD()
 
-    def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed:
-            self.last_update = now
-            self.index += 1
-            if self.index >= len(self.frames):
-                self.finished = True
-            else:
-                self.image = self.frames[self.index]
 
-    def draw(self, screen):
-        if not self.finished:
-            screen.blit(self.image, self.rect)
-
-
-class Portal:
-    """Animated portal that appears after boss death."""
-    def __init__(self, x, y):
-        self.frames = []
-        folder = "assets/images/portal_2"
-        if os.path.exists(folder):
-            files = sorted(f for f in os.listdir(folder) if f.lower().endswith(".png"))
-            for filename in files:
-                path = os.path.join(folder, filename)
-                try:
-                    frame = pygame.image.load(path).convert_alpha()
-                    frame = pygame.transform.scale(frame, (200, 200))
-                    self.frames.append(frame)
-                except Exception:
-                    pass
-
-        if not self.frames:
-            surf = pygame.Surface((200, 200), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (100, 0, 200, 200), (100, 100), 90)
-            self.frames = [surf]
-
-        self.index = 0
-        self.image = self.frames[self.index]
-        self.rect = self.image.get_rect(center=(x, y))
-        self.last_update = pygame.time.get_ticks()
-        self.animation_speed = 80
+def draw_ui(screen, player):
+    """Draw player health bar and shield icon (re-rendered only when they change)."""
+    return player_hud.draw(screen, player)
 
-    def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed:
-            self.last_update = now
-            self.index = (self.index + 1) % len(self.frames)
-            self.image = self.frames[self.index]
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+if AUDIT:
+    set_pass_audit()
 
+load_explosion_frames()  # decode once at startup, before any level runs
+preload_sounds()
+start_preload(1)  # decode Level 1 in the background while the menu is up
 
-def prompt_confirm(screen, prompt_text="Proceed to level 2? press (Y) to confirm"):
-    """Display a simple Y/N prompt. Return True for Y, False for N."""
-    font = pygame.font.Font(None, 36)
-    small = pygame.font.Font(None, 28)
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.set_alpha(180)
-    overlay.fill((0, 0, 0))
 
-    prompt_surf = font.render(prompt_text, True, (255, 255, 255))
-    hint = small.render("Press Y to confirm", True, (200, 200, 200))
+def start_game():
+    stack.replace(LevelScene(1))
 
-    while True:
-        clock.tick(FPS)
-        for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if ev.type == pygame.KEYDOWN:
-                if ev.key == pygame.K_y:
-                    return True
-                if ev.key == pygame.K_n:
-                    return False
 
-        screen.blit(overlay, (0, 0))
-        screen.blit(prompt_surf, (WIDTH // 2 - prompt_surf.get_width() // 2, HEIGHT // 2 - 30))
-        screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 20))
-        pygame.display.flip()
+def to_menu():
+    stack.replace(MainMenu(start_game))
 
 
-def fade_out(screen, duration=800):
-    """Fade out to black."""
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    start = pygame.time.get_ticks()
-    while True:
-        now = pygame.time.get_ticks()
-        t = now - start
-        if t >= duration:
-            overlay.set_alpha(255)
-            screen.blit(overlay, (0, 0))
-            pygame.display.flip()
-            break
-        alpha = int(255 * (t / duration))
-        overlay.set_alpha(alpha)
-        screen.blit(overlay, (0, 0))
-        pygame.display.flip()
-        clock.tick(FPS)
+class GameOver(Scene):
+    """Game over screen: R returns to the menu, Q quits."""
+    render_scene = "game_over"
 
+    def __init__(self):
+        super().__init__()
+        self.drawn = False
 
-def fade_in(screen, duration=800):
-    """Fade from black to scene."""
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    start = pygame.time.get_ticks()
-    while True:
-        now = pygame.time.get_ticks()
-        t = now - start
-        if t >= duration:
-            break
-        alpha = int(255 * (1 - (t / duration)))
-        overlay.set_alpha(alpha)
-        screen.blit(overlay, (0, 0))
-        pygame.display.flip()
-        clock.tick(FPS)
-
-
-def transition_to_level_2(screen):
-    """Transition animation for Level 2."""
-    try:
-        map_img = pygame.image.load("assets/images/menu/menu_background/level_2_map.jpg").convert()
-        map_img = pygame.transform.scale(map_img, (WIDTH, HEIGHT))
-    except Exception:
-        map_img = pygame.Surface((WIDTH, HEIGHT))
-        map_img.fill((10, 10, 40))
-
-    scroll_speed = 1
-    map_y = 0
-    transition_start = pygame.time.get_ticks()
-    fade_out(screen, duration=700)
-
-    while True:
-        clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                to_menu()
+            elif event.key == pygame.K_q:
                 pygame.quit()
                 sys.exit()
 
-        map_y = (map_y + scroll_speed) % HEIGHT
-        screen.blit(map_img, (0, map_y - HEIGHT))
-        screen.blit(map_img, (0, map_y))
-        pygame.display.flip()
-
-        if pygame.time.get_ticks() - transition_start > 2500:
-            break
-
-    fade_in(screen, duration=700)
-    return
-
-def transition_to_level_3(screen):
-    """Transition animation for Level 3."""
-    try:
-        map_img = pygame.image.load("assets/images/menu/menu_background/level_3_map.png").convert()
-        map_img = pygame.transform.scale(map_img, (WIDTH, HEIGHT))
-    except Exception:
-        map_img = pygame.Surface((WIDTH, HEIGHT))
-        map_img.fill((20, 20, 80))  # fallback color
-
-    scroll_speed = 1
-    map_y = 0
-    transition_start = pygame.time.get_ticks()
-    fade_out(screen, duration=700)
-
-    while True:
-        clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    def draw(self, screen):
+        if self.drawn:
+            return None
+        self.drawn = True
+        screen.fill(BLACK)
+        font_large = get_font(None, 72)
+        font_medium = get_font(None, 36)
+        game_over_text = render_text(font_large, "GAME OVER", (255, 0, 0))
+        retry_text = render_text(font_medium, "Press R to Retry or Q to Quit", (255, 255, 255))
+        screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 50))
+        screen.blit(retry_text, (WIDTH // 2 - retry_text.get_width() // 2, HEIGHT // 2 + 50))
+        return screen.get_rect()
+
+
+class Prompt(Scene):
+    """Simple Y/N prompt over the frozen frame. Closes with True for Y, False for N."""
+    render_scene = "prompt"
+    underlay = "snapshot"
+
+    def __init__(self, prompt_text="Proceed to level 2? press (Y) to confirm"):
+        super().__init__()
+        self.prompt_text = prompt_text
+        self.drawn = False
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_y:
+                self.close(True)
+            elif event.key == pygame.K_n:
+                self.close(False)
 
-        map_y = (map_y + scroll_speed) % HEIGHT
-        screen.blit(map_img, (0, map_y - HEIGHT))
-        screen.blit(map_img, (0, map_y))
-        pygame.display.flip()
-
-        if pygame.time.get_ticks() - transition_start > 2500:
-            break
-
-    fade_in(screen, duration=700)
-    return
-
-
-
-def level_3_loop(screen):
-    """Playable Level 3 — player + Bug_Level_3 enemies + boss fight + quiz logic."""
-    from entities.bugs_level_3 import Bug_Level_3
-    from challenges.challenge_handler_level3 import get_question_level3
-    from levels.level_3_boss import Level3Boss
-
-    # --- Load background music ---
-    try:
-        pygame.mixer.music.load("assets/sounds/level3backgroundmusic.mp3")
-        pygame.mixer.music.set_volume(0.35)
-        pygame.mixer.music.play(-1)
-    except Exception:
-        pass
-
-    # --- Load background ---
-    try:
-        bg = pygame.image.load("assets/images/menu/menu_background/level_3_map.png").convert()
-        bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-    except Exception:
-        bg = pygame.Surface((WIDTH, HEIGHT))
-        bg.fill((30, 30, 60))
-
-    # --- Setup ---
-    player = Player(WIDTH // 2, HEIGHT - 80)
-    stars = [Star() for _ in range(100)]
-    enemies = [Bug_Level_3(random.randint(80, WIDTH - 80), random.randint(-250, -100)) for _ in range(6)]
-    explosions = []
-    boss = None
-    portal = None
-    boss_defeated = False
-    bugs_destroyed = 0
-
-    scroll_speed = 2
-    bg_y = 0
-
-    fade_in(screen, duration=600)
-    running = True
-
-    while running:
-        clock.tick(FPS)
-
-        # --- Events ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-        # --- Background ---
-        bg_y = (bg_y + scroll_speed) % HEIGHT
-        screen.blit(bg, (0, bg_y - HEIGHT))
-        screen.blit(bg, (0, bg_y))
-        for star in stars:
-            star.update()
-            star.draw(screen)
-
-        # --- Player Movement ---
-        keys = pygame.key.get_pressed()
-        player.handle_input(keys)
-        player.update()
-
-        # --- Enemy Phase (before boss) ---
-        if not boss and not boss_defeated:
-            for enemy in enemies[:]:
-                enemy.update()
-                enemy.draw(screen)
-
-                # Check collisions
-                for bullet in player.bullets[:]:
-                    if bullet["rect"].colliderect(enemy.rect):
-                        player.bullets.remove(bullet)
-                        correct = ask_question(screen, get_question_level3)
-                        if correct:
-                            play_correct()
-                            explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                            enemies.remove(enemy)
-                            player.get_shield_chance()
-                            bugs_destroyed += 1
-                        else:
-                            play_incorrect()
-                            explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                            player.take_damage()
-                            enemies.remove(enemy)
-                        break
-                    # --- Enemy bullets hitting player ---
-                for e_bullet in enemy.bullets[:]:
-                    if player.rect.colliderect(e_bullet):
-                        enemy.bullets.remove(e_bullet)
-                        correct = ask_question(screen, get_question_level3)
-                        if correct:
-                            play_correct()
-                            player.get_shield_chance()
-                        else:
-                            play_incorrect()
-                            player.take_damage()
-
-                # Player collision with enemy
-                if player.rect.colliderect(enemy.rect):
-                    correct = ask_question(screen, get_question_level3)
-                    if correct:
-                        play_correct()
-                        explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                        enemies.remove(enemy)
-                    else:
-                        play_incorrect()
-                        player.take_damage()
-                        explosions.append(Explosion(enemy.rect.centerx, enemy.rect.centery))
-                        enemies.remove(enemy)
-
-            # Respawn enemies if below threshold
-            if len(enemies) < 5 and random.random() < 0.02:
-                enemies.append(Bug_Level_3(random.randint(50, WIDTH - 50), random.randint(-200, -50)))
-
-            # --- Spawn Boss after 8 enemies killed ---
-            if bugs_destroyed >= 8 and not boss:
-                for e in enemies[:]:
-                    explosions.append(Explosion(e.rect.centerx, e.rect.centery))
-                    enemies.remove(e)
-
-                pygame.mixer.music.fadeout(1000)
-                boss = Level3Boss(WIDTH, HEIGHT)
-                bugs_destroyed = 0
-
-        # --- Boss Phase ---
-        if boss:
-            boss.update(player.rect)
-            boss.draw(screen)
-
-            # Boss laser collision
-            if boss.check_laser_hit(player.rect):  # <-- use boss’s safe check
-                correct = ask_question(screen, get_question_level3)
-                if correct:
-                    play_correct()
-                    player.get_shield_chance()
-                else:
-                    play_incorrect()
-                    player.take_damage()
-
-            # Player bullets hitting boss
-            for bullet in player.bullets[:]:
-                if boss.rect.colliderect(bullet["rect"]):
-                    player.bullets.remove(bullet)
-                    correct = ask_question(screen, get_question_level3)
-                    if correct:
-                        play_correct()
-                        hit = boss.hit()
-                        if hit:
-                            explosions.append(Explosion(boss.rect.centerx, boss.rect.centery))
-                    else:
-                        play_incorrect()
-                        player.take_damage()
-
-            # If boss defeated
-            if boss.victory:
-                pygame.mixer.music.stop()
-                boss_defeated = True
-                boss = None
-                portal = Portal(WIDTH // 2, HEIGHT // 2)
-                print("Level 3 Boss defeated — portal spawned!")
-
-        # --- Portal Interaction ---
-        if portal:
-            portal.update()
-            portal.draw(screen)
-            if player.rect.colliderect(portal.rect):
-                proceed = prompt_confirm(screen, "Congratulations! Proceed to Ending? press (Y) to confirm")
-                if proceed:
-                    pygame.mixer.music.fadeout(600)
-                    fade_out(screen, duration=600)
-                    return "ending"
-
-        # --- Explosions ---
-        for exp in explosions[:]:
-            exp.update()
-            exp.draw(screen)
-            if exp.finished:
-                explosions.remove(exp)
-
-        # --- Draw Player + UI ---
-        player.draw(screen)
-        draw_ui(screen, player)
-        pygame.display.flip()
+    def draw(self, screen):
+        # --- Static overlay: drawn and pushed once, then nothing changes until a key ---
+        if self.drawn:
+            return None
+        self.drawn = True
+        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay.set_alpha(180)
+        overlay.fill((0, 0, 0))
+        prompt_surf = render_text(get_font(None, 36), self.prompt_text, (255, 255, 255))
+        hint = render_text(get_font(None, 28), "Press Y to confirm", (200, 200, 200))
+        screen.blit(overlay, (0, 0))
+        screen.blit(prompt_surf, (WIDTH // 2 - prompt_surf.get_width() // 2, HEIGHT // 2 - 30))
+        screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 20))
+        return screen.get_rect()
+
+
+# --- Levels ---
+# What the levels do differently outside their World: music, fades, the
+# portal prompt and where the portal leads (None = back to the menu).
+LEVELS = {
+    1: {"world": Level1World, "music": ("assets/sounds/space_bg.mp3", 0.3), "fade_in": None,
+        "prompt": "Proceed to level 2? press (Y) to confirm", "fade_out": 600, "next": 2},
+    2: {"world": Level2World, "music": ("assets/sounds/level2backgroundmusic.mp3", 0.3), "fade_in": None,
+        "prompt": "Proceed to level 3? press (Y) to confirm", "fade_out": None, "next": 3},
+    3: {"world": Level3World, "music": ("assets/sounds/level3backgroundmusic.mp3", 0.35), "fade_in": 600,
+        "prompt": "Congratulations! Proceed to Ending? press (Y) to confirm", "fade_out": 600, "next": None},
+}
+
+
+def dump_profile():
+    """F4: write the profiler's samples to CSV (only if it has collected any)."""
+    if profiler.samples:
+        print(f"Profiler samples written to {profiler.dump_csv()}")
+
+
+def run_steps(world):
+    """Run the fixed simulation steps owed for the real time since the last frame."""
+    keys = pygame.key.get_pressed()
+    for _ in range(timestep.advance()):
+        world.step(keys)
+        if world.question is not None or world.portal_reached:
+            break  # a question or the portal prompt freezes the world mid-frame
+
+
+class LevelScene(Scene):
+    """A playable level: its World, the HUD, the question modal and the level's music."""
+    def __init__(self, level):
+        super().__init__()
+        self.level = level
+        self.settings = LEVELS[level]
+        self.render_scene = f"level_{level}"
+        self.world = None
+        self.modal = QuestionModal()
+
+    def enter(self):
+        # --- Load background music ---
+        path, volume = self.settings["music"]
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)
+        except Exception:
+            pass
+
+        # --- Setup (assets were decoded in the background during the previous level) ---
+        finish_preload(self.level)
+        recording = start_recording(self.level) if RECORD else None  # seeds the session, so before the World
+        self.world = self.settings["world"](WIDTH, HEIGHT)
+        if recording:
+            recording.attach(self.world)
+        timestep.reset()
+        if self.settings["fade_in"]:
+            self.stack.push(Fade(self.settings["fade_in"], fade_in=True))
+
+    def resume(self):
+        timestep.reset()  # time spent under a menu, prompt or fade is not game time
+
+    def stop_sounds(self):
+        if self.world.boss and hasattr(self.world.boss, "stop_boss_sound"):
+            self.world.boss.stop_boss_sound()
+        pygame.mixer.music.stop()
+
+    # --- Input ---
+    def handle_event(self, event):
+        if self.modal.handle_event(event):
+            if not self.modal.active:
+                renderer.invalidate()  # the dimmed backdrop must be painted over
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.stack.push(PauseMenu(), on_close=self.paused)
+            elif event.key == pygame.K_F2:
+                toggle_hitboxes()
+            elif event.key == pygame.K_F3:
+                toggle_profiler()
+            elif event.key == pygame.K_F4:
+                dump_profile()
+
+    def paused(self, choice):
+        if choice == "quit_to_menu":
+            self.stop_sounds()
+            to_menu()
+
+    # --- Simulation ---
+    def update(self):
+        # --- Question open: the world stays frozen, only the prompt is drawn ---
+        if self.modal.active:
+            timestep.reset()
+            return
+
+        run_steps(self.world)
 
         # --- Player Death ---
-        if player.health <= 0:
-            return game_over_screen(screen)
-
-    fade_out(screen, duration=600)
-
-def level_2_loop(screen):
-    """Level 2 loop — CSS questions."""
-    from entities.bugs_level_2 import Bug_Level_2
-    from levels.level_2_boss import Level2Boss  
-
-    try:
-        pygame.mixer.music.load("assets/sounds/level2backgroundmusic.mp3")
-        pygame.mixer.music.set_volume(0.3)
-        pygame.mixer.music.play(-1)
-    except Exception:
-        pass
-
-    try:
-        bg = pygame.image.load("assets/images/menu/menu_background/level_2_map.jpg").convert()
-        bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-    except Exception:
-        bg = pygame.Surface((WIDTH, HEIGHT))
-        bg.fill((20, 20, 60))
-
-    player = Player(WIDTH // 2, HEIGHT - 80)
-    stars = [Star() for _ in range(100)]
-    explosions = []
-    bugs = [Bug_Level_2(random.randint(50, WIDTH - 50), random.randint(-300, -50)) for _ in range(6)]
-    bugs_destroyed = 0
-    boss = None
-    portal = None
-    boss_defeated = False  
-    running = True
-
-    while running:
-        clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                choice = pause_menu(screen)
-                if choice == "quit_to_menu":
-                    if boss:
-                        boss.stop_boss_sound()
-                    pygame.mixer.music.stop()
-                    return
-
-        if player.health <= 0:
-            if boss:
-                boss.stop_boss_sound()
-            pygame.mixer.music.stop()
-            return game_over_screen(screen)
-
-        # --- Background ---
-        screen.blit(bg, (0, 0))
-        for star in stars:
-            star.update()
-            star.draw(screen)
-
-        keys = pygame.key.get_pressed()
-        player.handle_input(keys)
-        player.update()
-
-        # --- Normal bug section ---
-        if not boss and not boss_defeated: 
-            for bug in bugs[:]:
-                bug.update()
-                bug.draw(screen)
-
-                player_hitbox = player.rect.inflate(-player.rect.width * 0.4, -player.rect.height * 0.4)
-                bug_hitbox = bug.rect.inflate(-bug.rect.width * 0.4, -bug.rect.height * 0.4)
-
-                player_hit = bug_hitbox.colliderect(player_hitbox)
-                bullet_hit = any(bug_hitbox.colliderect(b["rect"]) for b in player.bullets)
-
-                if player_hit or bullet_hit:
-                    correct = ask_question(screen, get_question_level2)
-                    if correct:
-                        play_correct()
-                        explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                        bugs.remove(bug)
-                        player.get_shield_chance()
-                        bugs_destroyed += 1
-                    else:
-                        play_incorrect()
-                        explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                        player.take_damage()
-                        bugs.remove(bug)
-                    for b in player.bullets[:]:
-                        if bug_hitbox.colliderect(b["rect"]):
-                            player.bullets.remove(b)
-
-                for b_bullet in bug.bullets[:]:
-                    if player_hitbox.colliderect(b_bullet):
-                        bug.bullets.remove(b_bullet)
-                        correct = ask_question(screen, get_question_level2)
-                        if correct:
-                            play_correct()
-                            player.get_shield_chance()
-                        else:
-                            play_incorrect()
-                            player.take_damage()
-
-            # --- Random respawn of small bugs before boss only ---
-            if len(bugs) < 4 and random.random() < 0.02:
-                bugs.append(Bug_Level_2(random.randint(50, WIDTH - 50), random.randint(-150, -50)))
-
-            # --- Spawn boss after 5 kills ---
-            if bugs_destroyed >= 5 and not boss:
-                for bug in bugs[:]:
-                    explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                    bugs.remove(bug)
-
-                pygame.mixer.music.stop()
-                boss = Level2Boss(WIDTH, HEIGHT)
-                bugs_destroyed = 0
-
-        # --- Boss fight ---
-        if boss:
-            boss.update(player.rect)
-            boss.draw(screen)
-
-            # --- Handle minions ---
-            for minion in boss.minions[:]:
-                minion.update()
-                minion.draw(screen)
-
-                player_hitbox = player.rect.inflate(-player.rect.width * 0.4, -player.rect.height * 0.4)
-                minion_hitbox = minion.rect.inflate(-minion.rect.width * 0.4, -minion.rect.height * 0.4)
-
-                player_hit = minion_hitbox.colliderect(player_hitbox)
-                bullet_hit = any(minion_hitbox.colliderect(b["rect"]) for b in player.bullets)
-
-                if player_hit or bullet_hit:
-                    correct = ask_question(screen, get_question_level2)
-                    if correct:
-                        play_correct()
-                        explosions.append(Explosion(minion.rect.centerx, minion.rect.centery))
-                        boss.minions.remove(minion)
-                        player.get_shield_chance()
-                    else:
-                        play_incorrect()
-                        explosions.append(Explosion(minion.rect.centerx, minion.rect.centery))
-                        player.take_damage()
-                        boss.minions.remove(minion)
-                    for b in player.bullets[:]:
-                        if minion_hitbox.colliderect(b["rect"]):
-                            player.bullets.remove(b)
-
-                for b_bullet in minion.bullets[:]:
-                    if player_hitbox.colliderect(b_bullet):
-                        minion.bullets.remove(b_bullet)
-                        correct = ask_question(screen, get_question_level2)
-                        if correct:
-                            play_correct()
-                            player.get_shield_chance()
-                        else:
-                            play_incorrect()
-                            player.take_damage()
-
-            # --- Boss bullets ---
-            for b_rect in boss.bullets[:]:
-                if player.rect.colliderect(b_rect):
-                    boss.bullets.remove(b_rect)
-                    correct = ask_question(screen, get_question_level2)
-                    boss.reset_shooting_rate()
-                    if correct:
-                        play_correct()
-                        player.get_shield_chance()
-                    else:
-                        play_incorrect()
-                        player.take_damage()
-
-            # --- Player bullets hitting boss ---
-            for b in player.bullets[:]:
-                if boss.rect.colliderect(b["rect"]) and boss.alive:
-                    player.bullets.remove(b)
-                    correct = ask_question(screen, get_question_level2)
-                    boss.reset_shooting_rate()
-                    if correct:
-                        play_correct()
-                        boss_hit = boss.hit()
-                        if boss_hit:
-                            explosions.append(Explosion(boss.rect.centerx, boss.rect.centery))
-                    else:
-                        play_incorrect()
-                        player.take_damage()
-
-            # --- Victory: boss dead, spawn portal ---
-            if boss.victory:
-                boss.stop_boss_sound()
-                pygame.mixer.music.fadeout(1000)
-
-                # Clear remaining entities
-                if hasattr(boss, "minions"):
-                    for m in boss.minions[:]:
-                        explosions.append(Explosion(m.rect.centerx, m.rect.centery))
-                    boss.minions.clear()
-                if hasattr(boss, "bullets"):
-                    boss.bullets.clear()
-
-                boss.alive = False
-                boss.victory = False
-                boss.dying = False
-                boss_defeated = True  # <-- prevent respawn
-
-                # --- Spawn portal ---
-                if not portal:
-                    portal = Portal(WIDTH // 2, HEIGHT // 2)
-                    print("Portal spawned at center:", portal.rect.center)
-
-                boss = None
+        if self.world.game_over:
+            self.stop_sounds()
+            self.stack.replace(GameOver())
 
         # --- Portal interaction ---
-        if portal:
-            portal.update()
-            portal.draw(screen)
-            if player.rect.colliderect(portal.rect):
-                proceed = prompt_confirm(screen, "Proceed to level 3? press (Y) to confirm")
-                if proceed:
-                   if proceed:
-                     pygame.mixer.music.stop()
-                     return "level3"
-
-
-        # --- Explosions ---
-        for exp in explosions[:]:
-            exp.update()
-            exp.draw(screen)
-            if exp.finished:
-                explosions.remove(exp)
-
-        player.draw(screen)
-        draw_ui(screen, player)
-        pygame.display.flip()
-
-    pygame.mixer.music.fadeout(1000)
-    return
-
-
-
-
-def game_loop():
-    """Main game loop (Level 1 — HTML questions)."""
-    try:
-        pygame.mixer.music.load("assets/sounds/space_bg.mp3")
-        pygame.mixer.music.set_volume(0.3)
-        pygame.mixer.music.play(-1)
-    except Exception:
-        pass
-
-    bg = pygame.image.load("assets/images/space.png").convert()
-    bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-    bg_y1, bg_y2, bg_speed = 0, -HEIGHT, 2
-
-    player = Player(WIDTH // 2, HEIGHT - 80)
-    bugs = [Bug(random.randint(50, WIDTH - 50), random.randint(-300, -50), random.random() < 0.4) for _ in range(6)]
-    boss = None
-    bugs_destroyed = 0
-    stars = [Star() for _ in range(100)]
-    explosions = []
-    portal = None
-    running = True
-
-    while running:
-        clock.tick(FPS)
-        if player.health <= 0:
+        elif self.world.portal_reached:
+            self.stack.push(Prompt(self.settings["prompt"]), on_close=self.portal_answered)
+
+    def portal_answered(self, proceed):
+        if not proceed:
+            return
+        fade_out = self.settings["fade_out"]
+        if fade_out:
+            pygame.mixer.music.fadeout(fade_out)
+            self.stack.push(Fade(fade_out), on_close=lambda _: self.next_level())
+        else:
             pygame.mixer.music.stop()
-            return game_over_screen(screen)
+            self.next_level()
 
-        bg_y1 += bg_speed
-        bg_y2 += bg_speed
-        if bg_y1 >= HEIGHT: bg_y1 = -HEIGHT
-        if bg_y2 >= HEIGHT: bg_y2 = -HEIGHT
-        screen.blit(bg, (0, bg_y1))
-        screen.blit(bg, (0, bg_y2))
+    def next_level(self):
+        if self.settings["next"]:
+            self.stack.replace(LevelScene(self.settings["next"]))
+        else:
+            to_menu()
 
-        for star in stars:
-            star.update()
-            star.draw(screen)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                choice = pause_menu(screen)
-                if choice == "quit_to_menu":
-                    pygame.mixer.music.stop()
-                    return
-
-        keys = pygame.key.get_pressed()
-        player.handle_input(keys)
-        player.update()
-
-        for bug in bugs[:]:
-            bug.update()
-            bug.draw(screen)
-
-            player_hitbox = player.rect.inflate(-player.rect.width * 0.4, -player.rect.height * 0.4)
-            bug_hitbox = bug.rect.inflate(-bug.rect.width * 0.4, -bug.rect.height * 0.4)
-
-            player_hit = bug_hitbox.colliderect(player_hitbox)
-            bullet_hit = any(bug_hitbox.colliderect(b["rect"]) for b in player.bullets)
-
-            if player_hit or bullet_hit:
-                correct = ask_question(screen, get_question)
-                if correct:
-                    play_correct()
-                    explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                    bugs.remove(bug)
-                    player.get_shield_chance()
-                    bugs_destroyed += 1
-                else:
-                    play_incorrect()
-                    explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                    player.take_damage()
-                    bugs.remove(bug)
-                for b in player.bullets[:]:
-                    if bug_hitbox.colliderect(b["rect"]):
-                        player.bullets.remove(b)
-
-            for b_bullet in bug.bullets[:]:
-                if player_hitbox.colliderect(b_bullet):
-                    bug.bullets.remove(b_bullet)
-                    correct = ask_question(screen, get_question)
-                    if correct:
-                        play_correct()
-                        player.get_shield_chance()
-                    else:
-                        play_incorrect()
-                        player.take_damage()
-
-        if bugs_destroyed >= 3 and boss is None:
-            for bug in bugs[:]:
-                explosions.append(Explosion(bug.rect.centerx, bug.rect.centery))
-                bugs.remove(bug)
-            boss = Level1Boss(WIDTH, HEIGHT)
-            bugs_destroyed = 0
-
-        if boss:
-            boss.update(player.rect)
-            boss.draw(screen)
-            if boss.victory:
-                if not portal:
-                    portal = Portal(boss.rect.centerx, boss.rect.bottom)
-                boss = None
-            else:
-                for b_rect in boss.bullets[:]:
-                    if player.rect.colliderect(b_rect):
-                        boss.bullets.remove(b_rect)
-                        correct = ask_question(screen, get_question)
-                        boss.reset_shooting_rate()
-                        if correct:
-                            play_correct()
-                        else:
-                            play_incorrect()
-                            player.take_damage()
-
-                for b in player.bullets[:]:
-                    if boss.rect.colliderect(b["rect"]):
-                        player.bullets.remove(b)
-                        correct = ask_question(screen, get_question)
-                        boss.reset_shooting_rate()
-                        if correct:
-                            play_correct()
-                            defeated = boss.hit()
-                            if defeated:
-                                explosions.append(Explosion(boss.rect.centerx, boss.rect.centery))
-                        else:
-                            play_incorrect()
-
-        if portal:
-            portal.update()
-            portal.draw(screen)
-            if player.rect.colliderect(portal.rect):
-                proceed = prompt_confirm(screen, "Proceed to level 2? press (Y) to confirm")
-                if proceed:
-                    pygame.mixer.music.fadeout(600)
-                    fade_out(screen, duration=600)
-                    # transitions to level 2 
-                    return "level2"
-
-        for exp in explosions[:]:
-            exp.update()
-            exp.draw(screen)
-            if exp.finished:
-                explosions.remove(exp)
-
-        player.draw(screen)
-        draw_ui(screen, player)
-        pygame.display.flip()
-
-    pygame.mixer.music.stop()
-    return
+    # --- Render ---
+    def draw(self, screen):
+        """Render the world between its last two steps, then the HUD and any question."""
+        world, modal = self.world, self.modal
+        if modal.active and modal.backdrop is not None:
+            return modal.draw(screen)  # frozen world: only the input line changes
+        drawn = world.draw(screen, timestep.alpha)
+        drawn.append(draw_ui(screen, world.player))
+        if world.question is not None and not modal.active:
+            modal.open(world.question[0], world.answer)
+        drawn.extend(modal.draw(screen) or ())  # a question opened this frame appears over the finished frame
+        profiler.mark("hud")
+        return drawn
+
+
+def replay(path):
+    """--replay: play a recorded level back, drawn unless --headless, and report the result."""
+    start = pygame.time.get_ticks()
+    world, matched = play(path, None if HEADLESS else screen)
+    seconds = max(pygame.time.get_ticks() - start, 1) / 1000
+    print(f"Replayed {world.ticks} ticks in {seconds:.2f}s ({world.ticks / seconds:.0f} ticks/s)")
+    if matched is None:
+        print("Recording has no end state to compare against")
+    else:
+        print("Final state matches the recording" if matched else "Final state DIFFERS from the recording")
+    return matched is not False
 
 
 if __name__ == "__main__":
-    while True:
-        choice = menu_loop()
-        if choice == "game":
-            result = game_loop()
-            if result == "retry":
-                continue
-            elif result == "quit":
-                pygame.quit()
-                sys.exit()
-            elif result == "level2":
-                result2 = level_2_loop(screen)
-                if result2 == "level3":
-                    level_3_loop(screen)
-                    continue
-                    
-                    continue
-        elif choice in ("quit", "exit"):
-            pygame.quit()
-            sys.exit()
+    if "--replay" in sys.argv:
+        ok = replay(sys.argv[sys.argv.index("--replay") + 1])
+        pygame.quit()
+        sys.exit(0 if ok else 1)
+
+    to_menu()
+    stack.run()
@@ -1,385 +1,356 @@
 import pygame
 import sys
 from utils.colors import WHITE, YELLOW
+from utils.sounds import get_sound, play
+from utils.text import get_font, render_text
+from utils.assets import load_image
+from utils.scenes import Scene, SceneStack
 
 pygame.init()
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("CodeSpire Menu")
-clock = pygame.time.Clock()
-FPS = 60
+# The window is opened by the game (main.py), not on import, so levels can be
+# imported and simulated headless; menu screens draw on the current display.
+
+
+# --- Background image (decoded on first use, shared via the asset cache) ---
+def menu_background():
+    return load_image("assets/images/menu/menu_background/menu_bg.jpg", (WIDTH, HEIGHT), alpha=False)
 
-# --- Load background image ---
-bg_image = pygame.image.load("assets/images/menu/menu_background/menu_bg.jpg").convert()
-bg_image = pygame.transform.scale(bg_image, (WIDTH, HEIGHT))
 
 # --- Fonts ---
-title_font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 72)
-menu_font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 36)
+title_font = get_font("assets/fonts/BoldPixels.ttf", 72)
+menu_font = get_font("assets/fonts/BoldPixels.ttf", 36)
 
 # --- Title text ---
-title_surface = title_font.render("CodeSpire", True, YELLOW)
+title_surface = render_text(title_font, "CodeSpire", YELLOW)
 title_rect = title_surface.get_rect(center=(WIDTH // 2, 80))
 
 # --- Menu items ---
 menu_items = ["Start Game", "Options", "Credits", "Quit"]
-selected_index = 0
+pause_items = ["Resume", "Options", "Quit to Menu"]
 
 # --- Sounds ---
-select_sfx = pygame.mixer.Sound("assets/sounds/select_sfx.mp3")
-select_sfx.set_volume(0.5)
+select_sfx = get_sound("select")  # shared bank Sound; volume set by the SFX slider
 
 # --- Volume settings (adjustable in options) ---
 music_volume = 0.5
 sfx_volume = 0.5
 
 
-# --- Draw main menu ---
-def draw_menu(mouse_pos):
-    screen.blit(bg_image, (0, 0))
-    screen.blit(title_surface, title_rect)
+# --- Item list shared by the main and pause menus ---
+class ItemMenu(Scene):
+    """Keyboard (up/down/enter) and mouse (hover/click) selection over `items`."""
+    items = ()
 
-    for i, item in enumerate(menu_items):
-        if i == selected_index or get_item_rect(i).collidepoint(mouse_pos):
-            text = menu_font.render(item, True, YELLOW)
-            text = pygame.transform.scale(text, (int(text.get_width() * 1.1), int(text.get_height() * 1.1)))
-        else:
-            text = menu_font.render(item, True, WHITE)
+    def __init__(self):
+        super().__init__()
+        self.selected_index = 0
+        self.last_hover_index = -1
 
-        rect = text.get_rect(center=(WIDTH // 2, 250 + i * 60))
-        screen.blit(text, rect)
+    def item_rect(self, index):
+        text = render_text(menu_font, self.items[index], WHITE)
+        return text.get_rect(center=(WIDTH // 2, 250 + index * 60))
 
+    def highlighted(self, mouse_pos):
+        return tuple(i == self.selected_index or self.item_rect(i).collidepoint(mouse_pos)
+                     for i in range(len(self.items)))
 
-# --- Get rect for menu item ---
-def get_item_rect(index):
-    text = menu_font.render(menu_items[index], True, WHITE)
-    return text.get_rect(center=(WIDTH // 2, 250 + index * 60))
+    def draw_items(self, screen, highlighted):
+        rects = []
+        for i, item in enumerate(self.items):
+            if highlighted[i]:
+                text = render_text(menu_font, item, YELLOW)
+                text = pygame.transform.scale(text, (int(text.get_width() * 1.1), int(text.get_height() * 1.1)))
+            else:
+                text = render_text(menu_font, item, WHITE)
+            rects.append(screen.blit(text, text.get_rect(center=(WIDTH // 2, 250 + i * 60))))
+        return rects
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.selected_index = (self.selected_index - 1) % len(self.items)
+                play("select")
+            elif event.key == pygame.K_DOWN:
+                self.selected_index = (self.selected_index + 1) % len(self.items)
+                play("select")
+            elif event.key == pygame.K_RETURN:
+                play("select")
+                self.select(self.items[self.selected_index])
+
+    def update(self):
+        mouse_pos = pygame.mouse.get_pos()
+        hovered_index = -1
+        for i in range(len(self.items)):
+            if self.item_rect(i).collidepoint(mouse_pos):
+                hovered_index = i
 
+        # Handle mouse clicks on items
+        if hovered_index != -1 and pygame.mouse.get_pressed()[0]:
+            play("select")
+            self.select(self.items[hovered_index])
+            return
 
-# --- Main menu loop ---
-def menu_loop():
-    global selected_index
-    running = True
+        # Play hover sound if item changes
+        if hovered_index != -1 and hovered_index != self.last_hover_index:
+            play("select")
+        self.last_hover_index = hovered_index
 
-    # Start menu music
-    pygame.mixer.music.load("assets/sounds/menu_music.mp3")
-    pygame.mixer.music.set_volume(music_volume)
-    pygame.mixer.music.play(-1)
+    def select(self, item):
+        pass
 
-    last_hover_index = -1
 
-    while running:
-        clock.tick(FPS)
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selected_index = (selected_index - 1) % len(menu_items)
-                    select_sfx.play()
-                elif event.key == pygame.K_DOWN:
-                    selected_index = (selected_index + 1) % len(menu_items)
-                    select_sfx.play()
-                elif event.key == pygame.K_RETURN:
-                    select_sfx.play()
-                    return handle_selection(menu_items[selected_index])
+# --- Main menu ---
+class MainMenu(ItemMenu):
+    render_scene = "menu"
+    items = menu_items
 
-        # Handle mouse clicks on items
-        for i, item in enumerate(menu_items):
-            if get_item_rect(i).collidepoint(mouse_pos) and mouse_pressed:
-                select_sfx.play()
-                return handle_selection(item)
+    def __init__(self, on_start):
+        super().__init__()
+        self.on_start = on_start
 
-        # Play hover sound if item changes
-        hovered_index = -1
-        for i, item in enumerate(menu_items):
-            if get_item_rect(i).collidepoint(mouse_pos):
-                hovered_index = i
-        if hovered_index != -1 and hovered_index != last_hover_index:
-            select_sfx.play()
-        last_hover_index = hovered_index
-
-        draw_menu(mouse_pos)
-        pygame.display.flip()
-
-
-# --- Handle menu selection ---
-def handle_selection(choice):
-    if choice == "Start Game":
-        pygame.mixer.music.stop()
-        return "game"
-    elif choice == "Options":
-        options_menu(screen)
-    elif choice == "Credits":
-        credits_menu(screen)
-    elif choice == "Quit":
-        pygame.quit()
-        sys.exit()
-
-
-# --- Pause menu (during gameplay) ---
-def pause_menu(screen):
-    global selected_index
-    running = True
-
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-
-    pause_items = ["Resume", "Options", "Quit to Menu"]
-    selected_index = 0
-    last_hover_index = -1
-
-    while running:
-        clock.tick(FPS)
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selected_index = (selected_index - 1) % len(pause_items)
-                    select_sfx.play()
-                elif event.key == pygame.K_DOWN:
-                    selected_index = (selected_index + 1) % len(pause_items)
-                    select_sfx.play()
-                elif event.key == pygame.K_RETURN:
-                    select_sfx.play()
-                    choice = pause_items[selected_index]
-                    if choice == "Resume":
-                        return "resume"
-                    elif choice == "Options":
-                        options_menu(screen)
-                    elif choice == "Quit to Menu":
-                        return "quit_to_menu"
-
-        # Handle mouse clicks
-        for i, item in enumerate(pause_items):
-            rect = get_item_rect(i)
-            rect.centery = 250 + i * 60
-            if rect.collidepoint(mouse_pos) and mouse_pressed:
-                select_sfx.play()
-                if item == "Resume":
-                    return "resume"
-                elif item == "Options":
-                    options_menu(screen)
-                elif item == "Quit to Menu":
-                    return "quit_to_menu"
-
-        # Hover sound
-        hovered_index = -1
-        for i, item in enumerate(pause_items):
-            rect = get_item_rect(i)
-            rect.centery = 250 + i * 60
-            if rect.collidepoint(mouse_pos):
-                hovered_index = i
-        if hovered_index != -1 and hovered_index != last_hover_index:
-            select_sfx.play()
-        last_hover_index = hovered_index
-
-        # Draw pause overlay
-        screen.blit(overlay, (0, 0))
-        pause_font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 48)
-        pause_title = pause_font.render("Paused", True, YELLOW)
-        screen.blit(pause_title, pause_title.get_rect(center=(WIDTH // 2, 150)))
-
-        # Draw pause items
-        for i, item in enumerate(pause_items):
-            if i == selected_index or get_item_rect(i).collidepoint(mouse_pos):
-                text = menu_font.render(item, True, YELLOW)
-                text = pygame.transform.scale(text, (int(text.get_width() * 1.1), int(text.get_height() * 1.1)))
-            else:
-                text = menu_font.render(item, True, WHITE)
+    def enter(self):
+        self.start_music()
 
-            rect = text.get_rect(center=(WIDTH // 2, 250 + i * 60))
-            screen.blit(text, rect)
+    def resume(self):
+        self.start_music()  # the credits play their own theme
 
-        pygame.display.flip()
+    def start_music(self):
+        pygame.mixer.music.load("assets/sounds/menu_music.mp3")
+        pygame.mixer.music.set_volume(music_volume)
+        pygame.mixer.music.play(-1)
 
+    def select(self, item):
+        if item == "Start Game":
+            pygame.mixer.music.stop()
+            self.on_start()
+        elif item == "Options":
+            self.stack.push(OptionsMenu())
+        elif item == "Credits":
+            self.stack.push(CreditsMenu())
+        elif item == "Quit":
+            pygame.quit()
+            sys.exit()
+
+    def draw(self, screen):
+        screen.blit(menu_background(), (0, 0))
+        screen.blit(title_surface, title_rect)
+        self.draw_items(screen, self.highlighted(pygame.mouse.get_pos()))
+
+
+# --- Pause menu (during gameplay); closes with "resume" or "quit_to_menu" ---
+class PauseMenu(ItemMenu):
+    render_scene = "pause"
+    underlay = "snapshot"
+    items = pause_items
+
+    def __init__(self):
+        super().__init__()
+        self.baked = None
+        self.drawn_state = None
+        self.item_rects = []
+
+    def resume(self):
+        self.drawn_state = None  # back from the options screen: repaint everything
+
+    def select(self, item):
+        if item == "Resume":
+            self.close("resume")
+        elif item == "Options":
+            self.stack.push(OptionsMenu())
+        elif item == "Quit to Menu":
+            self.close("quit_to_menu")
+
+    def draw(self, screen):
+        # --- Static overlay: dim the frozen game once, then only redraw the items ---
+        if self.baked is None:
+            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
+            pause_title = render_text(get_font("assets/fonts/BoldPixels.ttf", 48), "Paused", YELLOW)
+            self.baked = self.backdrop.copy()
+            self.baked.blit(overlay, (0, 0))
+            self.baked.blit(pause_title, pause_title.get_rect(center=(WIDTH // 2, 150)))
+
+        highlighted = self.highlighted(pygame.mouse.get_pos())
+        if self.drawn_state is None:
+            screen.blit(self.baked, (0, 0))
+        elif highlighted == self.drawn_state:
+            return None
+        else:
+            for rect in self.item_rects:
+                screen.blit(self.baked, rect, rect)
+        drawn = self.item_rects
+        self.drawn_state = highlighted
+        self.item_rects = self.draw_items(screen, highlighted)
+        return drawn + self.item_rects
 
-# --- Options Menu (mouse + keyboard) ---
-def options_menu(screen):
-    global music_volume, sfx_volume
 
-    running = True
-    selected_slider = 0  # 0 = music, 1 = sfx
+# --- Options Menu (mouse + keyboard) ---
+class OptionsMenu(Scene):
+    render_scene = "options"
     sliders = ["Music Volume", "SFX Volume"]
-
     bar_x, bar_w = WIDTH // 2 - 150, 300  # common for both sliders
 
-    while running:
-        clock.tick(FPS)
-        screen.blit(bg_image, (0, 0))
+    def __init__(self):
+        super().__init__()
+        self.selected_slider = 0  # 0 = music, 1 = sfx
 
-        # Title
-        title_font2 = pygame.font.Font("assets/fonts/BoldPixels.ttf", 48)
-        title_surface = title_font2.render("Options", True, YELLOW)
-        screen.blit(title_surface, title_surface.get_rect(center=(WIDTH // 2, 100)))
+    def slider_rect(self, index):
+        return pygame.Rect(self.bar_x, 250 + index * 100, self.bar_w, 20)
 
+    def set_volume(self, index, volume):
+        global music_volume, sfx_volume
+        volume = min(max(volume, 0), 1)
+        if index == 0:
+            music_volume = volume
+            pygame.mixer.music.set_volume(music_volume)
+        else:
+            sfx_volume = volume
+            select_sfx.set_volume(sfx_volume)
+            play("select")
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.close()
+        elif event.key == pygame.K_UP:
+            self.selected_slider = (self.selected_slider - 1) % len(self.sliders)
+            play("select")
+        elif event.key == pygame.K_DOWN:
+            self.selected_slider = (self.selected_slider + 1) % len(self.sliders)
+            play("select")
+        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = -0.05 if event.key == pygame.K_LEFT else 0.05
+            volume = music_volume if self.selected_slider == 0 else sfx_volume
+            self.set_volume(self.selected_slider, volume + step)
+
+    def update(self):
+        # Click & drag on a bar sets its volume
         mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
+        if pygame.mouse.get_pressed()[0]:
+            for i in range(len(self.sliders)):
+                if self.slider_rect(i).collidepoint(mouse_pos):
+                    self.set_volume(i, (mouse_pos[0] - self.bar_x) / self.bar_w)
 
-        # Draw sliders
-        for i, label in enumerate(sliders):
-            y_pos = 250 + i * 100
-            slider_rect = pygame.Rect(bar_x, y_pos, bar_w, 20)
+    def draw(self, screen):
+        screen.blit(menu_background(), (0, 0))
+
+        # Title
+        title_font2 = get_font("assets/fonts/BoldPixels.ttf", 48)
+        title_surface = render_text(title_font2, "Options", YELLOW)
+        screen.blit(title_surface, title_surface.get_rect(center=(WIDTH // 2, 100)))
 
+        # Draw sliders
+        mouse_pos = pygame.mouse.get_pos()
+        for i, label in enumerate(self.sliders):
+            slider_rect = self.slider_rect(i)
             # Highlight text if hovered
-            if slider_rect.collidepoint(mouse_pos):
+            if slider_rect.collidepoint(mouse_pos) or i == self.selected_slider:
                 text_color = YELLOW
-                if mouse_pressed:
-                    new_volume = (mouse_pos[0] - bar_x) / bar_w
-                    new_volume = min(max(new_volume, 0), 1)
-                    if i == 0:
-                        music_volume = new_volume
-                        pygame.mixer.music.set_volume(music_volume)
-                    else:
-                        sfx_volume = new_volume
-                        select_sfx.set_volume(sfx_volume)
-                        select_sfx.play()
             else:
-                text_color = YELLOW if i == selected_slider else WHITE
+                text_color = WHITE
 
-            text = menu_font.render(label, True, text_color)
-            screen.blit(text, text.get_rect(center=(WIDTH // 2, y_pos - 40)))
+            text = render_text(menu_font, label, text_color)
+            screen.blit(text, text.get_rect(center=(WIDTH // 2, slider_rect.y - 40)))
 
             # Draw slider bar
             pygame.draw.rect(screen, WHITE, slider_rect, 3)
             volume = music_volume if i == 0 else sfx_volume
-            fill_w = int(bar_w * volume)
-            pygame.draw.rect(screen, YELLOW, (bar_x, y_pos, fill_w, 20))
+            fill_w = int(self.bar_w * volume)
+            pygame.draw.rect(screen, YELLOW, (self.bar_x, slider_rect.y, fill_w, 20))
 
         # Instructions
-        small_font = pygame.font.Font("assets/fonts/BoldPixels.ttf", 20)
-        info = small_font.render("←/→ adjust • ↑/↓ switch • ESC to return • Click & drag to adjust", True, WHITE)
+        small_font = get_font("assets/fonts/BoldPixels.ttf", 20)
+        info = render_text(small_font, "←/→ adjust • ↑/↓ switch • ESC to return • Click & drag to adjust", WHITE)
         screen.blit(info, info.get_rect(center=(WIDTH // 2, 500)))
 
-        pygame.display.flip()
-
-        # Keyboard input
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return
-                elif event.key == pygame.K_UP:
-                    selected_slider = (selected_slider - 1) % len(sliders)
-                    select_sfx.play()
-                elif event.key == pygame.K_DOWN:
-                    selected_slider = (selected_slider + 1) % len(sliders)
-                    select_sfx.play()
-                elif event.key == pygame.K_LEFT:
-                    if selected_slider == 0:
-                        music_volume = max(0, music_volume - 0.05)
-                        pygame.mixer.music.set_volume(music_volume)
-                    else:
-                        sfx_volume = max(0, sfx_volume - 0.05)
-                        select_sfx.set_volume(sfx_volume)
-                        select_sfx.play()
-                elif event.key == pygame.K_RIGHT:
-                    if selected_slider == 0:
-                        music_volume = min(1, music_volume + 0.05)
-                        pygame.mixer.music.set_volume(music_volume)
-                    else:
-                        sfx_volume = min(1, sfx_volume + 0.05)
-                        select_sfx.set_volume(sfx_volume)
-                        select_sfx.play()
-
 
 # --- Credits Menu ---
-def credits_menu(screen):
-    """Display the credits screen with scrolling text and fade-in effect."""
-    running = True
-    clock = pygame.time.Clock()
-    font_title = pygame.font.Font("assets/fonts/BoldPixels.ttf", 48)
-    font_text = pygame.font.Font("assets/fonts/BoldPixels.ttf", 28)
-    font_small = pygame.font.Font("assets/fonts/BoldPixels.ttf", 20)
-
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
-    alpha = 255
-
-    bg = pygame.transform.scale(bg_image, (WIDTH, HEIGHT))
-
-    credits_lines = [
-        "CREDITS",
-        "",
-        "Art Assets:",
-        "itch.io - All pixel art used are free to use,",
-        "and all original creators are credited.",
-        "",
-        "Sounds:",
-        "Correct Sound - LoudTube",
-        "Incorrect Sound - BrodHead Media Athletic & Live Events",
-        "",
-        "Bosses & Music:",
-        "Menu Music - Hendrik Mans",
-        "Level 1 Boss - Original Creation",
-        "Level 2 Background Music - FJparadox06 Gaming",
-        "",
-        "Developed with ❤️ using Pygame",
-        "",
-        "Press ESC or ENTER to return to Main Menu"
-    ]
-
-    text_y = HEIGHT + 50
+credits_lines = [
+    "CREDITS",
+    "",
+    "Art Assets:",
+    "itch.io - All pixel art used are free to use,",
+    "and all original creators are credited.",
+    "",
+    "Sounds:",
+    "Correct Sound - LoudTube",
+    "Incorrect Sound - BrodHead Media Athletic & Live Events",
+    "",
+    "Bosses & Music:",
+    "Menu Music - Hendrik Mans",
+    "Level 1 Boss - Original Creation",
+    "Level 2 Background Music - FJparadox06 Gaming",
+    "",
+    "Developed with ❤️ using Pygame",
+    "",
+    "Press ESC or ENTER to return to Main Menu"
+]
+
+
+class CreditsMenu(Scene):
+    """The credits screen with scrolling text and fade-in effect."""
+    render_scene = "credits"
     scroll_speed = 1.2
 
-    try:
-        pygame.mixer.music.load("assets/sounds/credits_theme.mp3")
-        pygame.mixer.music.set_volume(music_volume)
-        pygame.mixer.music.play(-1)
-    except Exception:
-        pass
-
-    while running:
-        clock.tick(FPS)
-        screen.blit(bg, (0, 0))
-
-        y_offset = text_y
+    def __init__(self):
+        super().__init__()
+        self.font_title = get_font("assets/fonts/BoldPixels.ttf", 48)
+        self.font_text = get_font("assets/fonts/BoldPixels.ttf", 28)
+        self.font_small = get_font("assets/fonts/BoldPixels.ttf", 20)
+        self.overlay = pygame.Surface((WIDTH, HEIGHT))
+        self.overlay.fill((0, 0, 0))
+        self.alpha = 255
+        self.text_y = HEIGHT + 50
+
+    def enter(self):
+        try:
+            pygame.mixer.music.load("assets/sounds/credits_theme.mp3")
+            pygame.mixer.music.set_volume(music_volume)
+            pygame.mixer.music.play(-1)
+        except Exception:
+            pass
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+            pygame.mixer.music.fadeout(1000)
+            self.close()
+
+    def update(self):
+        self.text_y -= self.scroll_speed
+        if self.text_y + 50 * len(credits_lines) < -50:
+            self.text_y = HEIGHT + 50
+        if self.alpha > 0:
+            self.alpha -= 5
+
+    def draw(self, screen):
+        screen.blit(menu_background(), (0, 0))
+
+        y_offset = self.text_y
         for i, line in enumerate(credits_lines):
             if i == 0:
-                text_surface = font_title.render(line, True, YELLOW)
+                text_surface = render_text(self.font_title, line, YELLOW)
             elif "❤️" in line or "Press" in line:
-                text_surface = font_small.render(line, True, WHITE)
+                text_surface = render_text(self.font_small, line, WHITE)
             else:
-                text_surface = font_text.render(line, True, WHITE)
-            text_rect = text_surface.get_rect(center=(WIDTH // 2, y_offset))
-            screen.blit(text_surface, text_rect)
+                text_surface = render_text(self.font_text, line, WHITE)
+            screen.blit(text_surface, text_surface.get_rect(center=(WIDTH // 2, y_offset)))
             y_offset += 50
 
-        text_y -= scroll_speed
-        if y_offset < -50:
-            text_y = HEIGHT + 50
-
-        if alpha > 0:
-            overlay.set_alpha(alpha)
-            screen.blit(overlay, (0, 0))
-            alpha -= 5
-
-        pygame.display.flip()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
-                    pygame.mixer.music.fadeout(1000)
-                    running = False
+        if self.alpha > 0:
+            self.overlay.set_alpha(self.alpha)
+            screen.blit(self.overlay, (0, 0))
 
 
 # --- Main entry ---
 if __name__ == "__main__":
-    choice = menu_loop()
-    print(f"Menu choice: {choice}")
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    stack = SceneStack()
+
+    def start():
+        print("Menu choice: game")
+        stack.pop()
+
+    stack.push(MainMenu(start))
+    stack.run()
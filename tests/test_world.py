@@ -0,0 +1,16 @@
+import os
+
+# The game modules open the mixer on import, so pick the dummy drivers first
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+from levels.world import Level1World, Level2World, Level3World
+
+
+@pytest.mark.parametrize("world_class", [Level1World, Level2World, Level3World])
+def test_clear_wave_removes_every_enemy(world_class):
+    world = world_class()
+    assert len(world.enemies) > 1
+    world.clear_wave()
+    assert world.enemies == []
@@ -0,0 +1,104 @@
+import os
+import pygame
+
+# --- Shared asset cache ---
+# Every image/sound is decoded from disk once per process. Images are keyed by
+# (path, angle, size, alpha) so each transform is also only computed once, and
+# every caller gets the same already-converted Surface back.
+_images = {}
+_sounds = {}
+_prepared = {}  # decoded + transformed off the main thread, waiting for convert()
+_stats = {"hits": 0, "misses": 0, "preloaded": 0}
+
+
+def prepare_image(path, size=None, angle=0, alpha=True):
+    """Decode and transform an image without touching the display.
+
+    Safe to call from a worker thread (see utils.preloader). The result is
+    converted and moved into the cache by the next load_image() for that key.
+    """
+    key = (path, angle, size, alpha)
+    if key in _images or key in _prepared:
+        return
+    image = pygame.image.load(path)
+    if angle:
+        image = pygame.transform.rotate(image, angle)
+    if size:
+        image = pygame.transform.scale(image, size)
+    _prepared[key] = image
+
+
+def _convert(image, alpha):
+    """Convert to the display format; without a display (headless runs) keep the raw Surface."""
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha() if alpha else image.convert()
+
+
+def load_image(path, size=None, angle=0, alpha=True):
+    """Return a cached Surface for path, rotated by angle then scaled to size."""
+    key = (path, angle, size, alpha)
+    image = _images.get(key)
+    if image is not None:
+        _stats["hits"] += 1
+        return image
+
+    image = _prepared.pop(key, None)
+    if image is not None:
+        # Already decoded in the background: only the display conversion is left
+        _stats["preloaded"] += 1
+        image = _convert(image, alpha)
+        _images[key] = image
+        return image
+
+    _stats["misses"] += 1
+    image = pygame.image.load(path)
+    image = _convert(image, alpha)
+    if angle:
+        image = pygame.transform.rotate(image, angle)
+    if size:
+        image = pygame.transform.scale(image, size)
+    _images[key] = image
+    return image
+
+
+def frame_paths(folder):
+    """Sorted .png paths of an animation folder (empty if it does not exist)."""
+    if not os.path.exists(folder):
+        return []
+    return [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.endswith(".png")]
+
+
+def load_sound(path, volume=None):
+    """Return a cached Sound for path. Each volume gets its own shared Sound."""
+    key = (path, volume)
+    sound = _sounds.get(key)
+    if sound is not None:
+        _stats["hits"] += 1
+        return sound
+
+    _stats["misses"] += 1
+    sound = pygame.mixer.Sound(path)
+    if volume is not None:
+        sound.set_volume(volume)
+    _sounds[key] = sound
+    return sound
+
+
+def get_stats():
+    """Return hit/miss counts. A miss means the asset was read from disk on the
+    calling thread; "preloaded" ones were decoded by the background preloader."""
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "preloaded": _stats["preloaded"],
+        "images": len(_images),
+        "sounds": len(_sounds),
+    }
+
+
+def reset_stats():
+    """Zero the counters, e.g. at level start, to check gameplay frames stay miss-free."""
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+    _stats["preloaded"] = 0
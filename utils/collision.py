@@ -0,0 +1,172 @@
+import pygame
+from entities.projectiles import PLAYER, ENEMY
+
+# --- Broadphase settings ---
+# Bullets are bucketed into a uniform grid once per frame; each enemy only
+# tests the bullets in the cells its rect covers, so the cost grows with
+# (bullets + enemies) instead of bullets * enemies. Pairs whose rects overlap
+# then go through the pixel-mask test below, so the broadphase box is simply
+# each sprite's rect.
+CELL_SIZE = 96
+
+
+# --- Debug overlay (toggled with F2 in the level loops) ---
+show_hitboxes = False
+HITBOX_COLOR = (0, 255, 0)
+
+
+def toggle_hitboxes():
+    global show_hitboxes
+    show_hitboxes = not show_hitboxes
+    return show_hitboxes
+
+
+def draw_hitboxes(screen, boxes, color=HITBOX_COLOR):
+    """Outline the boxes the collision code is using this frame."""
+    return [pygame.draw.rect(screen, color, box, 1) for box in boxes]
+
+
+# --- Pixel masks (precise test) ---
+# One mask per Surface, built the first time it is needed. Sprites come from
+# the asset cache, so that is one mask per image for the whole session.
+# Bullet masks live in the projectile store, next to its sprites.
+_masks = {}  # id(surface) -> (surface, mask); the surface is kept so its id stays unique
+precise_checks = 0  # mask tests since the last take_precise_checks()
+
+
+def mask_for(surface):
+    entry = _masks.get(id(surface))
+    if entry is None:
+        entry = _masks[id(surface)] = (surface, pygame.mask.from_surface(surface))
+    return entry[1]
+
+
+def overlap(mask_a, pos_a, mask_b, pos_b):
+    """True if the opaque pixels of two masks, drawn at top-lefts pos_a and pos_b, touch."""
+    global precise_checks
+    precise_checks += 1
+    return mask_a.overlap(mask_b, (int(pos_b[0]) - int(pos_a[0]), int(pos_b[1]) - int(pos_a[1]))) is not None
+
+
+def take_precise_checks():
+    """Mask tests run since the last call (World.step() reports them to the profiler)."""
+    global precise_checks
+    checks, precise_checks = precise_checks, 0
+    return checks
+
+
+def sprite_hits(store, image, rect, team=None, owner=None):
+    """Slots of live bullets touching `image` drawn at `rect`: rect test first, then masks."""
+    found = store.hits(rect, team, owner)
+    if not found:
+        return found
+    mask = mask_for(image)
+    pos, masks, sprite = store.pos, store.masks, store.sprite
+    return [i for i in found if overlap(mask, rect.topleft, masks[sprite[i]], pos[i])]
+
+
+def pop_sprite_hit(store, image, rect, team=None, owner=None):
+    """Kill one bullet touching `image` drawn at `rect`. Returns True if there was one."""
+    found = sprite_hits(store, image, rect, team, owner)
+    if not found:
+        return False
+    store.kill(found[0])
+    return True
+
+
+class SpatialHash:
+    """
+    Uniform grid: cell (cx, cy) -> items whose top-left corner is in that cell.
+    Each item lives in exactly one cell; queries widen the searched area by
+    the largest item size instead, so nothing is ever returned twice.
+    """
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_w = self.max_h = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.max_w = self.max_h = 0
+
+    def insert(self, item, left, top, right, bottom):
+        size = self.cell_size
+        key = (int(left // size), int(top // size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [item]
+        else:
+            bucket.append(item)
+        self.max_w = max(self.max_w, right - left)
+        self.max_h = max(self.max_h, bottom - top)
+
+    def candidates(self, rect):
+        """Items that may overlap `rect` (callers still do the exact test)."""
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cx in range(int((rect.left - self.max_w) // size), int((rect.right - 1) // size) + 1):
+            for cy in range(int((rect.top - self.max_h) // size), int((rect.bottom - 1) // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
+class FrameHits:
+    """Every collision of one frame, found in a single find_hits() call."""
+    def __init__(self):
+        self.shot = {}         # enemy -> slots of player bullets overlapping its box
+        self.rammed = set()    # enemies whose box overlaps the player's box
+        self.player_hit = {}   # owner id -> slots of enemy bullets overlapping the player's box
+
+    def first_shot(self, enemy):
+        slots = self.shot.get(enemy)
+        return slots[0] if slots else -1
+
+
+def find_hits(player, enemies, store, cell_size=CELL_SIZE):
+    """
+    Broadphase + precise test for one frame. The player and every enemy give
+    their sprite as .image drawn at .rect; only pairs whose rects overlap are
+    tested pixel by pixel.
+    """
+    hits = FrameHits()
+    player_box = player.rect
+    player_mask, player_pos = mask_for(player.image), player.rect.topleft
+    masks, sprite = store.masks, store.sprite
+
+    # --- Player bullets vs enemies (grid over the bullets) ---
+    slots, lefts, tops, rights, bottoms, _ = store.live_boxes(PLAYER)
+    if slots and enemies:
+        grid = SpatialHash(cell_size)
+        for k in range(len(slots)):
+            grid.insert(k, lefts[k], tops[k], rights[k], bottoms[k])
+        for enemy in enemies:
+            box = enemy.rect
+            left, top, right, bottom = box.left, box.top, box.right, box.bottom
+            near = [k for k in grid.candidates(box)
+                    if lefts[k] < right and rights[k] > left and tops[k] < bottom and bottoms[k] > top]
+            if not near:
+                continue
+            mask, pos = mask_for(enemy.image), enemy.rect.topleft
+            found = [slots[k] for k in near if overlap(mask, pos, masks[sprite[slots[k]]], (lefts[k], tops[k]))]
+            if found:
+                found.sort()  # deterministic: lowest slot first
+                hits.shot[enemy] = found
+
+    # --- Enemies ramming the player ---
+    for enemy in enemies:
+        if enemy.rect.colliderect(player_box) \
+                and overlap(mask_for(enemy.image), enemy.rect.topleft, player_mask, player_pos):
+            hits.rammed.add(enemy)
+
+    # --- Enemy bullets vs the player (a single box, no grid needed) ---
+    slots, lefts, tops, rights, bottoms, owners = store.live_boxes(ENEMY)
+    for k in range(len(slots)):
+        if lefts[k] < player_box.right and rights[k] > player_box.left \
+                and tops[k] < player_box.bottom and bottoms[k] > player_box.top \
+                and overlap(player_mask, player_pos, masks[sprite[slots[k]]], (lefts[k], tops[k])):
+            hits.player_hit.setdefault(owners[k], []).append(slots[k])
+
+    return hits
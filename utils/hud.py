@@ -0,0 +1,72 @@
+import pygame
+from utils.text import get_font, render_text
+
+# --- Retained HUD layers ---
+# Each layer is drawn into its own Surface only when the values it shows change;
+# every other frame is a single blit of the cached composite.
+
+
+class PlayerHUD:
+    """Player health text, health bar and shield icon."""
+    def __init__(self):
+        self.font = get_font(None, 32)
+        # Big enough for the shield icon, which is drawn at (120, -25) and is 140px
+        self.layer = pygame.Surface((260, 115), pygame.SRCALPHA)
+        self.state = None
+
+    def render(self, player):
+        self.layer.fill((0, 0, 0, 0))
+        health_text = render_text(self.font, f"Health: {player.health}/{player.max_health}", (255, 0, 0))
+        self.layer.blit(health_text, (10, 10))
+
+        bar_width, bar_height = 150, 20
+        fill = (player.health / player.max_health) * bar_width
+        pygame.draw.rect(self.layer, (255, 0, 0), (10, 40, fill, bar_height))
+        pygame.draw.rect(self.layer, (255, 255, 255), (10, 40, bar_width, bar_height), 2)
+
+        if player.has_shield:
+            player.draw_shield_icon(self.layer)
+
+    def draw(self, screen, player):
+        state = (player.health, player.max_health, player.has_shield)
+        if state != self.state:
+            self.state = state
+            self.render(player)
+        return screen.blit(self.layer, (0, 0))
+
+
+class BossHealthBar:
+    """Boss name and health bar, faded in as a single layer."""
+    def __init__(self, name_surface, screen_width, bar_y=70, bar_width=300, bar_height=20):
+        self.name_surface = name_surface
+        self.bar_width, self.bar_height = bar_width, bar_height
+
+        bar_rect = pygame.Rect((screen_width - bar_width) // 2, bar_y, bar_width, bar_height)
+        name_rect = name_surface.get_rect(center=(screen_width // 2, bar_y - 25))
+        self.rect = bar_rect.union(name_rect)
+        # Positions inside the layer
+        self.bar_rect = bar_rect.move(-self.rect.x, -self.rect.y)
+        self.name_rect = name_rect.move(-self.rect.x, -self.rect.y)
+
+        self.layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.state = None
+        self.alpha = None
+
+    def render(self, health, max_health):
+        self.layer.fill((0, 0, 0, 0))
+        self.layer.fill((80, 0, 0), self.bar_rect)
+        current_width = int(self.bar_width * (health / max_health))
+        if current_width > 0:
+            self.layer.fill((255, 0, 0), (self.bar_rect.x, self.bar_rect.y, current_width, self.bar_height))
+        pygame.draw.rect(self.layer, (255, 255, 255), self.bar_rect, 2)
+        self.layer.blit(self.name_surface, self.name_rect)
+
+    def draw(self, screen, health, max_health, alpha):
+        state = (health, max_health)
+        if state != self.state:
+            self.state = state
+            self.render(health, max_health)
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.layer.set_alpha(alpha)
+        return screen.blit(self.layer, self.rect)
@@ -0,0 +1,62 @@
+import os
+import threading
+from utils.assets import prepare_image, load_image, frame_paths
+from levels.level_settings import LEVEL_ASSETS
+
+# --- Background level preloader ---
+# start_preload(level) decodes a level's images on a worker thread while the
+# current level keeps playing (pygame.image.load and the transforms release the
+# GIL). finish_preload(level) runs on the main thread at the level switch: it
+# waits for the worker if it is still busy, or decodes everything itself if no
+# preload was started, then converts the surfaces into the shared asset cache.
+_workers = {}
+_finished = set()
+
+
+def _image_specs(level):
+    manifest = LEVEL_ASSETS.get(level, {})
+    specs = list(manifest.get("images", []))
+    for folder, size in manifest.get("folders", []):
+        specs.extend((path, size, 0, True) for path in frame_paths(folder))
+    return [spec for spec in specs if os.path.exists(spec[0])]
+
+
+def _decode(specs):
+    for path, size, angle, alpha in specs:
+        try:
+            prepare_image(path, size, angle, alpha)
+        except Exception as e:
+            print(f"[WARNING] Preload failed for {path}: {e}")
+
+
+def start_preload(level):
+    """Begin decoding a level's assets in the background (no-op if already started)."""
+    if level in _workers or level in _finished:
+        return
+    worker = threading.Thread(target=_decode, args=(_image_specs(level),), daemon=True)
+    _workers[level] = worker
+    worker.start()
+
+
+def is_ready(level):
+    """True once the level's assets are decoded (finish_preload() will not block)."""
+    worker = _workers.get(level)
+    return level in _finished or (worker is not None and not worker.is_alive())
+
+
+def finish_preload(level):
+    """Make every asset of a level available in the cache, blocking if needed."""
+    if level in _finished:
+        return
+    if not is_ready(level):
+        print(f"[preload] level {level} assets not decoded yet; loading them now")
+    worker = _workers.pop(level, None)
+    if worker is not None:
+        worker.join()  # blocking fallback if the level switch beat the worker
+
+    for path, size, angle, alpha in _image_specs(level):
+        try:
+            load_image(path, size, angle, alpha)
+        except Exception as e:
+            print(f"[WARNING] Could not load {path}: {e}")
+    _finished.add(level)
@@ -0,0 +1,186 @@
+import csv
+import time
+from collections import deque
+import pygame
+from utils.text import get_font
+
+# --- Per-phase frame profiler (F3 overlay, F4 CSV dump) ---
+# The loop calls begin_frame() once per frame and end_frame() after the flip;
+# code in between calls mark("phase") at the END of each phase, which charges
+# the time since the previous mark to that phase. Phases that run several
+# times a frame (one world step per fixed tick) add up. count("what", n) adds
+# to a per-frame counter the same way (e.g. collision mask tests). While
+# disabled, mark and count are do-nothing functions and begin/end_frame
+# return at once.
+HISTORY = 36000         # frames kept for the CSV dump (10 minutes at 60 FPS)
+WINDOW = 120            # frames averaged by the overlay and shown in its graph
+BUDGET_MS = 1000 / 60   # one frame at 60 FPS
+REFRESH = 10            # re-render the overlay every N frames
+GRAPH_HEIGHT = 50       # px; the graph tops out at two frame budgets
+PANEL_POS = (540, 10)
+
+
+def _noop(*args):
+    pass
+
+
+class FrameProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.mark = _noop
+        self.count = _noop
+        self.phases = {}                      # phase -> None, in first-seen order
+        self.counters = {}                    # counter -> None, in first-seen order
+        self.samples = deque(maxlen=HISTORY)  # (total ns, {phase: ns}, {counter: n}) per frame
+        self.current = None
+        self.current_counts = None
+        self.notes = {}                       # name -> text shown under the frame time (e.g. quality level)
+        self.frame_start = 0
+        self.last = 0
+
+        # --- Overlay ---
+        self.font = None
+        self.layer = None
+        self.frames_since_render = REFRESH
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.mark = self._mark if self.enabled else _noop
+        self.count = self._count if self.enabled else _noop
+        self.current = None
+        self.frames_since_render = REFRESH
+        return self.enabled
+
+    def begin_frame(self):
+        if self.enabled:
+            self.current = {}
+            self.current_counts = {}
+            self.frame_start = self.last = time.perf_counter_ns()
+
+    def _mark(self, phase):
+        now = time.perf_counter_ns()
+        current = self.current
+        if current is not None:
+            if phase not in self.phases:
+                self.phases[phase] = None
+            current[phase] = current.get(phase, 0) + now - self.last
+        self.last = now
+
+    def _count(self, counter, n=1):
+        counts = self.current_counts
+        if counts is not None:
+            if counter not in self.counters:
+                self.counters[counter] = None
+            counts[counter] = counts.get(counter, 0) + n
+
+    def end_frame(self):
+        if self.current is None:
+            return
+        self.samples.append((time.perf_counter_ns() - self.frame_start, self.current, self.current_counts))
+        self.current = self.current_counts = None
+
+    def clear(self):
+        self.samples.clear()
+        self.phases.clear()
+        self.counters.clear()
+
+    # --- Analysis ---
+    def averages(self, frames=WINDOW):
+        """(mean frame ms, {phase: mean ms}) over the last `frames` frames."""
+        recent = list(self.samples)[-frames:]
+        if not recent:
+            return 0.0, {}
+        count = len(recent)
+        totals = dict.fromkeys(self.phases, 0)
+        for _, phases, _ in recent:
+            for phase, ns in phases.items():
+                totals[phase] += ns
+        frame_ms = sum(sample[0] for sample in recent) / count / 1e6
+        return frame_ms, {phase: ns / count / 1e6 for phase, ns in totals.items()}
+
+    def count_averages(self, frames=WINDOW):
+        """{counter: mean per frame} over the last `frames` frames."""
+        recent = list(self.samples)[-frames:]
+        totals = dict.fromkeys(self.counters, 0)
+        for _, _, counts in recent:
+            for counter, n in counts.items():
+                totals[counter] += n
+        return {counter: n / len(recent) for counter, n in totals.items()} if recent else {}
+
+    def dump_csv(self, path=None):
+        """Write every collected frame (ms per phase) to CSV; returns the path."""
+        path = path or time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        phases = list(self.phases)
+        counters = list(self.counters)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms"] + phases + counters)
+            for frame, (total, sample, counts) in enumerate(self.samples):
+                writer.writerow([frame, f"{total / 1e6:.4f}"] +
+                                [f"{sample.get(phase, 0) / 1e6:.4f}" for phase in phases] +
+                                [counts.get(counter, 0) for counter in counters])
+        return path
+
+    # --- Overlay ---
+    def render(self):
+        """Rebuild the panel: averages per phase plus a graph of recent frame times."""
+        if self.font is None:
+            self.font = get_font(None, 20)
+        font = self.font
+        frame_ms, phases = self.averages()
+        counts = self.count_averages()
+        line_height = 16
+        width = 2 * WINDOW + 20
+        notes = self.notes
+        height = 30 + line_height * (len(notes) + len(phases) + len(counts)) + GRAPH_HEIGHT + 10
+        if self.layer is None or self.layer.get_height() != height:
+            self.layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        layer = self.layer
+        layer.fill((0, 0, 0, 190))
+
+        # Numbers change every refresh, so they bypass the shared text cache
+        color = (255, 90, 90) if frame_ms > BUDGET_MS else (120, 255, 120)
+        layer.blit(font.render(f"frame {frame_ms:6.2f} ms  (budget {BUDGET_MS:.1f})", True, color), (10, 8))
+        y = 30
+        for name, text in notes.items():
+            layer.blit(font.render(f"{name:<14}{text}", True, (255, 230, 120)), (10, y))
+            y += line_height
+        for phase, ms in phases.items():
+            bar = min(int(ms / BUDGET_MS * 90), 90)
+            layer.fill((90, 160, 255), (width - 100, y + 3, bar, line_height - 6))
+            layer.blit(font.render(f"{phase:<14}{ms:6.2f}", True, (230, 230, 230)), (10, y))
+            y += line_height
+        for counter, n in counts.items():
+            layer.blit(font.render(f"{counter:<14}{n:6.1f} /frame", True, (180, 200, 255)), (10, y))
+            y += line_height
+
+        # Rolling graph: one 2px column per frame, budget line across the middle
+        graph_top = y + 5
+        scale = GRAPH_HEIGHT / (2 * BUDGET_MS)
+        recent = list(self.samples)[-WINDOW:]
+        for i, (total, _, _) in enumerate(recent):
+            ms = total / 1e6
+            bar = min(int(ms * scale), GRAPH_HEIGHT)
+            color = (255, 90, 90) if ms > BUDGET_MS else (120, 255, 120)
+            layer.fill(color, (10 + 2 * i, graph_top + GRAPH_HEIGHT - bar, 2, bar))
+        budget_y = graph_top + GRAPH_HEIGHT - int(BUDGET_MS * scale)
+        pygame.draw.line(layer, (255, 255, 0), (10, budget_y), (width - 10, budget_y))
+
+    def draw(self, screen):
+        """Blit the overlay (re-rendered every REFRESH frames); returns its rect or None."""
+        if not self.enabled:
+            return None
+        self.frames_since_render += 1
+        if self.frames_since_render >= REFRESH:
+            self.frames_since_render = 0
+            self.render()
+        rect = screen.blit(self.layer, PANEL_POS)
+        self.mark("profiler")
+        return rect
+
+
+profiler = FrameProfiler()
+
+
+def toggle_profiler():
+    return profiler.toggle()
@@ -0,0 +1,62 @@
+from collections import deque
+from utils.profiler import profiler
+
+# --- Adaptive quality governor ---
+# The scene stack reports how long each frame's work took (without the time
+# spent waiting for the frame cap). When the rolling average goes over
+# budget, decoration is shed one level at a time. Once it is back well under
+# budget, one level at a time comes back. After every change the window starts
+# over, so one level gets a full window to settle before the next decision.
+# Only drawing and effects read these settings. Enemies, bullets, bosses and
+# the simulation clock never do, so gameplay (and replays) stay the same at
+# every level.
+BUDGET_MS = 1000 / 60   # one frame at utils.scenes.FPS
+WINDOW = 60             # frames averaged per decision
+SHED_ABOVE = 1.0        # shed a level when the average is over this share of the budget
+RESTORE_BELOW = 0.6     # restore one when it is under this share (the gap is the hysteresis)
+
+# Level -> settings, from full quality to the cheapest
+LEVELS = [
+    {"star_fraction": 1.0, "explosion_step": 1, "particle_cap": None, "still_background": False},
+    {"star_fraction": 0.5, "explosion_step": 1, "particle_cap": None, "still_background": False},
+    {"star_fraction": 0.5, "explosion_step": 2, "particle_cap": None, "still_background": False},
+    {"star_fraction": 0.25, "explosion_step": 2, "particle_cap": 1500, "still_background": False},
+    {"star_fraction": 0.25, "explosion_step": 3, "particle_cap": 400, "still_background": True},
+]
+
+
+class QualityGovernor:
+    """Picks a LEVELS entry from recent frame times; decorative systems read its attributes."""
+    def __init__(self):
+        self.enabled = True
+        self.frame_ms = deque(maxlen=WINDOW)
+        self.set_level(0)
+
+    def set_level(self, level):
+        self.level = level
+        settings = LEVELS[level]
+        self.star_fraction = settings["star_fraction"]        # share of the starfield drawn
+        self.explosion_step = settings["explosion_step"]      # explosion animation frames advanced per step
+        self.particle_cap = settings["particle_cap"]          # live particles allowed (None = store capacity)
+        self.still_background = settings["still_background"]  # stop repainting scrolling backgrounds
+        self.frame_ms.clear()
+        profiler.notes["quality"] = f"{level} / {len(LEVELS) - 1}"
+
+    def observe(self, ms):
+        """Record one frame's work time and shed or restore a level if the window says so."""
+        if not self.enabled:
+            return
+        window = self.frame_ms
+        window.append(ms)
+        if len(window) < WINDOW:
+            return
+        average = sum(window) / WINDOW
+        if average > BUDGET_MS * SHED_ABOVE and self.level < len(LEVELS) - 1:
+            self.set_level(self.level + 1)
+            print(f"Quality lowered to level {self.level} ({average:.1f} ms/frame)")
+        elif average < BUDGET_MS * RESTORE_BELOW and self.level > 0:
+            self.set_level(self.level - 1)
+            print(f"Quality raised to level {self.level} ({average:.1f} ms/frame)")
+
+
+governor = QualityGovernor()
@@ -0,0 +1,81 @@
+import pygame
+
+# --- Per-scene presentation mode ---
+# "full":  flip the whole screen every frame (scrolling backgrounds touch every pixel)
+# "dirty": push only what was drawn this frame plus what was drawn last frame
+#          (so the old positions get cleaned up). Static overlays draw once,
+#          get one full update, and then push nothing until they change.
+SCENE_RENDER_MODES = {
+    "menu": "full",
+    "level_1": "full",
+    "level_2": "dirty",
+    "level_3": "full",
+    "pause": "dirty",
+    "options": "full",
+    "credits": "full",
+    "prompt": "dirty",
+    "game_over": "dirty",
+}
+
+
+class DirtyRenderer:
+    """Collects the rects drawn each frame and pushes only those to the display."""
+    def __init__(self, mode="full"):
+        self.mode = mode
+        self.rects = []
+        self.prev_rects = []
+        self.full_update = True
+
+        self.pixels_last = 0  # pushed by the last present(); shown in the F3 overlay
+
+    def set_scene(self, scene):
+        self.set_mode(SCENE_RENDER_MODES.get(scene, "full"))
+
+    def set_mode(self, mode):
+        self.mode = mode
+        self.invalidate()
+
+    def invalidate(self):
+        """Repaint and push the whole screen next frame (overlay closed, scene switch)."""
+        self.full_update = True
+
+    def add(self, rects):
+        """Record what a draw call touched: a Rect, a list of Rects, or None."""
+        if self.mode != "dirty" or rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self.rects.append(rects)
+        else:
+            self.rects.extend(r for r in rects if r)
+
+    def restore(self, screen, background):
+        """Paint the background, but only under last frame's rects in dirty mode."""
+        if self.mode == "dirty" and not self.full_update:
+            for rect in self.prev_rects:
+                screen.blit(background, rect, rect)
+        else:
+            screen.blit(background, (0, 0))
+
+    def present(self):
+        screen = pygame.display.get_surface()
+        screen_rect = screen.get_rect()
+
+        if self.mode != "dirty" or self.full_update:
+            pygame.display.flip()
+            pixels = screen_rect.width * screen_rect.height
+        else:
+            dirty = [r.clip(screen_rect) for r in self.prev_rects + self.rects]
+            dirty = [r for r in dirty if r.width and r.height]
+            if dirty:
+                pygame.display.update(dirty)
+            # Overlapping rects are counted twice: an upper bound on pixels pushed
+            pixels = sum(r.width * r.height for r in dirty)
+
+        self.prev_rects = self.rects
+        self.rects = []
+        self.full_update = False
+
+        self.pixels_last = pixels
+
+
+renderer = DirtyRenderer()
@@ -0,0 +1,187 @@
+import sys
+import time
+import pygame
+from utils import assets, text
+from utils.profiler import profiler
+from utils.quality import governor
+from utils.render import renderer
+from utils.timers import timers
+
+# Render cap. It equals utils.timestep.TICK_RATE, so most frames run exactly
+# one step and draw with alpha near 0; interpolation only smooths frames that
+# arrive early or late (jitter, catch-up after a stall).
+FPS = 60
+
+
+class Scene:
+    """
+    One screen of the game (menu, level, pause, prompt...), run by a SceneStack.
+    Only the top scene gets handle_event() and update(); draw() renders it and
+    returns the rects it touched. `underlay` says what shows beneath it:
+    None (opaque), "live" (the scene below is redrawn, frozen in time, every
+    frame) or "snapshot" (drawn once when this scene first draws, kept in
+    self.backdrop).
+    """
+    underlay = None
+    render_scene = None  # utils.render scene name applied while this scene is on top
+
+    def __init__(self):
+        self.stack = None
+        self.on_close = None
+        self.backdrop = None
+
+    # --- Lifecycle ---
+    def enter(self):
+        """Pushed onto the stack."""
+
+    def resume(self):
+        """Back on top after the scene above it closed."""
+
+    def exit(self):
+        """Removed from the stack."""
+
+    def close(self, result=None):
+        self.stack.pop(self, result)
+
+    # --- Per frame ---
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        return None
+
+
+class SceneStack:
+    """
+    The game's only loop. Each frame it paces to FPS, drains the event queue
+    into the top scene, updates it, draws it (over whatever its underlay
+    shows) and presents, with profiler marks around each part. The time that
+    work took (not the wait for the cap) feeds the quality governor.
+    """
+    def __init__(self, fps=FPS):
+        self.scenes = []
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.last_totals = {}
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def below(self, scene):
+        index = self.scenes.index(scene)
+        return self.scenes[index - 1] if index > 0 else None
+
+    def push(self, scene, on_close=None):
+        """Open `scene` on top; on_close(result) is called when it closes."""
+        scene.stack = self
+        scene.on_close = on_close
+        self.scenes.append(scene)
+        self.apply_render_scene(scene)
+        scene.enter()
+
+    def pop(self, scene=None, result=None):
+        scene = scene or self.top
+        self.scenes.remove(scene)
+        scene.exit()
+        if self.top is not None:
+            self.apply_render_scene(self.top)
+            self.top.resume()
+        if scene.on_close is not None:
+            scene.on_close(result)
+
+    def replace(self, scene):
+        """Close every open scene (without callbacks) and start over with `scene`."""
+        while self.scenes:
+            self.scenes.pop().exit()
+        self.push(scene)
+
+    def apply_render_scene(self, scene):
+        if scene.render_scene:
+            renderer.set_scene(scene.render_scene)
+        else:
+            renderer.invalidate()
+
+    # --- Frame scheduler ---
+    def run(self):
+        while self.scenes:
+            self.frame()
+
+    def frame(self):
+        self.clock.tick(self.fps)
+        start = time.perf_counter()
+        profiler.begin_frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if self.scenes:
+                self.top.handle_event(event)  # a scene opened mid-queue gets the rest
+        profiler.mark("events")
+
+        if self.scenes:
+            self.top.update()
+        if not self.scenes:
+            return
+        screen = pygame.display.get_surface()
+        self.draw(self.top, screen)
+        renderer.add(profiler.draw(screen))
+        renderer.present()
+        profiler.count("kpx pushed", renderer.pixels_last / 1000)
+        profiler.notes["render"] = renderer.mode
+        self.count_cache_work()
+        profiler.mark("flip")
+        profiler.end_frame()
+        governor.observe((time.perf_counter() - start) * 1000)
+
+    def count_cache_work(self):
+        """Profiler counters: assets read from disk, text rendered and timers fired this frame."""
+        if not profiler.enabled:
+            self.last_totals = {}
+            return
+        totals = {"disk loads": assets.get_stats()["misses"], "text renders": text.get_stats()["misses"],
+                  "timers fired": timers.fired}
+        for name, total in totals.items():
+            profiler.count(name, total - self.last_totals.get(name, total))
+        self.last_totals = totals
+
+    def draw(self, scene, screen):
+        below = self.below(scene)
+        if below is not None:
+            if scene.underlay == "live":
+                self.draw(below, screen)
+            elif scene.underlay == "snapshot" and scene.backdrop is None:
+                self.draw(below, screen)
+                scene.backdrop = screen.copy()
+        renderer.add(scene.draw(screen))
+
+
+# --- Shared scenes ---
+class Fade(Scene):
+    """Fade the scene below to black (or in from black); closes itself when done."""
+    underlay = "live"
+
+    def __init__(self, duration=800, fade_in=False):
+        super().__init__()
+        self.duration = duration
+        self.fade_in = fade_in
+        self.overlay = None
+        self.start = 0
+
+    def enter(self):
+        self.overlay = pygame.Surface(pygame.display.get_surface().get_size())
+        self.overlay.fill((0, 0, 0))
+        self.start = pygame.time.get_ticks()
+        renderer.set_mode("full")  # the whole screen changes every frame
+
+    def update(self):
+        if pygame.time.get_ticks() - self.start >= self.duration:
+            self.close()
+
+    def draw(self, screen):
+        t = min((pygame.time.get_ticks() - self.start) / self.duration, 1.0)
+        self.overlay.set_alpha(int(255 * (1 - t if self.fade_in else t)))
+        return screen.blit(self.overlay, (0, 0))
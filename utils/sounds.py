@@ -1,10 +1,112 @@
 import pygame
+from utils.assets import load_sound
 pygame.mixer.init()
 
+# --- Sound bank ---
+# name: (path, volume, channel group). Every entry is decoded once through the
+# asset cache and played on a channel reserved for its group, so a burst of
+# bug shots can only ever reuse enemy channels and never cuts off the UI or boss.
+SOUNDS = {
+    "correct": ("assets/sounds/correct.mp3", None, "ui"),
+    "incorrect": ("assets/sounds/incorrect.mp3", None, "ui"),
+    "select": ("assets/sounds/select_sfx.mp3", 0.5, "ui"),
+    "player_shoot": ("assets/sounds/player_shoot_1.mp3", None, "player"),
+    "bug_shoot": ("assets/sounds/player_shoot_1.mp3", 0.2, "enemy"),
+    "level_1_boss_shoot": ("assets/sounds/player_shoot_1.mp3", None, "boss"),
+    "level_2_boss_shoot": ("assets/sounds/player_shoot_1.mp3", 0.4, "boss"),
+    "level_1_boss_passive": ("assets/sounds/boss_sfx/level_1_boss/level_1_boss_passive.mp3", 0.4, "boss_loop"),
+    "level_2_boss_passive": ("assets/sounds/boss_sfx/level_2_boss/level_2_boss_passive.mp3", 0.4, "boss_loop"),
+}
+
+# Number of mixer channels reserved for each group
+CHANNEL_GROUPS = {
+    "ui": 2,
+    "player": 2,
+    "enemy": 4,
+    "boss": 2,
+    "boss_loop": 1,
+}
+
+_bank = {}
+_groups = {}
+_next_channel = {}
+
+
+def _init_channels():
+    """Reserve a fixed block of mixer channels per group (done once)."""
+    total = sum(CHANNEL_GROUPS.values())
+    # Keep 8 unreserved channels for anything still calling Sound.play() directly
+    pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 8))
+    pygame.mixer.set_reserved(total)
+
+    index = 0
+    for group, count in CHANNEL_GROUPS.items():
+        _groups[group] = [pygame.mixer.Channel(index + i) for i in range(count)]
+        _next_channel[group] = 0
+        index += count
+
+
+def get_sound(name):
+    """Return the decoded Sound for a bank entry, or None if it failed to load."""
+    if name not in _bank:
+        path, volume, _ = SOUNDS[name]
+        try:
+            _bank[name] = load_sound(path, volume)
+        except Exception as e:
+            print(f"[WARNING] Could not load sound '{name}': {e}")
+            _bank[name] = None
+    return _bank[name]
+
+
+def preload():
+    """Decode every sound in the bank up front so nothing decodes mid-game."""
+    if not _groups:
+        _init_channels()
+    for name in SOUNDS:
+        get_sound(name)
+
+
+def play(name, loops=0):
+    """Play a bank sound on its group's channels. Returns the Channel used."""
+    sound = get_sound(name)
+    if sound is None:
+        return None
+    if not _groups:
+        _init_channels()
+
+    group = SOUNDS[name][2]
+    channels = _groups[group]
+    for channel in channels:
+        if not channel.get_busy():
+            break
+    else:
+        # All busy: take over this group's channels in turn (never another group's)
+        i = _next_channel[group]
+        channel = channels[i]
+        _next_channel[group] = (i + 1) % len(channels)
+
+    channel.play(sound, loops=loops)
+    return channel
+
+
+def stop_group(group):
+    for channel in _groups.get(group, ()):
+        channel.stop()
+
+
+def pause_group(group):
+    for channel in _groups.get(group, ()):
+        channel.pause()
+
+
+def resume_group(group):
+    for channel in _groups.get(group, ()):
+        channel.unpause()
+
+
 def play_correct():
-    sound = pygame.mixer.Sound("assets/sounds/correct.mp3")
-    sound.play()
+    play("correct")
+
 
 def play_incorrect():
-    sound = pygame.mixer.Sound("assets/sounds/incorrect.mp3")
-    sound.play()
+    play("incorrect")
@@ -1,5 +1,20 @@
 import pygame
 import random
+from utils.quality import governor
+
+try:
+    import numpy as np
+except ImportError:  # the starfield falls back to plain lists
+    np = None
+
+# --- Starfield settings ---
+# Up to LAYER_THRESHOLD stars are drawn as individual sprites with one blits()
+# call. Above that, stars are baked into a few parallax layers that scroll as
+# whole surfaces, so the cost no longer grows with the number of stars.
+LAYER_THRESHOLD = 1000
+PARALLAX_LAYERS = 4
+STAR_COLOR = (255, 255, 255)
+
 
 class Star:
     def __init__(self):
@@ -15,4 +30,114 @@ class Star:
             self.x = random.randint(0, 800)
 
     def draw(self, screen):
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.radius)
+        return pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.radius)
+
+
+def make_star_sprite(radius):
+    """Pre-rendered star, identical to pygame.draw.circle(..., radius) on the screen."""
+    size = radius * 2 + 1
+    sprite = pygame.Surface((size, size))
+    sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    pygame.draw.circle(sprite, STAR_COLOR, (radius, radius), radius)
+    return sprite
+
+
+class Starfield:
+    """
+    All of a level's stars in flat arrays: one vectorized update and one blits()
+    per frame. Replaces the old `[Star() for _ in range(100)]` lists.
+    """
+    def __init__(self, count=100, width=800, height=600):
+        self.count = count
+        self.width, self.height = width, height
+        self.sprites = {1: make_star_sprite(1), 2: make_star_sprite(2)}
+
+        # Seeded from `random` so random.seed() still controls the whole level
+        if np is not None:
+            self.rng = np.random.default_rng(random.getrandbits(32))
+            self.x = self.rng.integers(0, width + 1, count).astype(float)
+            self.y = self.rng.integers(0, height + 1, count).astype(float)
+            self.speed = self.rng.uniform(0.5, 2, count)
+            radii = self.rng.integers(1, 3, count)
+        else:
+            self.x = [float(random.randint(0, width)) for _ in range(count)]
+            self.y = [float(random.randint(0, height)) for _ in range(count)]
+            self.speed = [random.uniform(0.5, 2) for _ in range(count)]
+            radii = [random.randint(1, 2) for _ in range(count)]
+
+        self.radii = [int(r) for r in radii]
+        self.offsets = np.asarray(self.radii) if np is not None else self.radii
+        self.star_sprites = [self.sprites[r] for r in self.radii]
+
+        self.layers = None
+        if count > LAYER_THRESHOLD:
+            self.build_layers()
+
+    # --- Parallax layers (large star counts) ---
+    def build_layers(self):
+        """Bake the stars into PARALLAX_LAYERS screen-sized strips, grouped by speed."""
+        speeds = list(self.speed)
+        order = sorted(range(self.count), key=speeds.__getitem__)
+        per_layer = -(-self.count // PARALLAX_LAYERS)
+
+        self.layers = []
+        for start in range(0, self.count, per_layer):
+            group = order[start:start + per_layer]
+            strip = pygame.Surface((self.width, self.height))
+            strip.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            strip.blits([(self.star_sprites[i], (int(self.x[i]) - self.radii[i], int(self.y[i]) - self.radii[i]))
+                         for i in group], doreturn=0)
+            speed = sum(speeds[i] for i in group) / len(group)
+            self.layers.append([strip, speed, 0.0])
+
+    # --- Update ---
+    def update(self):
+        if self.layers is not None:
+            for layer in self.layers:
+                layer[2] = (layer[2] + layer[1]) % self.height
+            return
+
+        if np is not None:
+            self.y += self.speed
+            wrapped = self.y > self.height
+            n = int(np.count_nonzero(wrapped))
+            if n:
+                self.y[wrapped] = 0
+                self.x[wrapped] = self.rng.integers(0, self.width + 1, n)
+            return
+
+        x, y, speed = self.x, self.y, self.speed
+        for i in range(self.count):
+            y[i] += speed[i]
+            if y[i] > self.height:
+                y[i] = 0.0
+                x[i] = float(random.randint(0, self.width))
+
+    # --- Draw ---
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every star; returns the screen areas touched.
+        alpha < 1 draws the field that far between its previous and current step.
+        Under load the quality governor has only the first share of the stars
+        drawn; every star keeps moving either way.
+        """
+        back = 1.0 - alpha
+        fraction = governor.star_fraction
+        if self.layers is not None:
+            layers = self.layers if fraction >= 1 else self.layers[:max(1, int(len(self.layers) * fraction))]
+            for strip, speed, offset in layers:
+                y = int((offset - speed * back) % self.height)
+                screen.blit(strip, (0, y))
+                screen.blit(strip, (0, y - self.height))
+            return screen.get_rect()
+
+        n = self.count if fraction >= 1 else int(self.count * fraction)
+        if np is not None:
+            # Same truncation as int(x) in the old Star.draw, shifted to the sprite corner
+            y = self.y[:n] - self.speed[:n] * back if back > 0 else self.y[:n]
+            xs = (self.x[:n].astype(np.intp) - self.offsets[:n]).tolist()
+            ys = (y.astype(np.intp) - self.offsets[:n]).tolist()
+        else:
+            xs = [int(x) - r for x, r in zip(self.x[:n], self.radii)]
+            ys = [int(y - s * back) - r for y, s, r in zip(self.y[:n], self.speed, self.radii)]
+        return screen.blits(zip(self.star_sprites, zip(xs, ys)))  # zip stops at the n drawn
@@ -0,0 +1,65 @@
+import pygame
+from collections import OrderedDict
+
+# --- Font registry + rendered text cache ---
+# Fonts are opened once per (path, size). Rendered text Surfaces are kept in an
+# LRU keyed by (font, text, color, antialias) and bounded by their pixel memory,
+# so menus and HUDs can "render" the same strings every frame for free.
+MAX_TEXT_BYTES = 4 * 1024 * 1024
+
+_fonts = {}
+_rendered = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+
+def get_font(path, size):
+    """Return the shared Font for (path, size). path=None is pygame's default font."""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """Cached font.render(). The returned Surface is shared: do not draw on it."""
+    key = (font, text, tuple(color), antialias)
+    surface = _rendered.get(key)
+    if surface is not None:
+        _stats["hits"] += 1
+        _rendered.move_to_end(key)
+        return surface
+
+    _stats["misses"] += 1
+    surface = font.render(text, antialias, color)
+    _rendered[key] = surface
+    _stats["bytes"] += surface.get_pitch() * surface.get_height()
+
+    # Evict least recently used entries (always keep the one just rendered)
+    while _stats["bytes"] > MAX_TEXT_BYTES and len(_rendered) > 1:
+        _, old = _rendered.popitem(last=False)
+        _stats["bytes"] -= old.get_pitch() * old.get_height()
+        _stats["evictions"] += 1
+    return surface
+
+
+def get_stats():
+    """Debug info: hit rate and memory use of the text cache."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        "fonts": len(_fonts),
+        "entries": len(_rendered),
+        "bytes": _stats["bytes"],
+        "max_bytes": MAX_TEXT_BYTES,
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "evictions": _stats["evictions"],
+        "hit_rate": _stats["hits"] / lookups if lookups else 0.0,
+    }
+
+
+def clear():
+    """Drop every rendered Surface (fonts stay registered)."""
+    _rendered.clear()
+    _stats["bytes"] = 0
@@ -0,0 +1,53 @@
+import heapq
+from utils.timestep import sim_ticks
+
+# --- Simulation timers ---
+# Cooldowns and timed behaviour are scheduled here instead of every entity
+# comparing the clock against its own fields each tick. World.step() calls
+# run_due() once per tick, so a tick costs one heap peek plus the timers that
+# actually expire. The clock is simulation time: while a question, menu or
+# prompt freezes the world, every timer is frozen with it.
+
+
+class TimerQueue:
+    """Min-heap of [deadline, order, callback, args] on the simulation clock."""
+    def __init__(self):
+        self.heap = []
+        self.order = 0  # timers due on the same tick fire in the order they were scheduled
+        self.fired = 0
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) once `delay` ms of simulation time have passed. Returns a handle for cancel()."""
+        return self.schedule_at(sim_ticks() + delay, callback, *args)
+
+    def schedule_at(self, deadline, callback, *args):
+        timer = [deadline, self.order, callback, args]
+        self.order += 1
+        heapq.heappush(self.heap, timer)
+        return timer
+
+    def cancel(self, timer):
+        """Stop a pending timer (it is dropped from the heap when it comes due)."""
+        if timer is not None:
+            timer[2] = None
+
+    def run_due(self, now=None):
+        """Fire every timer whose deadline has passed. Timers they schedule wait for a later tick."""
+        now = sim_ticks() if now is None else now
+        heap = self.heap
+        due = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap))
+        for _, _, callback, args in due:
+            if callback is not None:
+                callback(*args)
+                self.fired += 1
+
+    def clear(self):
+        self.heap.clear()
+
+    def __len__(self):
+        return len(self.heap)
+
+
+timers = TimerQueue()
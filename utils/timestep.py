@@ -0,0 +1,67 @@
+import pygame
+
+# --- Simulation rate ---
+# The game world always advances in steps of 1/TICK_RATE s, however fast or
+# slow frames are rendered. The rate is fixed at 60 Hz: per-step quantities
+# (speeds, bullet velocities, the Level 3 laser's step-counted timers) are
+# tuned for it, and only at that rate do they agree with the millisecond
+# cooldowns read from sim_ticks(). Changing TICK_RATE would mean rescaling
+# all of them.
+TICK_RATE = 60
+STEP_MS = 1000.0 / TICK_RATE
+MAX_STEPS_PER_FRAME = 5  # after a long stall, drop time instead of spiralling
+
+
+class FixedTimestep:
+    """
+    Accumulator for a fixed-rate simulation. Each rendered frame calls
+    advance() and runs that many step()s; alpha is how far the rendered
+    frame sits between the last step and the next one (for interpolation).
+    """
+    def __init__(self, max_steps=MAX_STEPS_PER_FRAME):
+        self.max_steps = max_steps
+        self.step_ms = STEP_MS
+        self.accumulator = 0.0
+        self.time = 0.0  # simulation time in ms
+        self.steps = 0
+        self.last = None
+
+    def reset(self):
+        """Forget real time that passed while the world was frozen (questions, menus, prompts)."""
+        self.accumulator = 0.0
+        self.last = None
+
+    def advance(self, frame_ms=None):
+        """
+        Add the real time since the last call (or `frame_ms`, for headless
+        runs) and return how many fixed steps to simulate this frame.
+        """
+        if frame_ms is None:
+            now = pygame.time.get_ticks()
+            frame_ms = self.step_ms if self.last is None else now - self.last
+            self.last = now
+        self.accumulator = min(self.accumulator + frame_ms, self.step_ms * self.max_steps)
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    def step(self):
+        """Mark one simulation step as taken (call before updating the world)."""
+        self.steps += 1
+        self.time += self.step_ms
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_ms
+
+    def ticks(self):
+        return int(self.time)
+
+
+# --- The game's simulation clock ---
+timestep = FixedTimestep()
+
+
+def sim_ticks():
+    """Simulation time in ms; use instead of pygame.time.get_ticks() for gameplay timers."""
+    return int(timestep.time)